@@ -4,6 +4,8 @@ Main module for generating Zettelkasten Unique Identifiers (zUIDs).
 This class should be used for all Zettelkasten operations. It allows:
 
 -   Create a Zettelkasten Unique Identifier (zUID) from the current date and time.
+-   Allocate the next free Zettelkasten Unique Identifier (zUID) at or after the current date and time, from several threads
+    (or several processes sharing a SQLite database).
 -   Creating a Zettelkasten Unique Identifier (zUID) from an integer, string or datetime object.
 -   Decomposing a Zettelkasten Unique Identifier (zUID) into its components (year, month, day, hour, minute).
 -   Validating a Zettelkasten Unique Identifier (zUID) by checking if it is well-formed.
@@ -15,20 +17,69 @@ This class should be used for all Zettelkasten operations. It allows:
 @date           2025-02-14
 """
 
-#   Zettelkasten Unique Identifier (zUID) class
-from data.ZettelkastenUniqueIdentifier  import zUID;
+#   Zettelkasten Unique Identifier (zUID) class and the index of issued zUIDs
+from .data.ZettelkastenUniqueIdentifier  import zUID;
+from .data.ZettelkastenIndex             import ZettelkastenIndex, HistoryView;
+from .data.ZettelkastenArray             import ZUIDArray;
+from .data.ZettelkastenFormat            import ZettelkastenFormat, MINUTE;
 
 #   Engine: validator, decomposer and builder
-from engine.ZettelkastenValidator       import ZettelkastenValidator as validator;
-from engine.ZettelkastenDecomposer      import ZettelkastenDecomposer as decomposer;
-from engine.ZettelkastenBuilder         import ZettelkastenBuilder as builder;
+from .engine.ZettelkastenValidator       import ZettelkastenValidator as validator, MIN_ID, MAX_ID, ERROR_MALFORMED;
+from .engine.ZettelkastenDecomposer      import ZettelkastenDecomposer as decomposer;
+from .engine.ZettelkastenBuilder         import ZettelkastenBuilder as builder;
 
-#   Services: sequencer
-from services.ZettelkastenSequencer     import ZettelkastenSequencer as sequencer;
+#   Services: sequencer and clock
+from .services.ZettelkastenSequencer     import ZettelkastenSequencer as sequencer;
+from .services.ZettelkastenClock         import ZettelkastenClock;
 
 
-from typing import List, Tuple, TypeVar, Any;
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Any, TYPE_CHECKING;
+from array import array;
 from datetime import datetime;
+from itertools import islice;
+from threading import Lock;
+
+#   The file and SQLite indexes, the cache and the occupancy are imported (under short aliases) by the methods using them,
+#   so that importing the generator does not load `mmap`, `sqlite3` and the other services; these names are for annotations
+if TYPE_CHECKING:
+    from .data.ZettelkastenFileIndex     import ZettelkastenFileIndex;
+    from .data.ZettelkastenSQLiteIndex   import ZettelkastenSQLiteIndex;
+    from .engine.ZettelkastenCache       import ZettelkastenCache;
+    from .services.ZettelkastenOccupancy import ZettelkastenOccupancy;
+
+
+#   Number of inputs `create_many` builds and inserts at a time
+CHUNK_SIZE : int = 4096;
+
+
+class CreateResult(NamedTuple):
+    """
+    The outcome of `ZettelkastenGenerator.create_many`, by position in the input.
+
+    `created` holds the created zUIDs in input order, `duplicates` the positions of the inputs that were already
+    created (before the call or earlier in it), and `invalid` the `ERROR_*` code (see `find_error_code`) of each
+    invalid input by position; `rejected` keeps those inputs as the integers they were normalized to (as they were
+    given if they could not be normalized), so that `messages(position)` returns their `find_error` messages.
+    """
+    created     : ZUIDArray;
+    duplicates  : array;
+    invalid     : Dict[int, int];
+    rejected    : Dict[int, Any];
+    strict      : bool;
+
+    @property
+    def count(self) -> int:
+        """
+        The number of inputs processed.
+        """
+        return len(self.created) + len(self.duplicates) + len(self.invalid);
+
+
+    def messages(self, position: int) -> List[str]:
+        """
+        Returns the `find_error` messages of the invalid input at the given position.
+        """
+        return validator.find_error(self.rejected[position], self.strict);
 
 
 class ZettelkastenGenerator:
@@ -47,27 +98,123 @@ class ZettelkastenGenerator:
     @since          1.1
     @date           2025-02-14
     """    
-    __slots__ = ('current', 'history', 'identifiers');
+    __slots__ = ('current', 'identifiers', 'allocating', 'strict', 'cache', 'format', 'clock', '_lock', '_run');
     
-    def __init__(self):
+    def __init__(self, compact: bool = False, allocating: bool = False, strict: bool = False, cache_size: int = 0, index_path: str | None = None,
+                 database_path: str | None = None, format: ZettelkastenFormat = MINUTE, clock: ZettelkastenClock | None = None):
         """
         Constructor for the `ZettelkastenGenerator` class.
+        
+        Parameters
+        ----------
+        compact : bool
+            If `True`, `identifiers` and `history` are stored as integers in a `ZUIDArray`
+            instead of a list of `zUID` objects.
+        allocating : bool
+            If `True`, `now()` allocates the next free zUID (see `allocate`) instead of
+            returning `None` when the current minute is already taken.
+        strict : bool
+            If `True`, `create` and `validate` reject days that do not exist in their month (e.g. 202502310000).
+        cache_size : int
+            If positive, `create`, `allocate` and `validate` go through a `ZettelkastenCache`
+            holding up to this many builds and validations.
+        index_path : str | None
+            If given, `identifiers` is the persistent `ZettelkastenFileIndex` at this path (created if needed),
+            so zUIDs created by previous runs are known at startup; `history` then holds the zUIDs of this run only.
+        database_path : str | None
+            If given, `identifiers` is the `ZettelkastenSQLiteIndex` at this path (created if needed), which the generators
+            of several processes can share; `create` and `allocate` then never hand out a zUID taken by another process.
+        format : ZettelkastenFormat
+            The resolution of the zUIDs created from datetime objects and by the default clock (`now`, `allocate`), and the number of digits
+            short strings are padded to: `SECOND` or `MILLISECOND` allow more than one zUID per minute.
+            zUIDs of every format can be created from integers and strings of their length.
+        clock : ZettelkastenClock | None
+            The clock read by `now` and `allocate`; if `None`, a monotonic clock in the local time of the system and
+            in `format`. Give a `ZettelkastenClock(UTC, format)` to be immune to DST, or one with an injected `source` in tests.
         """
         self.current        : zUID = None;
-        self.history        : List[zUID] = list();
-        self.identifiers    : List[zUID] = list();
+        if database_path is not None:
+            from .data.ZettelkastenSQLiteIndex import ZettelkastenSQLiteIndex as SQLiteIndex;
+            self.identifiers : "ZettelkastenIndex | ZettelkastenFileIndex | ZettelkastenSQLiteIndex" = SQLiteIndex(database_path);
+        elif index_path is not None:
+            from .data.ZettelkastenFileIndex import ZettelkastenFileIndex as FileIndex;
+            self.identifiers = FileIndex(index_path);
+        else:
+            self.identifiers = ZettelkastenIndex(compact=compact);
+        self.allocating     : bool = allocating;
+        self.strict         : bool = strict;
+        self.format         : ZettelkastenFormat = format;
+        self.clock          : ZettelkastenClock = clock if clock is not None else ZettelkastenClock(None, format);
+        self.cache          : "ZettelkastenCache | None" = None;
+        if cache_size > 0:
+            from .engine.ZettelkastenCache import ZettelkastenCache as Cache;
+            self.cache = Cache(cache_size, strict);
+        
+        #   Guards `identifiers`; only membership checks and insertions run under it
+        self._lock          : Lock = Lock();
+        
+        #   Bounds `(first, last)` of the last run of consecutive taken zUIDs walked by `allocate`
+        self._run           : Tuple[zUID, zUID] | None = None;
+        
+    
+    @property
+    def history(self) -> "HistoryView | ZUIDArray":
+        """
+        The created zUIDs, in creation order, as a read-only view (a `ZUIDArray` copy for a SQLite index).
+        """
+        return self.identifiers.history;
         
     
     def now(self) -> zUID:
         """
-        Tries to create a Zettelkasten Unique Identifier (zUID) from the current date and time.
+        Tries to create a Zettelkasten Unique Identifier (zUID) from the current date and time (read from `clock`,
+        so never lower than the previous one). In allocating mode, returns the next free zUID at or after the current
+        date and time instead.
+        
+        Returns
+        -------
+        zUID | None
+            The created zUID, or `None` if the current one is already created (not in allocating mode).
+        """
+        if self.allocating:
+            return self.allocate();
+        return self._claim(zUID(self.clock.now()));
+    
+    def allocate(self, at: int | str | datetime | None = None) -> zUID:
+        """
+        Creates the first zUID not yet created at or after the given moment (default: now),
+        skipping the taken ones with `get_next`. Safe to call from several threads, and from several processes
+        sharing a database (the insertion of each candidate is what claims it). Only the claim of each candidate
+        (membership check and insertion) holds the lock, so other threads interleave with a long walk.
+        
+        Parameters
+        ----------
+        at : int | str | datetime | None
+            The moment to allocate from; the current date and time (read from `clock`) if `None`.
         
         Returns
         -------
         zUID
             The created zUID.
         """
-        return self.create(datetime.now());
+        #   Clock read and validation happen outside of the lock; the clock only returns well-formed zUIDs
+        start : zUID = zUID(self.clock.now()) if at is None else self._build(at);
+        
+        candidate   : zUID = start;
+        
+        #   Every zUID of the last walked run is taken: jump past it in one step
+        run         : Tuple[zUID, zUID] | None = self._run;
+        if run is not None and run[0] <= candidate <= run[1]:
+            start, candidate = run[0], sequencer.get_next(run[1]);
+        while True:
+            #   The membership check skips taken zUIDs cheaply; `add` claims the candidate atomically
+            #   (with a shared database, another process may have taken it since the check)
+            with self._lock:
+                if candidate not in self.identifiers and self.identifiers.add(candidate):
+                    self.current = candidate;
+                    self._run = (start, candidate);
+                    return candidate;
+            candidate = sequencer.get_next(candidate);
     
     def create(self, id: int | str | datetime) -> zUID | None:
         """
@@ -81,18 +228,134 @@ class ZettelkastenGenerator:
         Returns
         -------
         zUID | None
-            The created zUID or None if the given argument is not a valid zUID.
+            The created zUID, or `None` if the given argument is not a valid zUID or was already created
+            (`create_many` tells them apart).
         """
         try:
-            zuid : zUID = builder.build(id);
-            if zuid not in self.identifiers:
-                self.identifiers.append(zuid);
-                self.history.append(zuid);
+            zuid : zUID = self._build(id);
+        except Exception:
+            return None;
+        return self._claim(zuid);
+        
+    
+    def _claim(self, zuid: zUID) -> zUID | None:
+        """
+        Adds a built zUID to the identifiers; returns it, or `None` if it was already created.
+        """
+        with self._lock:
+            if self.identifiers.add(zuid):
                 self.current = zuid;
                 return zuid;
-            return None;
-        except Exception as e:
-            print(e);
+        return None;
+        
+    
+    def create_many(self, ids: Iterable[int | str | datetime], chunk_size: int = CHUNK_SIZE) -> CreateResult:
+        """
+        Creates Zettelkasten Unique Identifiers (zUIDs) from a stream of integers, strings or datetime objects, without
+        printing anything. The input is read `chunk_size` items at a time: the integers of a chunk are validated at once
+        (with `validate_many` when NumPy is installed), and each chunk is inserted in one batch under one lock acquisition
+        (one transaction with a database).
+        
+        Parameters
+        ----------
+        ids : Iterable[int | str | datetime]
+            The integers, strings or datetime objects to create the zUIDs from.
+        chunk_size : int
+            The number of inputs processed at a time.
+        
+        Returns
+        -------
+        CreateResult
+            The created zUIDs, the positions of the duplicates and the error codes of the invalid inputs.
+        """
+        result      : CreateResult = CreateResult(ZUIDArray(), array('q'), {}, {}, self.strict);
+        iterator    : Iterator[int | str | datetime] = iter(ids);
+        offset      : int = 0;
+        while chunk := list(islice(iterator, chunk_size)):
+            zuids, positions = self._build_chunk(chunk, offset, result);
+            with self._lock:
+                added : List[bool] = self.identifiers.add_many(zuids);
+                for zuid, position, ok in zip(zuids, positions, added):
+                    if ok:
+                        result.created.append(zuid.id);
+                    else:
+                        result.duplicates.append(position);
+                if result.created:
+                    self.current = result.created[-1];
+            offset += len(chunk);
+        return result;
+    
+    
+    def _build_chunk(self, chunk: List[int | str | datetime], offset: int, result: CreateResult) -> Tuple[List[zUID], List[int]]:
+        """
+        Builds the zUIDs of a chunk of `create_many`, recording its invalid inputs in `result`.
+        
+        Returns
+        -------
+        Tuple[List[zUID], List[int]]
+            The built zUIDs, in input order, and their positions.
+        """
+        #   12-digit integers (and strings of 12 digits, unless they are padded to a finer format) are validated together;
+        #   the other inputs go through `_build` one by one
+        fast    : List[int] = [];
+        values  : List[int] = [];
+        minutes : bool = self.format is MINUTE;
+        for index, id in enumerate(chunk):
+            if minutes and id.__class__ is str and len(id) == 12 and id.isdigit() and id.isascii():
+                id = int(id);
+            if id.__class__ is int and MIN_ID <= id <= MAX_ID:
+                fast.append(index);
+                values.append(id);
+        valid   : List[bool] = ZettelkastenGenerator._validate(values, self.strict);
+        built   : Dict[int, zUID] = {index: zUID(id) for index, id, ok in zip(fast, values, valid) if ok};
+        failed  : List[int] = [index for index, ok in zip(fast, valid) if not ok];
+        if len(fast) < len(chunk):
+            checked : set = set(fast);
+            for index, id in enumerate(chunk):
+                if index in checked:
+                    continue;
+                try:
+                    built[index] = self._build(id);
+                except Exception:
+                    failed.append(index);
+        
+        #   Errors are reported on the integer the builder checked (e.g. "20251314" padded to 202513140000)
+        for index in failed:
+            try:
+                value : int = builder.normalize(chunk[index]) if minutes else builder.normalize_format(chunk[index], self.format);
+            except Exception:
+                result.invalid[offset + index] = ERROR_MALFORMED;
+                result.rejected[offset + index] = chunk[index];
+                continue;
+            result.invalid[offset + index] = validator.find_error_code(value, self.strict) or ERROR_MALFORMED;
+            result.rejected[offset + index] = value;
+        order : List[int] = sorted(built) if len(fast) < len(chunk) else list(built);
+        return [built[index] for index in order], [offset + index for index in order];
+    
+    
+    @staticmethod
+    def _validate(ids: List[int], strict: bool) -> List[bool]:
+        """
+        Validates 12-digit integers with `ZettelkastenValidator.validate_many`, or one by one without NumPy.
+        """
+        if len(ids) < 64:
+            return [validator.validate(id, strict) for id in ids];
+        try:
+            import numpy;
+        except ImportError:
+            return [validator.validate(id, strict) for id in ids];
+        return validator.validate_many(numpy.array(ids, dtype=numpy.int64), strict).tolist();
+        
+    
+    def _build(self, id: int | str | datetime) -> zUID:
+        """
+        Builds a zUID in the generator's validation mode and format, through the cache if there is one.
+        """
+        if self.format is not MINUTE:
+            id = builder.normalize_format(id, self.format);
+        if self.cache is not None:
+            return self.cache.build(id);
+        return builder.build(id, self.strict);
         
         
     def decompose(self, id: int | str | datetime | zUID) -> Tuple[int, int, int, int, int]:
@@ -126,7 +389,9 @@ class ZettelkastenGenerator:
         bool
             `True` if the zUID is well-formed, `False` otherwise.
         """
-        return validator.validate(id);
+        if self.cache is not None:
+            return self.cache.validate(id);
+        return validator.validate(id, self.strict);
     
     
     def get_previous(self, id: int | str | datetime | zUID) -> zUID | None:
@@ -162,12 +427,22 @@ class ZettelkastenGenerator:
         """
         return sequencer.get_next(id);
     
+    
+    def occupancy(self) -> "ZettelkastenOccupancy":
+        """
+        Returns the per-day occupancy (see `ZettelkastenOccupancy`) of the created zUIDs, for gap and density queries.
+        It is a snapshot: zUIDs created afterwards are not in it. In the finer formats, it counts the taken minutes.
+        """
+        from .services.ZettelkastenOccupancy import ZettelkastenOccupancy as Occupancy;
+        
+        with self._lock:
+            return Occupancy(self.identifiers);
+    
 def try_build(param: int | str | datetime, expected: Tuple[int, int, int, int, int]) -> bool:
     try:
         zuid : zUID = builder.build(param);
         return decomposer.decompose(zuid) == expected;
-    except Exception as e:
-        print(e);
+    except Exception:
         return False;
 
 def msg_wrapper_try_build(param: int | str | datetime, expected: Tuple[int, int, int, int, int]) -> str:
@@ -198,13 +473,13 @@ if __name__ == "__main__":
     
     
     #   Get previous and next Zettelkasten Unique Identifiers (zUIDs)
-    counter : int = 0;
-    identifier : int = 202502142330;
+    print(f"{zgen.get_previous(202502150000)} <= 202502150000 => {zgen.get_next(202502150000)}");
+    
     
-    while counter < 50:
+    #   Walk 50 consecutive Zettelkasten Unique Identifiers (zUIDs)
+    from .services.ZettelkastenRange import zuid_range;
+    for counter, identifier in enumerate(zuid_range(202502142330, 202502150020)):
         print(f"{counter:3d} :: {identifier}");
-        identifier = zgen.get_next(identifier);
-        counter += 1;
         
         
     #   Get the current (`now()`) Zettelkasten Unique Identifier (zUID)
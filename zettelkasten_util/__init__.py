@@ -0,0 +1,65 @@
+"""
+`zettelkasten_util` package
+General utilities for dealing with Zettelkasten Unique Identifiers (zUIDs).
+
+The public API is loaded lazily through the module `__getattr__`: `from zettelkasten_util import validate` only imports
+the validator and the modules it depends on, not the generator, the indexes or the services.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from typing import Any, Dict, List, Tuple;
+
+
+#   Public name -> (module relative to this package, attribute); the generator class is exported as `generator` only,
+#   since `ZettelkastenGenerator` names its submodule
+EXPORTS : Dict[str, Tuple[str, str]] = {
+    "zUID"                      : ("data.ZettelkastenUniqueIdentifier", "zUID"),
+    "zUIDException"             : ("data.ZettelkastenUniqueIdentifier", "zUIDException"),
+    "ZettelkastenFormat"        : ("data.ZettelkastenFormat", "ZettelkastenFormat"),
+    "MINUTE"                    : ("data.ZettelkastenFormat", "MINUTE"),
+    "SECOND"                    : ("data.ZettelkastenFormat", "SECOND"),
+    "MILLISECOND"               : ("data.ZettelkastenFormat", "MILLISECOND"),
+    "sort_key"                  : ("data.ZettelkastenFormat", "sort_key"),
+    "ZettelkastenBuilder"       : ("engine.ZettelkastenBuilder", "ZettelkastenBuilder"),
+    "builder"                   : ("engine.ZettelkastenBuilder", "ZettelkastenBuilder"),
+    "ZettelkastenValidator"     : ("engine.ZettelkastenValidator", "ZettelkastenValidator"),
+    "validator"                 : ("engine.ZettelkastenValidator", "ZettelkastenValidator"),
+    "validate"                  : ("engine.ZettelkastenValidator", "validate"),
+    "ZettelkastenDecomposer"    : ("engine.ZettelkastenDecomposer", "ZettelkastenDecomposer"),
+    "decomposer"                : ("engine.ZettelkastenDecomposer", "ZettelkastenDecomposer"),
+    "decompose"                 : ("engine.ZettelkastenDecomposer", "decompose"),
+    "to_ordinal"                : ("engine.ZettelkastenCalendar", "to_ordinal"),
+    "from_ordinal"              : ("engine.ZettelkastenCalendar", "from_ordinal"),
+    "ZettelkastenClock"         : ("services.ZettelkastenClock", "ZettelkastenClock"),
+    "UTC"                       : ("services.ZettelkastenClock", "UTC"),
+    "ZettelkastenCodec"         : ("services.ZettelkastenCodec", "ZettelkastenCodec"),
+    "ZettelkastenSequencer"     : ("services.ZettelkastenSequencer", "ZettelkastenSequencer"),
+    "sequencer"                 : ("services.ZettelkastenSequencer", "ZettelkastenSequencer"),
+    "generator"                 : ("ZettelkastenGenerator", "ZettelkastenGenerator"),
+    "CreateResult"              : ("ZettelkastenGenerator", "CreateResult"),
+};
+
+__all__ : List[str] = list(EXPORTS);
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the module of a public name on first access, and caches the attribute in the package.
+    """
+    try:
+        module, attribute = EXPORTS[name];
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None;
+    #   A relative `__import__` (unlike `importlib.import_module`) is reported by `python -X importtime`
+    value : Any = getattr(__import__(module, globals(), None, [attribute], 1), attribute);
+    globals()[name] = value;
+    return value;
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(EXPORTS));
+
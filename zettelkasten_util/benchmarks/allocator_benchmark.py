@@ -0,0 +1,48 @@
+"""
+Stress benchmark for `ZettelkastenGenerator.allocate` with concurrent callers.
+Reports allocations per second and checks that no zUID was handed out twice.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.allocator_benchmark
+"""
+
+import threading;
+import time;
+
+from typing import List;
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+
+
+def stress(threads: int, per_thread: int) -> None:
+    """
+    Allocates `threads * per_thread` zUIDs through `now()` in allocating mode and prints the throughput.
+    """
+    zgen    : ZettelkastenGenerator = ZettelkastenGenerator(allocating=True);
+    results : List[List[zUID]] = [[] for _ in range(threads)];
+    barrier : threading.Barrier = threading.Barrier(threads + 1);
+    
+    def worker(out: List[zUID]) -> None:
+        barrier.wait();
+        for _ in range(per_thread):
+            out.append(zgen.now());
+    
+    workers : List[threading.Thread] = [threading.Thread(target=worker, args=(out,)) for out in results];
+    for thread in workers:
+        thread.start();
+    barrier.wait();
+    start : float = time.perf_counter();
+    for thread in workers:
+        thread.join();
+    elapsed : float = time.perf_counter() - start;
+    
+    allocated : List[zUID] = [zuid for out in results for zuid in out];
+    unique : int = len(set(allocated));
+    assert None not in allocated and unique == len(allocated), "duplicate or failed allocation";
+    print(f"threads {threads:>3}    {len(allocated):>7,} allocations    {len(allocated) / elapsed:>10,.0f} alloc/s    {unique:>7,} unique");
+
+
+if __name__ == "__main__":
+    for threads in (1, 2, 4, 8, 16, 32):
+        stress(threads, 100_000 // threads);
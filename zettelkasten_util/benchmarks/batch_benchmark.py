@@ -0,0 +1,49 @@
+"""
+Benchmark for the NumPy batch API (`validate_many`, `find_error_many`, `decompose_many`, `build_many`)
+against a Python loop over the scalar methods.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.batch_benchmark
+"""
+
+import timeit;
+
+from typing import List;
+from zettelkasten_util.engine.ZettelkastenDecomposer import ZettelkastenDecomposer as decomposer;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample;
+
+
+def try_build(id: str) -> int | None:
+    """
+    Scalar counterpart of one `build_many` row.
+    """
+    try:
+        return builder.build(id).id;
+    except Exception:
+        return None;
+
+
+def compare(label: str, loop, batch, n: int, repeat: int = 3) -> None:
+    """
+    Times a Python loop and its batch counterpart over `n` identifiers and prints both and the speedup.
+    """
+    loop_s  : float = min(timeit.repeat(loop, number=1, repeat=repeat));
+    batch_s : float = min(timeit.repeat(batch, number=1, repeat=repeat));
+    print(f"{label:<16} loop {loop_s / n * 1e9:9.1f} ns/id    batch {batch_s / n * 1e9:7.1f} ns/id    speedup {loop_s / batch_s:7.1f}x");
+
+
+if __name__ == "__main__":
+    import numpy;
+    
+    n       : int = 1_000_000;
+    ids     : List[int] = sample(n);
+    array   : numpy.ndarray = numpy.array(ids, dtype=numpy.int64);
+    strings : numpy.ndarray = array.astype(str);
+    
+    compare("validate",     lambda: [validator.validate(id) for id in ids],         lambda: validator.validate_many(array), n);
+    compare("find_error",   lambda: [validator.find_error_code(id) for id in ids],  lambda: validator.find_error_many(array), n);
+    compare("decompose",    lambda: [decomposer.decompose(id) for id in ids],       lambda: decomposer.decompose_many(array), n);
+    compare("build (str)",  lambda: [try_build(id) for id in strings.tolist()],     lambda: builder.build_many(strings), n);
@@ -0,0 +1,31 @@
+"""
+Benchmark for `ZettelkastenBuilder.build` and `ZettelkastenDecomposer.decompose` on each input type.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.build_benchmark
+"""
+
+from datetime import datetime;
+from typing import List;
+
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.engine.ZettelkastenDecomposer import decompose;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample, bench;
+
+
+if __name__ == "__main__":
+    ids         : List[int] = [id for id in sample(100_000) if validator.validate(id, True)];
+    strings     : List[str] = [str(id) for id in ids];
+    datetimes   : List[datetime] = [datetime(*decompose(id)) for id in ids];
+    zuids       : List[zUID] = [zUID(id) for id in ids];
+    
+    bench("build (int)",        builder.build, ids);
+    bench("build (str)",        builder.build, strings);
+    bench("build (datetime)",   builder.build, datetimes);
+    bench("decompose (int)",        decompose, ids);
+    bench("decompose (str)",        decompose, strings);
+    bench("decompose (datetime)",   decompose, datetimes);
+    bench("decompose (zUID)",       decompose, zuids);
@@ -0,0 +1,36 @@
+"""
+Benchmark for `ZettelkastenCache`: cached `build` and `validate` on a hot working set
+against the uncached engine calls, with the resulting hit rates.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.cache_benchmark
+"""
+
+import random;
+
+from typing import List;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.engine.ZettelkastenCache import ZettelkastenCache;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+from zettelkasten_util.benchmarks.decompose_benchmark import bench;
+
+
+if __name__ == "__main__":
+    rng     : random.Random = random.Random(0);
+    hot     : List[int] = [zuid.id for zuid in zuid_range(202501010000, 202501020000, 7)];
+    ids     : List[int] = [rng.choice(hot) for _ in range(100_000)];
+    strings : List[str] = [str(id)[:8] if rng.random() < 0.5 else str(id) for id in ids];
+    
+    for maxsize in (64, 1024):
+        cache : ZettelkastenCache = ZettelkastenCache(maxsize);
+        print(f"--- working set {len(hot)} ids, maxsize {maxsize}");
+        bench("build (int), uncached",      builder.build, ids);
+        bench("build (int), cached",        cache.build, ids);
+        bench("build (str), uncached",      builder.build, strings);
+        bench("build (str), cached",        cache.build, strings);
+        bench("validate (int), uncached",   validator.validate, ids);
+        bench("validate (int), cached",     cache.validate, ids);
+        for name, stats in cache.stats().items():
+            print(f"{name:<10} hits {stats.hits:>9,}    misses {stats.misses:>7,}    evictions {stats.evictions:>7,}    hit rate {stats.hit_rate:6.1%}");
@@ -0,0 +1,62 @@
+"""
+Benchmark for `now()` throughput: the cached `ZettelkastenClock` reads (local time, UTC, an explicit zone; each format)
+against building the zUID of `datetime.now()` on every call, and `ZettelkastenGenerator.now()` in allocating mode
+against `allocate(datetime.now())`.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.clock_benchmark
+"""
+
+import timeit;
+from datetime import datetime, tzinfo;
+from typing import Callable, List, Tuple;
+
+from zettelkasten_util.data.ZettelkastenFormat import MINUTE, SECOND, MILLISECOND;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.services.ZettelkastenClock import ZettelkastenClock, UTC;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+
+
+def zones() -> List[Tuple[str, tzinfo | None]]:
+    """
+    Returns the zones to benchmark: local time, UTC and, if the time zone database is available, Europe/Lisbon.
+    """
+    result : List[Tuple[str, tzinfo | None]] = [("local", None), ("utc", UTC)];
+    try:
+        from zoneinfo import ZoneInfo;
+        result.append(("Europe/Lisbon", ZoneInfo("Europe/Lisbon")));
+    except Exception:
+        pass;
+    return result;
+
+
+def rate(function: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """
+    Returns the best number of calls per second of `function` over `repeat` runs of `number` calls.
+    """
+    return number / min(timeit.repeat(function, number=number, repeat=repeat));
+
+
+def allocations(call: Callable[[ZettelkastenGenerator], Callable[[], object]], number: int, repeat: int = 5) -> float:
+    """
+    Returns the best number of calls per second of `call(generator)` over `repeat` runs of `number` calls,
+    each run on a fresh allocating generator.
+    """
+    return number / min(timeit.timeit(call(ZettelkastenGenerator(allocating=True)), number=number) for _ in range(repeat));
+
+
+if __name__ == "__main__":
+    number : int = 200_000;
+    print(f"{'datetime.now() + build':<40} {rate(lambda: builder.build(datetime.now()), number):>14,.0f} calls/s");
+    for label, zone in zones():
+        for format in (MINUTE, SECOND, MILLISECOND):
+            clock : ZettelkastenClock = ZettelkastenClock(zone, format);
+            print(f"{f'clock.now() {label} {format.name}':<40} {rate(clock.now, number):>14,.0f} calls/s");
+
+    #   Every call allocates a new zUID, so each run gets a fresh generator
+    number = 50_000;
+    naive   : float = allocations(lambda zgen: lambda: zgen.allocate(datetime.now()), number);
+    cached  : float = allocations(lambda zgen: zgen.now, number);
+    print(f"{'generator.allocate(datetime.now())':<40} {naive:>14,.0f} calls/s");
+    print(f"{'generator.now() (allocating)':<40} {cached:>14,.0f} calls/s    speedup {cached / naive:.2f}x");
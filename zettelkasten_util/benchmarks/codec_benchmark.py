@@ -0,0 +1,63 @@
+"""
+Size and speed benchmark of `ZettelkastenCodec` (varint and fixed-width) against JSON arrays and pickled lists,
+on a history of consecutive zUIDs (`get_next` runs) and on a sorted set of random zUIDs.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.codec_benchmark
+"""
+
+import json;
+import pickle;
+import random;
+import timeit;
+from typing import Any, Callable, Dict, List, Tuple;
+
+from zettelkasten_util.services.ZettelkastenCodec import ZettelkastenCodec as codec;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.benchmarks.suite import well_formed;
+
+
+def history(n: int, seed: int = 0) -> List[int]:
+    """
+    Returns `n` zUIDs created in runs of consecutive minutes (like `allocate`), a few hours apart.
+    """
+    rng     : random.Random = random.Random(seed);
+    ids     : List[int] = [];
+    start   : int = 202501010800;
+    while len(ids) < n:
+        run : List[int] = [zuid.id for zuid in zuid_range(start, sequencer.advance(start, 60))][:rng.randint(1, 30)];
+        ids.extend(run);
+        start = zuid_range(run[-1], 217012312359, rng.randint(60, 600))[1].id;
+    return ids[:n];
+
+
+def codecs() -> Dict[str, Tuple[Callable[[List[int]], bytes], Callable[[bytes], Any]]]:
+    """
+    Returns the encoders and decoders to compare: `name -> (encode, decode)`.
+    """
+    result : Dict[str, Tuple[Callable[[List[int]], bytes], Callable[[bytes], Any]]] = {
+        "json"              : (lambda ids: json.dumps(ids).encode(), lambda data: json.loads(data)),
+        "pickle"            : (lambda ids: pickle.dumps(ids, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "varint (Python)"   : (lambda ids: codec.encode(ids, vectorized=False), lambda data: codec.decode(data, vectorized=False)),
+    };
+    try:
+        import numpy;
+    except ImportError:
+        numpy = None;
+    if numpy is not None:
+        result["varint (NumPy)"] = (codec.encode, codec.decode);
+        result["fixed (NumPy)"] = (codec.encode_fixed, codec.decode_fixed);
+    return result;
+
+
+if __name__ == "__main__":
+    n : int = 100_000;
+    for label, ids in (("history", history(n)), ("sorted random set", sorted(well_formed(n)))):
+        print(f"-- {label} ({n:,} zUIDs)");
+        for name, (encode, decode) in codecs().items():
+            data    : bytes = encode(ids);
+            encoded : float = min(timeit.repeat(lambda: encode(ids), number=1, repeat=5));
+            decoded : float = min(timeit.repeat(lambda: decode(data), number=1, repeat=5));
+            print(f"{name:<18} {len(data):>10,} bytes ({len(data) / n:5.2f} B/zUID)    encode {encoded * 1e9 / n:8.1f} ns/zUID    decode {decoded * 1e9 / n:8.1f} ns/zUID");
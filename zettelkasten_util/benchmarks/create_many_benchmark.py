@@ -0,0 +1,59 @@
+"""
+Benchmark for bulk creation: `ZettelkastenGenerator.create_many` against a loop of `create`, on integer imports
+and on mixed imports (strings, duplicates and invalid inputs), each on a fresh generator.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.create_many_benchmark
+"""
+
+import random;
+import time;
+from typing import Callable, List;
+
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+from zettelkasten_util.benchmarks.suite import well_formed;
+
+
+def mixed(n: int, seed: int = 0) -> List[int | str]:
+    """
+    Returns `n` inputs: 80 % well-formed integers, 10 % strings, 5 % duplicates and 5 % invalid integers.
+    """
+    rng     : random.Random = random.Random(seed);
+    ids     : List[int | str] = list(well_formed(n, seed));
+    for index in range(n):
+        roll : float = rng.random();
+        if roll < 0.10:
+            ids[index] = str(ids[index]);
+        elif roll < 0.15:
+            ids[index] = ids[rng.randrange(n)];
+        elif roll < 0.20:
+            ids[index] = ids[index] // 100 * 100 + 60;
+    return ids;
+
+
+def best(run: Callable[[ZettelkastenGenerator], object], repeat: int = 5) -> float:
+    """
+    Returns the best time of `repeat` runs of `run`, each on a fresh generator.
+    """
+    times : List[float] = [];
+    for _ in range(repeat):
+        zgen    : ZettelkastenGenerator = ZettelkastenGenerator();
+        start   : float = time.perf_counter();
+        run(zgen);
+        times.append(time.perf_counter() - start);
+    return min(times);
+
+
+def loop(ids: List[int | str]) -> Callable[[ZettelkastenGenerator], object]:
+    def run(zgen: ZettelkastenGenerator) -> None:
+        for id in ids:
+            zgen.create(id);
+    return run;
+
+
+if __name__ == "__main__":
+    for label, ids in (("integers", well_formed(100_000)), ("mixed", mixed(100_000))):
+        looped  : float = best(loop(ids));
+        batched : float = best(lambda zgen: zgen.create_many(ids));
+        print(f"{label:<10} create loop {len(ids) / looped:>12,.0f} ids/s    create_many {len(ids) / batched:>12,.0f} ids/s    speedup {looped / batched:5.2f}x");
@@ -0,0 +1,43 @@
+"""
+Micro-benchmark for the `ZettelkastenDecomposer.decompose_int` and `ZettelkastenValidator.validate` hot paths.
+Compares the arithmetic (`divmod`) decomposition against the original string-slicing one.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.decompose_benchmark
+"""
+
+import random;
+import timeit;
+
+from typing import List;
+from zettelkasten_util.engine.ZettelkastenDecomposer import ZettelkastenDecomposer as decomposer;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+
+
+def sample(n: int, seed: int = 0) -> List[int]:
+    """
+    Returns `n` pseudo-random 12-digit integers in the valid year range.
+    """
+    rng : random.Random = random.Random(seed);
+    return [rng.randint(197001010000, 217012312359) for _ in range(n)];
+
+
+def bench(label: str, fn, ids: List[int], repeat: int = 5) -> float:
+    """
+    Times `fn` over every element of `ids` and prints the best ns/call.
+    """
+    best : float = min(timeit.repeat(lambda: [fn(id) for id in ids], number=1, repeat=repeat));
+    ns : float = best / len(ids) * 1e9;
+    print(f"{label:<40} {ns:10.1f} ns/call");
+    return ns;
+
+
+if __name__ == "__main__":
+    ids : List[int] = sample(100_000);
+    
+    string_ns : float = bench("decompose_int_string (str slicing)", decomposer.decompose_int_string, ids);
+    arith_ns  : float = bench("decompose_int (divmod)", decomposer.decompose_int, ids);
+    print(f"{'speedup':<40} {string_ns / arith_ns:10.2f}x");
+    
+    bench("validate (int)", validator.validate, ids);
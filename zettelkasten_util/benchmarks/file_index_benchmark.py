@@ -0,0 +1,57 @@
+"""
+Cold-start benchmark for `ZettelkastenFileIndex`: opening a 10M-zUID index and looking zUIDs up,
+against rebuilding an in-memory `ZettelkastenIndex` from the same zUIDs.
+
+Run from the directory containing the `zettelkasten_util` package (NumPy is used to generate the zUIDs):
+
+    python -m zettelkasten_util.benchmarks.file_index_benchmark [count]
+"""
+
+import os;
+import random;
+import sys;
+import tempfile;
+import time;
+
+import numpy;
+
+from zettelkasten_util.data.ZettelkastenArray import ZUIDArray;
+from zettelkasten_util.data.ZettelkastenFileIndex import ZettelkastenFileIndex;
+from zettelkasten_util.data.ZettelkastenIndex import ZettelkastenIndex;
+from zettelkasten_util.engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MIN_MINUTES;
+
+
+if __name__ == "__main__":
+    count   : int = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000;
+    minutes : numpy.ndarray = MIN_MINUTES + numpy.arange(count, dtype=numpy.int64) * 3;
+    ids     : ZUIDArray = ZUIDArray.from_buffer(calendar.compose(*calendar.from_minutes(minutes)));
+    
+    with tempfile.TemporaryDirectory() as root:
+        path : str = os.path.join(root, "zuids.idx");
+        start : float = time.perf_counter();
+        ZettelkastenFileIndex.write(path, ids, assume_sorted=True);
+        print(f"write {count:,} zUIDs ({os.path.getsize(path) / 1e6:.0f} MB)  {time.perf_counter() - start:10.3f} s");
+        
+        start = time.perf_counter();
+        index : ZettelkastenFileIndex = ZettelkastenFileIndex(path);
+        print(f"{'cold start (open)':<36} {(time.perf_counter() - start) * 1e3:10.3f} ms");
+        
+        probes  : list = [ids._data[random.randrange(count)] for _ in range(100_000)];
+        start = time.perf_counter();
+        assert all(probe in index for probe in probes);
+        print(f"{'lookup (binary search)':<36} {(time.perf_counter() - start) / len(probes) * 1e9:10.1f} ns");
+        
+        start = time.perf_counter();
+        for id in range(1, 10_001):
+            index.add(ids._data[-1] + id);
+        print(f"{'add (tail append)':<36} {(time.perf_counter() - start) / 10_000 * 1e9:10.1f} ns");
+        start = time.perf_counter();
+        index.compact_tail();
+        print(f"{'compact_tail':<36} {time.perf_counter() - start:10.3f} s");
+        index.close();
+        
+        subset  : int = min(count, 1_000_000);
+        start = time.perf_counter();
+        ZettelkastenIndex(ids[:subset], compact=True);
+        rebuild : float = (time.perf_counter() - start) * count / subset;
+        print(f"{'rebuild ZettelkastenIndex (est.)':<36} {rebuild:10.3f} s");
@@ -0,0 +1,42 @@
+"""
+Benchmark for the zUID formats: `build`, `validate`, `decompose_format` and `get_next` on 12-digit (minute),
+14-digit (second) and 17-digit (millisecond) zUIDs of the same moments. The 12-digit rows are the original
+fast paths; compare them with an older checkout with `benchmarks.suite`.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.format_benchmark
+"""
+
+import random;
+from typing import List;
+
+from zettelkasten_util.data.ZettelkastenFormat import ZettelkastenFormat, MINUTE, SECOND, MILLISECOND;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.engine.ZettelkastenDecomposer import ZettelkastenDecomposer as decomposer;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.benchmarks.decompose_benchmark import bench;
+from zettelkasten_util.benchmarks.suite import well_formed;
+
+
+def in_format(ids: List[int], format: ZettelkastenFormat, seed: int = 0) -> List[int]:
+    """
+    Returns the given 12-digit zUIDs in `format`, with pseudo-random sub-minute parts.
+    """
+    rng : random.Random = random.Random(seed);
+    return [format.join(id, rng.randrange(format.units)) for id in ids];
+
+
+if __name__ == "__main__":
+    ids : List[int] = well_formed(100_000);
+    for format in (MINUTE, SECOND, MILLISECOND):
+        sample  : List[int] = in_format(ids, format);
+        strings : List[str] = [str(id) for id in sample];
+        print(f"-- {format.name} ({format.digits} digits)");
+        bench("build (int)",            builder.build, sample);
+        bench("build (str)",            builder.build, strings);
+        bench("validate (int)",         validator.validate, sample);
+        bench("validate (str)",         validator.validate, strings);
+        bench("decompose_format (int)", decomposer.decompose_format, sample);
+        bench("get_next (int)",         sequencer.get_next, sample[:20_000]);
@@ -0,0 +1,54 @@
+"""
+Benchmark for `ZettelkastenGenerator.create` at growing sizes.
+The 1.1 list-based membership check is quadratic and is only timed up to 10^4 creations.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.generator_benchmark
+"""
+
+import timeit;
+
+from datetime import datetime, timedelta;
+from typing import List;
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+
+
+def consecutive(n: int, start: datetime = datetime(1990, 1, 1)) -> List[int]:
+    """
+    Returns `n` consecutive (one minute apart) integer zUIDs.
+    """
+    return [int((start + timedelta(minutes=i)).strftime("%Y%m%d%H%M")) for i in range(n)];
+
+
+def create_with_list(ids: List[int]) -> None:
+    """
+    The 1.1 implementation of `create`: a list scan per creation.
+    """
+    identifiers : List[zUID] = list();
+    history     : List[zUID] = list();
+    for id in ids:
+        zuid : zUID = builder.build(id);
+        if zuid not in identifiers:
+            identifiers.append(zuid);
+            history.append(zuid);
+
+
+def create_with_generator(ids: List[int]) -> None:
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator();
+    for id in ids:
+        zgen.create(id);
+
+
+if __name__ == "__main__":
+    for n in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        ids : List[int] = consecutive(n);
+        
+        index_s : float = timeit.timeit(lambda: create_with_generator(ids), number=1);
+        line    : str = f"n = {n:>9,}    index {index_s:8.3f} s ({index_s / n * 1e6:6.2f} us/create)";
+        if n <= 10 ** 4:
+            list_s : float = timeit.timeit(lambda: create_with_list(ids), number=1);
+            line += f"    list {list_s:8.3f} s ({list_s / n * 1e6:8.2f} us/create)";
+        print(line);
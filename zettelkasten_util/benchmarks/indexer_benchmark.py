@@ -0,0 +1,32 @@
+"""
+Scaling benchmark for `ZettelkastenIndexer` at 1, 2, 4 and 8 worker processes on a generated Markdown vault.
+Speedups are bounded by the number of CPUs of the machine.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.indexer_benchmark [files]
+"""
+
+import os;
+import sys;
+import tempfile;
+import time;
+
+from zettelkasten_util.services.ZettelkastenIndexer import ZettelkastenIndexer, VaultIndex;
+from zettelkasten_util.benchmarks.scanner_benchmark import make_vault;
+
+
+if __name__ == "__main__":
+    files : int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000;
+    with tempfile.TemporaryDirectory() as root:
+        size : int = make_vault(root, files);
+        print(f"{files:,} files, {size / 1e6:.1f} MB, {os.cpu_count()} CPUs");
+        
+        baseline : float | None = None;
+        for workers in (1, 2, 4, 8):
+            start   : float = time.perf_counter();
+            vault   : VaultIndex = ZettelkastenIndexer(workers).index(root);
+            elapsed : float = time.perf_counter() - start;
+            baseline = baseline or elapsed;
+            print(f"{workers} workers {elapsed:8.3f} s {size / 1e6 / elapsed:8.1f} MB/s    speedup {baseline / elapsed:5.2f}x    "
+                  f"{len(vault.ids):,} notes, {len(vault.links):,} links, {len(vault.duplicates):,} duplicates");
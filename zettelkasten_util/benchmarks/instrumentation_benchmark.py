@@ -0,0 +1,39 @@
+"""
+Benchmark for the overhead of `ZettelkastenInstrumentation`: the same calls before enabling it, while enabled,
+and after disabling it (which should match the first run), then the collected counters.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.instrumentation_benchmark
+"""
+
+from typing import Callable, Dict, List;
+
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.services.ZettelkastenInstrumentation import ZettelkastenInstrumentation as instrumentation;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample, bench;
+
+
+#   The methods are looked up on each call, so that the wrappers are used once installed
+CASES : Dict[str, Callable[[int], object]] = {
+    "build (str)"   : lambda id: builder.build(str(id)),
+    "validate (int)": lambda id: validator.validate(id, True),
+    "get_next (int)": lambda id: sequencer.get_next(id),
+};
+
+
+if __name__ == "__main__":
+    ids     : List[int] = sample(100_000);
+    valid   : List[int] = [id for id in ids if validator.validate(id, True)];
+    
+    for label, state in (("disabled", instrumentation.disable), ("enabled", instrumentation.enable), ("disabled again", instrumentation.disable)):
+        state();
+        print(f"-- {label}");
+        for name, case in CASES.items():
+            bench(name, case, ids if name.startswith("validate") else valid);
+    
+    print("-- counters (operation, calls, failures, mean ns, failures by category)");
+    for name, stats in sorted(instrumentation.snapshot().items()):
+        print(f"{name:<32} {stats.calls:>10,} {stats.failures:>10,} {stats.mean_ns:10.1f}  {stats.categories}");
@@ -0,0 +1,76 @@
+"""
+Memory benchmark for `zUID` objects, measured with `tracemalloc`.
+Compares the 1.0 `zUID` (no `__slots__`) with the slotted `zUID`, with and without interning,
+with a `ZUIDArray`, and the generator with and without compact storage.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.memory_benchmark
+"""
+
+import tracemalloc;
+
+from typing import Callable, List;
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.data.ZettelkastenArray import ZUIDArray;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample;
+from zettelkasten_util.benchmarks.generator_benchmark import consecutive;
+
+
+class LegacyzUID:
+    """
+    The 1.0 `zUID` class: one `__dict__` per instance.
+    """
+    def __init__(self, id: int) -> None:
+        self.id = id;
+
+
+def bytes_per_identifier(factory: Callable[[int], object], ids: List[int]) -> float:
+    """
+    Returns the memory allocated per element while building `[factory(id) for id in ids]`,
+    excluding the integers themselves (which are allocated before tracing starts).
+    """
+    tracemalloc.start();
+    before, _ = tracemalloc.get_traced_memory();
+    objects : List[object] = [factory(id) for id in ids];
+    after, _ = tracemalloc.get_traced_memory();
+    tracemalloc.stop();
+    return (after - before) / len(objects);
+
+
+def bytes_per_call(function: Callable[[], object], n: int) -> float:
+    """
+    Returns the memory still allocated after `function()` (whose result is kept alive), divided by `n`.
+    """
+    tracemalloc.start();
+    before, _ = tracemalloc.get_traced_memory();
+    result : object = function();
+    after, _ = tracemalloc.get_traced_memory();
+    tracemalloc.stop();
+    del result;
+    return (after - before) / n;
+
+
+def fill(compact: bool, ids: List[int]) -> ZettelkastenGenerator:
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(compact=compact);
+    for id in ids:
+        zgen.create(id);
+    return zgen;
+
+
+if __name__ == "__main__":
+    n       : int = 1_000_000;
+    ids     : List[int] = sample(n);
+    repeats : List[int] = ids[: n // 10] * 10;
+    
+    print(f"{'list of int (baseline)':<36} {bytes_per_identifier(int, ids):7.1f} B/id");
+    print(f"{'1.0 zUID (__dict__)':<36} {bytes_per_identifier(LegacyzUID, ids):7.1f} B/id");
+    print(f"{'zUID (__slots__)':<36} {bytes_per_identifier(zUID, ids):7.1f} B/id");
+    print(f"{'zUID, 10 refs per id':<36} {bytes_per_identifier(zUID, repeats):7.1f} B/id");
+    print(f"{'zUID.intern, 10 refs per id':<36} {bytes_per_identifier(zUID.intern, repeats):7.1f} B/id");
+    print(f"{'ZUIDArray':<36} {bytes_per_call(lambda: ZUIDArray(ids), n):7.1f} B/id");
+    
+    created : List[int] = consecutive(n // 10);
+    print(f"{'ZettelkastenGenerator':<36} {bytes_per_call(lambda: fill(False, created), len(created)):7.1f} B/id");
+    print(f"{'ZettelkastenGenerator(compact=True)':<36} {bytes_per_call(lambda: fill(True, created), len(created)):7.1f} B/id");
@@ -0,0 +1,66 @@
+"""
+Benchmark for gap and density queries: `ZettelkastenOccupancy` against the naive `get_next` / `in identifiers` loop,
+on a year of zUIDs with busy working hours.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.occupancy_benchmark
+"""
+
+import random;
+import timeit;
+from typing import List;
+
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.data.ZettelkastenIndex import ZettelkastenIndex;
+from zettelkasten_util.services.ZettelkastenOccupancy import ZettelkastenOccupancy;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+
+
+def naive_first_free(identifiers: ZettelkastenIndex, at: int) -> zUID:
+    candidate : zUID = zUID(at);
+    while candidate in identifiers:
+        candidate = sequencer.get_next(candidate);
+    return candidate;
+
+
+def naive_free_slots(identifiers: ZettelkastenIndex, date: int) -> List[zUID]:
+    return [zuid for zuid in zuid_range(date, sequencer.advance(date, 1440)) if zuid not in identifiers];
+
+
+def naive_day_counts(identifiers: ZettelkastenIndex, days: List[int]) -> List[int]:
+    return [sum(1 for zuid in zuid_range(day, sequencer.advance(day, 1440)) if zuid in identifiers) for day in days];
+
+
+def report(label: str, naive: float, occupancy: float) -> None:
+    print(f"{label:<32} naive {naive * 1e6:12.1f} us    occupancy {occupancy * 1e6:10.1f} us    speedup {naive / occupancy:8.1f}x");
+
+
+if __name__ == "__main__":
+    rng         : random.Random = random.Random(0);
+    year        : List[int] = [zuid.id for zuid in zuid_range(202501010000, 202601010000)];
+    
+    #   Every minute from 08:00 to 18:00 is taken, and one minute in ten otherwise
+    taken       : List[int] = [id for id in year if 800 <= id % 10000 < 1800 or rng.random() < 0.1];
+    identifiers : ZettelkastenIndex = ZettelkastenIndex(map(zUID, taken), compact=True);
+    occupancy   : ZettelkastenOccupancy = ZettelkastenOccupancy(taken);
+    occupancy.day_counts(202501010000, 202501020000);
+    print(f"{len(taken):,} zUIDs taken in 2025, occupancy built in "
+          f"{timeit.timeit(lambda: ZettelkastenOccupancy(taken), number=1):.3f} s");
+    
+    probes  : List[int] = [rng.choice(year) // 10000 * 10000 + 800 for _ in range(20)];
+    report("first free after 08:00 (x20)",
+           timeit.timeit(lambda: [naive_first_free(identifiers, at) for at in probes], number=1),
+           timeit.timeit(lambda: [occupancy.first_free(at) for at in probes], number=1));
+    report("free slots of a day",
+           timeit.timeit(lambda: naive_free_slots(identifiers, 202502140000), number=1),
+           timeit.timeit(lambda: occupancy.free_slots(202502140000), number=1));
+    
+    days : List[int] = [zuid.id for zuid in zuid_range(202501010000, 202601010000, 1440)];
+    report("density per day over a year",
+           timeit.timeit(lambda: naive_day_counts(identifiers, days), number=1),
+           timeit.timeit(lambda: occupancy.day_counts(202501010000, 202601010000), number=1));
+    report("density per month over a year", 
+           timeit.timeit(lambda: naive_day_counts(identifiers, days), number=1),
+           timeit.timeit(lambda: occupancy.month_counts(202501010000, 202601010000), number=1));
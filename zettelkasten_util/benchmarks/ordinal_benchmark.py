@@ -0,0 +1,68 @@
+"""
+Benchmark for the minute ordinals: `to_ordinal` / `from_ordinal` (table lookups) against the `datetime` path
+(`datetime` of the zUID minus the epoch, epoch plus a `timedelta`) and against the calendar arithmetic of
+`to_minutes` / `from_minutes`, and `get_next` on ordinals against the former `datetime` + `timedelta` step.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.ordinal_benchmark
+"""
+
+import timeit;
+from datetime import datetime, timedelta;
+from typing import Callable, Dict, List;
+
+from zettelkasten_util.engine.ZettelkastenBuilder import build_from_datetime;
+from zettelkasten_util.engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar;
+from zettelkasten_util.engine.ZettelkastenDecomposer import decompose;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.benchmarks.suite import well_formed;
+
+
+EPOCH   : datetime = datetime(1970, 1, 1);
+MINUTE  : timedelta = timedelta(minutes=1);
+
+
+def datetime_to_ordinal(id: int) -> int:
+    return (datetime(*decompose(id)) - EPOCH) // MINUTE;
+
+
+def datetime_from_ordinal(ordinal: int) -> int:
+    return int((EPOCH + ordinal * MINUTE).strftime("%Y%m%d%H%M"));
+
+
+def datetime_get_next(id: int) -> object:
+    return build_from_datetime(datetime(*decompose(id)) + MINUTE);
+
+
+def rate(function: Callable[[int], object], inputs: List[int], repeat: int = 5) -> float:
+    """
+    Returns the best number of calls per second of `function` over `repeat` passes on `inputs`.
+    """
+    return len(inputs) / min(timeit.repeat(lambda: [function(input) for input in inputs], number=1, repeat=repeat));
+
+
+if __name__ == "__main__":
+    ids         : List[int] = well_formed(100_000);
+    ordinals    : List[int] = [calendar.to_ordinal(id) for id in ids];
+    cases       : Dict[str, Dict[str, Callable[[int], object]]] = {
+        "to ordinal"    : {
+            "datetime"          : datetime_to_ordinal,
+            "to_minutes"        : lambda id: calendar.to_minutes_checked(*decompose(id)),
+            "to_ordinal"        : calendar.to_ordinal,
+        },
+        "from ordinal"  : {
+            "datetime"          : datetime_from_ordinal,
+            "from_minutes"      : lambda ordinal: calendar.compose(*calendar.from_minutes(ordinal)),
+            "from_ordinal"      : calendar.from_ordinal,
+        },
+        "get_next"      : {
+            "datetime"          : datetime_get_next,
+            "ordinals"          : sequencer.get_next,
+        },
+    };
+    for label, functions in cases.items():
+        inputs  : List[int] = ordinals if label == "from ordinal" else ids;
+        rates   : Dict[str, float] = {name: rate(function, inputs) for name, function in functions.items()};
+        for name, calls in rates.items():
+            print(f"{label:<14} {name:<14} {calls:>14,.0f} calls/s    speedup {calls / rates['datetime']:5.2f}x");
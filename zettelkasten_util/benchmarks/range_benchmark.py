@@ -0,0 +1,43 @@
+"""
+Benchmark for walking consecutive zUIDs: `zuid_range` iteration against repeated `get_next` calls,
+and O(1) `len` / indexing over a year of minutes.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.range_benchmark
+"""
+
+import timeit;
+
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range, ZettelkastenRange;
+
+
+def walk_get_next(start: int, n: int) -> None:
+    id : zUID | int = start;
+    for _ in range(n):
+        id = sequencer.get_next(id);
+
+
+def walk_range(start: int, stop: int, step: int = 1) -> None:
+    for _ in zuid_range(start, stop, step):
+        pass;
+
+
+if __name__ == "__main__":
+    year : ZettelkastenRange = zuid_range(202501010000, 202601010000);
+    n    : int = 100_000;
+    
+    get_next_s  : float = timeit.timeit(lambda: walk_get_next(202501010000, n), number=1);
+    range_s     : float = timeit.timeit(lambda: walk_range(202501010000, year[n].id), number=1);
+    print(f"{'get_next x ' + format(n, ','):<28} {get_next_s / n * 1e9:8.1f} ns/zUID");
+    print(f"{'zuid_range, step 1 minute':<28} {range_s / n * 1e9:8.1f} ns/zUID    speedup {get_next_s / range_s:6.1f}x");
+    
+    year_s : float = timeit.timeit(lambda: walk_range(202501010000, 202601010000), number=1);
+    print(f"{'zuid_range, 2025 (' + format(len(year), ',') + ')':<28} {year_s:8.3f} s");
+    hours_s : float = timeit.timeit(lambda: walk_range(197001010000, 217012312359, 60), number=1);
+    print(f"{'zuid_range, 1970-2170 hours':<28} {hours_s:8.3f} s");
+    
+    lookups : float = timeit.timeit(lambda: (len(year), year[len(year) // 2], 202507141431 in year), number=100_000);
+    print(f"{'len + getitem + in':<28} {lookups / 100_000 * 1e9:8.1f} ns");
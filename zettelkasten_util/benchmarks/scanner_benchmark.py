@@ -0,0 +1,59 @@
+"""
+Throughput benchmark (MB/s) for `ZettelkastenScanner` on a generated Markdown vault.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.scanner_benchmark [files]
+"""
+
+import os;
+import random;
+import sys;
+import tempfile;
+import time;
+import tracemalloc;
+
+from zettelkasten_util.services.ZettelkastenScanner import ZettelkastenScanner;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample;
+
+
+def make_vault(root: str, files: int, seed: int = 0) -> int:
+    """
+    Writes `files` notes with front-matter, prose and links under `root`, 1000 per folder; returns their total size in bytes.
+    """
+    rng     : random.Random = random.Random(seed);
+    ids     : list = [id for id in sample(files * 300, seed) if validator.validate(id)][:files];
+    words   : list = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "2025", "v1.2"];
+    size    : int = 0;
+    for index, id in enumerate(ids):
+        folder : str = os.path.join(root, f"{index // 1000:04d}");
+        os.makedirs(folder, exist_ok=True);
+        links : str = " ".join(f"[[{rng.choice(ids)}]]" for _ in range(rng.randint(1, 8)));
+        prose : str = " ".join(rng.choice(words) for _ in range(rng.randint(100, 600)));
+        text  : bytes = f"---\nid: {id}\ntags: [note]\n---\n# Note {id}\n\n{prose}\n\nSee {links}.\n".encode();
+        with open(os.path.join(folder, f"{id} note.md"), "wb") as file:
+            file.write(text);
+        size += len(text);
+    return size;
+
+
+if __name__ == "__main__":
+    files : int = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000;
+    with tempfile.TemporaryDirectory() as root:
+        size : int = make_vault(root, files);
+        for batch_size in (256, 4096):
+            scanner : ZettelkastenScanner = ZettelkastenScanner(batch_size=batch_size);
+            found   : int = sum(1 for _ in scanner.scan(root));
+            start   : float = time.perf_counter();
+            found   = sum(1 for _ in scanner.scan(root));
+            elapsed : float = time.perf_counter() - start;
+            
+            #   Second pass under `tracemalloc` (slower) for the peak memory of the scanner itself
+            tracemalloc.start();
+            for _ in scanner.scan(root):
+                pass;
+            peak    : int = tracemalloc.get_traced_memory()[1];
+            tracemalloc.stop();
+            print(f"batch {batch_size:<6} {files:,} files, {size / 1e6:.1f} MB, {found:,} zUIDs: "
+                  f"{size / 1e6 / elapsed:8.1f} MB/s, peak Python memory {peak / 1e3:.0f} kB");
@@ -0,0 +1,43 @@
+"""
+Benchmark for k-step jumps: `ZettelkastenSequencer.advance` against `k` calls to `get_next`,
+and `advance_many` against a Python loop over `advance`.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.sequencer_benchmark
+"""
+
+import random;
+import timeit;
+
+from typing import List;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+
+
+def repeated_get_next(id: int, k: int):
+    for _ in range(k):
+        id = sequencer.get_next(id);
+    return id;
+
+
+if __name__ == "__main__":
+    for k in (1, 60, 1440):
+        loop_s      : float = min(timeit.repeat(lambda: repeated_get_next(202502141151, k), number=100, repeat=3)) / 100;
+        advance_s   : float = min(timeit.repeat(lambda: sequencer.advance(202502141151, k), number=10_000, repeat=3)) / 10_000;
+        print(f"k = {k:>5}    get_next x k {loop_s * 1e6:10.1f} us    advance {advance_s * 1e6:6.2f} us    speedup {loop_s / advance_s:8.1f}x");
+    
+    try:
+        import numpy;
+    except ImportError:
+        numpy = None;
+    if numpy is not None:
+        rng     : random.Random = random.Random(0);
+        slots   = zuid_range(202001010000, 203001010000);
+        ids     : List[int] = [slots[rng.randrange(len(slots))].id for _ in range(100_000)];
+        ks      : List[int] = [rng.randint(-10 ** 6, 10 ** 6) for _ in ids];
+        ids_array, ks_array = numpy.array(ids), numpy.array(ks);
+        
+        loop_s  : float = timeit.timeit(lambda: [sequencer.advance(id, k) for id, k in zip(ids, ks)], number=1);
+        batch_s : float = min(timeit.repeat(lambda: sequencer.advance_many(ids_array, ks_array), number=1, repeat=5));
+        print(f"{len(ids):,} jumps    advance loop {loop_s / len(ids) * 1e9:8.1f} ns/id    advance_many {batch_s / len(ids) * 1e9:6.1f} ns/id    speedup {loop_s / batch_s:6.1f}x");
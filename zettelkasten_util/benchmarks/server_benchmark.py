@@ -0,0 +1,68 @@
+"""
+Local load test for `ZettelkastenServer`: a server process and concurrent `ZettelkastenClient` connections,
+reporting requests per second and p50/p99 latencies, one request at a time and in pipelined batches.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.server_benchmark [connections] [requests per connection]
+"""
+
+import asyncio;
+import multiprocessing;
+import os;
+import sys;
+import tempfile;
+import time;
+from typing import List;
+
+from zettelkasten_util.services.ZettelkastenServer import ZettelkastenClient, serve;
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered : List[float] = sorted(samples);
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))];
+
+
+async def run_client(path: str, command: str, argument: object, requests: int, batch: int, latencies: List[float]) -> None:
+    async with ZettelkastenClient(path) as client:
+        for _ in range(requests // batch):
+            start : float = time.perf_counter();
+            if batch == 1:
+                await client.request(command, argument);
+            else:
+                await client.batch([(command, argument)] * batch);
+            latencies.append(time.perf_counter() - start);
+
+
+async def load(path: str, command: str, argument: object, connections: int, requests: int, batch: int) -> None:
+    latencies   : List[float] = [];
+    start       : float = time.perf_counter();
+    await asyncio.gather(*(run_client(path, command, argument, requests, batch, latencies) for _ in range(connections)));
+    elapsed     : float = time.perf_counter() - start;
+    label       : str = f"{command} x{connections} connections" + (f", batches of {batch}" if batch > 1 else "");
+    print(f"{label:<44} {connections * requests / elapsed:10,.0f} req/s    "
+          f"p50 {percentile(latencies, 0.5) * 1e6:9.1f} us    p99 {percentile(latencies, 0.99) * 1e6:9.1f} us"
+          + ("    (per batch)" if batch > 1 else ""));
+
+
+async def wait_for(path: str) -> None:
+    while not os.path.exists(path):
+        await asyncio.sleep(0.01);
+
+
+if __name__ == "__main__":
+    connections : int = int(sys.argv[1]) if len(sys.argv) > 1 else 8;
+    requests    : int = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000;
+    with tempfile.TemporaryDirectory() as root:
+        path    : str = os.path.join(root, "zettelkasten.sock");
+        server  : multiprocessing.Process = multiprocessing.Process(target=serve, args=(path,), daemon=True);
+        server.start();
+        try:
+            asyncio.run(wait_for(path));
+            for command, argument in (("validate", 202502141151), ("decompose", 202502141151), ("next", 202502142359), ("now", None)):
+                asyncio.run(load(path, command, argument, connections, requests, 1));
+            asyncio.run(load(path, "allocate", 202502140000, connections, requests, 100));
+            asyncio.run(load(path, "validate", 202502141151, 1, requests * connections, 1_000));
+        finally:
+            server.terminate();
+            server.join();
@@ -0,0 +1,53 @@
+"""
+Throughput benchmark for generators sharing a `ZettelkastenSQLiteIndex`: batched `create_many` against one
+transaction per `create`, and `allocate` from 1, 2, 4 and 8 concurrent writer processes.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.sqlite_benchmark
+"""
+
+import os;
+import tempfile;
+import time;
+from concurrent.futures import ProcessPoolExecutor;
+from typing import List;
+
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+
+
+def allocate(path: str, count: int) -> int:
+    """
+    Allocates `count` zUIDs from the same moment with a generator on the database at `path`.
+    """
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(database_path=path);
+    for _ in range(count):
+        zgen.allocate(202502140000);
+    return count;
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as root:
+        ids : List[int] = [zuid.id for zuid in zuid_range(202501010000, 202501150000)][:10_000];
+        
+        zgen    : ZettelkastenGenerator = ZettelkastenGenerator(database_path=os.path.join(root, "create.db"));
+        start   : float = time.perf_counter();
+        for id in ids[:2_000]:
+            zgen.create(id);
+        single  : float = (time.perf_counter() - start) / 2_000;
+        start   = time.perf_counter();
+        zgen.create_many(ids[2_000:]);
+        batched : float = (time.perf_counter() - start) / 8_000;
+        print(f"{'create (one transaction each)':<36} {1 / single:10,.0f} zUIDs/s");
+        print(f"{'create_many (one transaction per chunk)':<36} {1 / batched:10,.0f} zUIDs/s");
+        
+        count : int = 2_000;
+        for writers in (1, 2, 4, 8):
+            path  : str = os.path.join(root, f"allocate-{writers}.db");
+            start = time.perf_counter();
+            with ProcessPoolExecutor(writers) as executor:
+                total : int = sum(executor.map(allocate, [path] * writers, [count // writers] * writers));
+            elapsed : float = time.perf_counter() - start;
+            unique  : int = len(ZettelkastenGenerator(database_path=path).identifiers);
+            print(f"{'allocate, ' + str(writers) + ' writers':<36} {total / elapsed:10,.0f} zUIDs/s    {unique:,} unique of {total:,}");
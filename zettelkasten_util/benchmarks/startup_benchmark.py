@@ -0,0 +1,65 @@
+"""
+Startup benchmark: the import time (`python -X importtime`) and the number of modules loaded by importing only
+`validate` from the package, compared with the generator and with every module of the package.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.startup_benchmark [repeat]
+"""
+
+import os;
+import statistics;
+import subprocess;
+import sys;
+from typing import Dict, List, Tuple;
+
+
+#   The package directory and the directory it is imported from
+PACKAGE     : str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)));
+ROOT        : str = os.path.dirname(PACKAGE);
+
+#   Import statements measured, from the lightest to the heaviest
+STATEMENTS  : Dict[str, str] = {
+    "validate"      : "from zettelkasten_util import validate",
+    "generator"     : "from zettelkasten_util import ZettelkastenGenerator",
+    "everything"    : "; ".join(f"import zettelkasten_util.{directory}.{name[:-3]}"
+                                for directory in ("data", "engine", "services")
+                                for name in sorted(os.listdir(os.path.join(PACKAGE, directory)))
+                                if name.startswith("Zettelkasten") and name.endswith(".py")),
+};
+
+
+def import_profile(statement: str) -> Dict[str, int]:
+    """
+    Runs `statement` in a fresh interpreter with `-X importtime` and returns the self time (us) of each module it imported.
+    """
+    process : subprocess.CompletedProcess = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                                           cwd=ROOT, capture_output=True, text=True, check=True);
+    modules : Dict[str, int] = {};
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue;
+        self_time, _, name = line[len("import time:"):].split("|");
+        modules[name.strip()] = int(self_time);
+    return modules;
+
+
+def startup(statement: str, repeat: int = 5) -> Tuple[float, int, List[str]]:
+    """
+    Returns the median import time (ms) and the number of modules imported by `statement` on top of the
+    interpreter startup, and the names of these modules.
+    """
+    baseline    : Dict[str, int] = import_profile("pass");
+    times       : List[float] = [];
+    for _ in range(repeat):
+        modules : Dict[str, int] = {name: time for name, time in import_profile(statement).items() if name not in baseline};
+        times.append(sum(modules.values()) / 1000);
+    return statistics.median(times), len(modules), sorted(modules);
+
+
+if __name__ == "__main__":
+    repeat : int = int(sys.argv[1]) if len(sys.argv) > 1 else 5;
+    for label, statement in STATEMENTS.items():
+        milliseconds, count, modules = startup(statement, repeat);
+        print(f"{label:<12} {milliseconds:8.2f} ms  {count:4d} modules");
+    print("modules imported by `validate`:", ", ".join(startup(STATEMENTS["validate"], 1)[2]));
@@ -0,0 +1,181 @@
+"""
+Reproducible benchmark suite for the engine and service entry points, with JSON results and regression comparison.
+
+Every case runs over `n` pseudo-random (seeded) well-formed zUIDs for each scale `n`, and reports the best
+time per operation over `repeat` runs. Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.suite run [--scales 1000 10000 100000 1000000] [--repeat 5] [--filter build] [--output results.json]
+    python -m zettelkasten_util.benchmarks.suite compare baseline.json results.json [--threshold 0.10]
+
+`compare` prints the change of every case present in both runs and exits with status 1 if any case is slower
+than the baseline by more than the threshold.
+"""
+
+import argparse;
+import json;
+import platform;
+import random;
+import subprocess;
+import sys;
+import time;
+from datetime import datetime;
+from typing import Any, Callable, Dict, List, Tuple;
+
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.engine.ZettelkastenDecomposer import ZettelkastenDecomposer as decomposer;
+from zettelkasten_util.engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MIN_MINUTES, MAX_MINUTES;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator;
+
+
+#   Scales run by default; 10^6 is opt-in (`--scales`) since the slow cases then take minutes
+DEFAULT_SCALES  : List[int] = [1_000, 10_000, 100_000];
+
+#   Ratio above which `compare` flags a case as a regression
+DEFAULT_THRESHOLD : float = 0.10;
+
+
+def well_formed(n: int, seed: int = 0) -> List[int]:
+    """
+    Returns `n` pseudo-random well-formed zUIDs (existing moments between 1970 and 2170).
+    """
+    rng : random.Random = random.Random(seed);
+    return [calendar.compose(*calendar.from_minutes(rng.randint(MIN_MINUTES, MAX_MINUTES))) for _ in range(n)];
+
+
+def cases(ids: List[int]) -> Dict[str, Tuple[Callable[[Any], Any], List[Any]]]:
+    """
+    Returns the benchmark cases over the given zUIDs: `name -> (operation, inputs)`.
+    """
+    strings     : List[str] = [str(id) for id in ids];
+    datetimes   : List[datetime] = [datetime(*decomposer.decompose_int(id)) for id in ids];
+    zuids       : List[zUID] = [zUID(id) for id in ids];
+    return {
+        "build.int"             : (builder.build, ids),
+        "build.str"             : (builder.build, strings),
+        "build.datetime"        : (builder.build, datetimes),
+        "validate.int"          : (validator.validate, ids),
+        "validate.str"          : (validator.validate, strings),
+        "find_error.int"        : (validator.find_error, ids),
+        "decompose.int"         : (decomposer.decompose, ids),
+        "decompose.str"         : (decomposer.decompose, strings),
+        "decompose.zuid"        : (decomposer.decompose, zuids),
+        "get_next.zuid"         : (sequencer.get_next, zuids),
+        "get_previous.zuid"     : (sequencer.get_previous, zuids),
+    };
+
+
+def measure(operation: Callable[[Any], Any], inputs: List[Any], repeat: int, setup: Callable[[], Any] | None = None) -> float:
+    """
+    Returns the best time per operation, in nanoseconds, of `repeat` runs of `operation` over `inputs`.
+    If given, `setup` is called before each run (untimed) and its result replaces the operation.
+    """
+    best : int | None = None;
+    for _ in range(repeat):
+        run : Callable[[Any], Any] = setup() if setup is not None else operation;
+        start : int = time.perf_counter_ns();
+        for value in inputs:
+            run(value);
+        elapsed : int = time.perf_counter_ns() - start;
+        best = elapsed if best is None else min(best, elapsed);
+    return best / len(inputs);
+
+
+def run(scales: List[int], repeat: int = 5, pattern: str = "", seed: int = 0) -> Dict[str, Any]:
+    """
+    Runs the cases whose name contains `pattern` at each scale, and returns
+    `{"meta": {...}, "results": {"<case>[<n>]": {"n": n, "ns_per_op": ...}}}`.
+    """
+    results : Dict[str, Dict[str, float]] = {};
+    for n in scales:
+        ids : List[int] = well_formed(n, seed);
+
+        #   `create` on a fresh generator per run, so that every zUID is new
+        suite : Dict[str, Tuple[Callable[[Any], Any], List[Any], Callable[[], Any] | None]] = {
+            name: (operation, inputs, None) for name, (operation, inputs) in cases(ids).items()};
+        suite["generator.create.int"] = (None, ids, lambda: ZettelkastenGenerator().create);
+
+        for name, (operation, inputs, setup) in suite.items():
+            if pattern not in name:
+                continue;
+            key : str = f"{name}[{n}]";
+            results[key] = {"n": n, "ns_per_op": round(measure(operation, inputs, repeat, setup), 1)};
+            print(f"{key:<36} {results[key]['ns_per_op']:12.1f} ns/op", file=sys.stderr);
+    return {"meta": metadata(repeat, seed), "results": results};
+
+
+def metadata(repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Returns the environment of a run: date, interpreter, platform and git commit (if any).
+    """
+    try:
+        commit : str | None = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip();
+    except (OSError, subprocess.CalledProcessError):
+        commit = None;
+    return {"date": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+            "platform": platform.platform(), "commit": commit, "repeat": repeat, "seed": seed};
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compares two runs case by case.
+
+    Returns
+    -------
+    List[Tuple[str, float, float, float, bool]]
+        For each case present in both runs, `(name, baseline ns/op, current ns/op, relative change, regression)`,
+        where `regression` is `True` if the case is slower by more than `threshold` (e.g. `0.10` for 10 %).
+    """
+    rows : List[Tuple[str, float, float, float, bool]] = [];
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue;
+        old, new = baseline["results"][name]["ns_per_op"], result["ns_per_op"];
+        change : float = new / old - 1;
+        rows.append((name, old, new, change, change > threshold));
+    return rows;
+
+
+def main(arguments: List[str]) -> int:
+    parser      : argparse.ArgumentParser = argparse.ArgumentParser(prog="python -m zettelkasten_util.benchmarks.suite", description=__doc__.strip().splitlines()[0]);
+    commands    : argparse._SubParsersAction = parser.add_subparsers(dest="command", required=True);
+
+    run_parser  : argparse.ArgumentParser = commands.add_parser("run", help="run the suite");
+    run_parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES);
+    run_parser.add_argument("--repeat", type=int, default=5);
+    run_parser.add_argument("--filter", default="", help="only run the cases whose name contains this string");
+    run_parser.add_argument("--seed", type=int, default=0);
+    run_parser.add_argument("--output", help="JSON file to write (default: standard output)");
+
+    compare_parser : argparse.ArgumentParser = commands.add_parser("compare", help="compare two runs");
+    compare_parser.add_argument("baseline");
+    compare_parser.add_argument("current");
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD);
+
+    options : argparse.Namespace = parser.parse_args(arguments);
+    if options.command == "run":
+        results : Dict[str, Any] = run(options.scales, options.repeat, options.filter, options.seed);
+        text : str = json.dumps(results, indent=2);
+        if options.output:
+            with open(options.output, "w") as file:
+                file.write(text + "\n");
+        else:
+            print(text);
+        return 0;
+
+    with open(options.baseline) as file:
+        baseline : Dict[str, Any] = json.load(file);
+    with open(options.current) as file:
+        current : Dict[str, Any] = json.load(file);
+    rows : List[Tuple[str, float, float, float, bool]] = compare(baseline, current, options.threshold);
+    for name, old, new, change, regression in rows:
+        print(f"{name:<36} {old:12.1f} {new:12.1f} ns/op {change:+8.1%}{'  REGRESSION' if regression else ''}");
+    regressions : int = sum(1 for row in rows if row[4]);
+    print(f"{len(rows)} cases compared, {regressions} regressions (threshold {options.threshold:.0%})");
+    return 1 if regressions else 0;
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]));
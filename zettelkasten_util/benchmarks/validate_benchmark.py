@@ -0,0 +1,35 @@
+"""
+Benchmark for lax and strict (calendar-correct) validation, scalar and batch.
+
+Run from the directory containing the `zettelkasten_util` package:
+
+    python -m zettelkasten_util.benchmarks.validate_benchmark
+"""
+
+import timeit;
+
+from typing import List;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator;
+from zettelkasten_util.benchmarks.decompose_benchmark import sample, bench;
+
+
+if __name__ == "__main__":
+    ids     : List[int] = sample(100_000);
+    strings : List[str] = [str(id) for id in ids];
+    
+    bench("validate (int, lax)",    lambda id: validator.validate(id), ids);
+    bench("validate (int, strict)", lambda id: validator.validate(id, True), ids);
+    bench("validate (str, lax)",    lambda id: validator.validate(id), strings);
+    bench("validate (str, strict)", lambda id: validator.validate(id, True), strings);
+    bench("find_error_code (lax)",    lambda id: validator.find_error_code(id), ids);
+    bench("find_error_code (strict)", lambda id: validator.find_error_code(id, True), ids);
+    
+    try:
+        import numpy;
+    except ImportError:
+        numpy = None;
+    if numpy is not None:
+        array : numpy.ndarray = numpy.array(ids, dtype=numpy.int64);
+        for label, strict in (("validate_many (lax)", False), ("validate_many (strict)", True)):
+            best : float = min(timeit.repeat(lambda: validator.validate_many(array, strict), number=1, repeat=5));
+            print(f"{label:<40} {best / len(array) * 1e9:10.1f} ns/id");
@@ -0,0 +1,233 @@
+"""
+`ZettelkastenArray` module
+Implements the `ZUIDArray` class, a columnar collection of Zettelkasten Unique Identifiers (zUIDs)
+stored as 64-bit integers in an `array('q')` buffer instead of one Python object per zUID.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from array import array;
+from bisect import bisect_left, bisect_right, insort;
+from typing import Iterable, Iterator, TYPE_CHECKING;
+
+from .ZettelkastenUniqueIdentifier import zUID;
+
+if TYPE_CHECKING:
+    import numpy;
+
+
+class ZUIDArray:
+    """
+    Columnar collection of zUIDs backed by an `array('q')`.
+    Indexing and iteration create `zUID` objects on demand; the integers are exported
+    without copying through the buffer protocol (`memoryview(ZUIDArray)` on Python 3.12+,
+    `ZUIDArray.buffer()` or `ZUIDArray.to_numpy()` otherwise).
+    Binary search and sorted insertion expect the array to be sorted;
+    the set operations return sorted arrays without duplicates.
+    """
+    __slots__ = ('_data',);
+
+    def __init__(self, ids: Iterable[int | zUID] = ()) -> None:
+        """
+        Initializes the array with the given identifiers, in order.
+
+        Parameters
+        ----------
+        ids : Iterable[int | zUID]
+            The identifiers to store.
+        """
+        self._data : array = ids._data[:] if isinstance(ids, ZUIDArray) else array('q', map(int, ids));
+
+
+    @staticmethod
+    def from_buffer(buffer) -> "ZUIDArray":
+        """
+        Creates an array from a buffer of native 64-bit integers (e.g. a NumPy `int64` array or `bytes`).
+        The integers are copied once.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            The buffer to read.
+
+        Returns
+        -------
+        ZUIDArray
+            The new array.
+        """
+        out : ZUIDArray = ZUIDArray();
+        out._data.frombytes(memoryview(buffer).cast('B'));
+        return out;
+
+
+    def append(self, id: int | zUID) -> None:
+        """
+        Appends an identifier at the end of the array.
+        """
+        self._data.append(int(id));
+
+
+    def extend(self, ids: Iterable[int | zUID]) -> None:
+        """
+        Appends the given identifiers at the end of the array.
+        """
+        if isinstance(ids, ZUIDArray):
+            self._data.extend(ids._data);
+        else:
+            self._data.extend(map(int, ids));
+
+
+    def insort(self, id: int | zUID) -> None:
+        """
+        Inserts an identifier into the (sorted) array, keeping it sorted.
+        """
+        insort(self._data, int(id));
+
+
+    def sort(self) -> None:
+        """
+        Sorts the array in place.
+        """
+        self._data = array('q', sorted(self._data));
+
+
+    def bisect_left(self, id: int | zUID) -> int:
+        """
+        Returns the position of the first identifier not lower than `id` in the (sorted) array.
+        """
+        return bisect_left(self._data, int(id));
+
+
+    def bisect_right(self, id: int | zUID) -> int:
+        """
+        Returns the position of the first identifier greater than `id` in the (sorted) array.
+        """
+        return bisect_right(self._data, int(id));
+
+
+    def search(self, id: int | zUID) -> int:
+        """
+        Binary searches an identifier in the (sorted) array.
+
+        Parameters
+        ----------
+        id : int | zUID
+            The identifier to look for.
+
+        Returns
+        -------
+        int
+            The position of the identifier, or `-1` if it is not in the array.
+        """
+        id = int(id);
+        position : int = bisect_left(self._data, id);
+        if position < len(self._data) and self._data[position] == id:
+            return position;
+        return -1;
+
+
+    def union(self, other: "ZUIDArray | Iterable[int | zUID]") -> "ZUIDArray":
+        """
+        Returns the sorted identifiers that are in either array.
+        """
+        return ZUIDArray._from_sorted(set(self._data).union(ZUIDArray._ints(other)));
+
+
+    def intersection(self, other: "ZUIDArray | Iterable[int | zUID]") -> "ZUIDArray":
+        """
+        Returns the sorted identifiers that are in both arrays.
+        """
+        return ZUIDArray._from_sorted(set(self._data).intersection(ZUIDArray._ints(other)));
+
+
+    def difference(self, other: "ZUIDArray | Iterable[int | zUID]") -> "ZUIDArray":
+        """
+        Returns the sorted identifiers of this array that are not in the other one.
+        """
+        return ZUIDArray._from_sorted(set(self._data).difference(ZUIDArray._ints(other)));
+
+
+    def buffer(self) -> memoryview:
+        """
+        Returns a zero-copy view (format `q`) of the identifiers.
+        The array cannot grow while the view is alive.
+        """
+        return memoryview(self._data);
+
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """
+        Returns a zero-copy NumPy `int64` view of the identifiers. Requires NumPy.
+        """
+        import numpy;
+
+        return numpy.frombuffer(self._data, dtype=numpy.int64);
+
+
+    @staticmethod
+    def _ints(ids: "ZUIDArray | Iterable[int | zUID]") -> Iterable[int]:
+        return ids._data if isinstance(ids, ZUIDArray) else map(int, ids);
+
+
+    @staticmethod
+    def _from_sorted(ids: Iterable[int]) -> "ZUIDArray":
+        out : ZUIDArray = ZUIDArray();
+        out._data = array('q', sorted(ids));
+        return out;
+
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._data);
+
+
+    def __len__(self) -> int:
+        return len(self._data);
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        return map(zUID, self._data);
+
+
+    def __reversed__(self) -> Iterator[zUID]:
+        return map(zUID, reversed(self._data));
+
+
+    def __getitem__(self, index: int | slice) -> "zUID | ZUIDArray":
+        if isinstance(index, slice):
+            out : ZUIDArray = ZUIDArray();
+            out._data = self._data[index];
+            return out;
+        return zUID(self._data[index]);
+
+
+    def __contains__(self, id: int | zUID) -> bool:
+        return int(id) in self._data;
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ZUIDArray):
+            return self._data == other._data;
+        return NotImplemented;
+
+
+    def __or__(self, other: "ZUIDArray") -> "ZUIDArray":
+        return self.union(other);
+
+
+    def __and__(self, other: "ZUIDArray") -> "ZUIDArray":
+        return self.intersection(other);
+
+
+    def __sub__(self, other: "ZUIDArray") -> "ZUIDArray":
+        return self.difference(other);
+
+
+    def __str__(self) -> str:
+        return str(self._data.tolist());
+
+
+    def __repr__(self) -> str:
+        return f"ZUIDArray({self._data.tolist()})";
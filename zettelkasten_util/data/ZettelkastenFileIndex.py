@@ -0,0 +1,364 @@
+"""
+`ZettelkastenFileIndex` module
+Implements the `ZettelkastenFileIndex` class, a persistent collection of issued Zettelkasten Unique Identifiers (zUIDs):
+a memory-mapped file of sorted 64-bit integers, and a write-ahead tail of recent additions that is compacted into it.
+
+File layout (little-endian):
+
+-   `<path>`: a 32-byte header (magic `ZUIDIDX\\0`, version, flags, count, reserved) followed by `count` sorted, unique `int64`s;
+-   `<path>.wal`: the `int64`s added since the last compaction, in insertion order.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import heapq;
+import mmap;
+import os;
+import struct;
+import sys;
+from array import array;
+from bisect import bisect_left;
+from itertools import islice;
+from typing import BinaryIO, Iterable, Iterator, List, Set, Tuple;
+
+from .ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from .ZettelkastenArray import ZUIDArray;
+from .ZettelkastenIndex import HistoryView;
+from .ZettelkastenFormat import FORMAT_BOUNDS, key_bounds, merge_formats;
+
+
+#   Header of the sorted file: magic, version, flags, count, reserved
+HEADER          : struct.Struct = struct.Struct("<8sIIQQ");
+MAGIC           : bytes = b"ZUIDIDX\0";
+VERSION         : int = 1;
+
+#   A record of the write-ahead tail
+RECORD          : struct.Struct = struct.Struct("<q");
+
+#   Number of integers written at once by `write` and `compact_tail`
+CHUNK_SIZE      : int = 1 << 16;
+
+
+class ZettelkastenFileIndex:
+    """
+    Persistent collection of unique zUIDs, with the interface of `ZettelkastenIndex` used by `ZettelkastenGenerator`.
+
+    Opening an index maps the sorted file without reading it and replays the write-ahead tail, so it takes
+    milliseconds whatever the size of the index. Membership is a binary search of the mapped file plus a set lookup
+    in the tail; additions are appended to the tail file, which is merged into the sorted file by `compact_tail`
+    once it holds `tail_limit` zUIDs. A single process may write to an index at a time.
+
+    The tail is kept in memory in insertion order and only sorted by the first ordered query (`range`, `sorted`,
+    iteration or compaction) after an out-of-order addition, so bulk loads stay linear.
+    Unlike `ZettelkastenIndex`, which iterates in insertion order, the index iterates in chronological order: the
+    insertion order of the compacted zUIDs is not stored (`history` holds the ones added through this object).
+    The sorted file is in integer order; ordered queries merge the runs of the formats it holds by `sort_key`.
+    """
+    __slots__ = ('path', 'tail_limit', 'sync', '_map', '_ids', '_count', '_tail', '_tail_sorted', '_tail_set', '_wal', '_history');
+
+    def __init__(self, path: str | os.PathLike, tail_limit: int = 65536, sync: bool = False) -> None:
+        """
+        Opens the index at `path`, creating an empty one if the file does not exist.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the sorted file; the tail is `<path>.wal`.
+        tail_limit : int
+            The number of zUIDs of the tail that triggers a compaction.
+        sync : bool
+            If `True`, each addition is flushed to disk with `os.fsync` before `add` returns.
+
+        Raises
+        ------
+        zUIDException
+            If the file is not a zUID index.
+        """
+        self.path       : str = os.fspath(path);
+        self.tail_limit : int = tail_limit;
+        self.sync       : bool = sync;
+        self._map       : mmap.mmap | None = None;
+        self._ids       : memoryview | array = array('q');
+        self._count     : int = 0;
+        self._history   : ZUIDArray = ZUIDArray();
+        if not os.path.exists(self.path):
+            ZettelkastenFileIndex.write(self.path, ());
+        self._open();
+
+        #   Replay the tail, dropping a torn last record and the zUIDs already compacted
+        self._wal       : BinaryIO = open(self.path + ".wal", "a+b");
+        self._wal.seek(0);
+        data : bytes = self._wal.read();
+        if len(data) % RECORD.size:
+            data = data[:len(data) - len(data) % RECORD.size];
+            self._wal.truncate(len(data));
+        records : array = array('q');
+        records.frombytes(data);
+        if sys.byteorder != "little":
+            records.byteswap();
+        self._tail_set  : Set[int] = {id for id in records if not self._in_sorted(id)};
+        self._tail      : array = array('q', sorted(self._tail_set));
+        self._tail_sorted : bool = True;
+
+
+    @staticmethod
+    def write(path: str | os.PathLike, ids: Iterable[int | zUID], assume_sorted: bool = False) -> None:
+        """
+        Writes a sorted index file (without tail) holding the given zUIDs, replacing any existing one.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the file.
+        ids : Iterable[int | zUID]
+            The zUIDs to store.
+        assume_sorted : bool
+            If `True`, `ids` must already be sorted and unique; they are then streamed to the file
+            (and copied at once from a `ZUIDArray`) instead of being collected and sorted first.
+        """
+        if not assume_sorted:
+            ids = sorted(set(map(int, ids)));
+        path = os.fspath(path);
+        with open(path + ".tmp", "wb") as file:
+            ZettelkastenFileIndex._write_ids(file, ids);
+            file.flush();
+            os.fsync(file.fileno());
+        os.replace(path + ".tmp", path);
+
+
+    @staticmethod
+    def _write_ids(file: BinaryIO, ids: Iterable[int | zUID]) -> None:
+        """
+        Writes the header and the sorted zUIDs, then the final count in the header.
+        """
+        file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0));
+        count : int = 0;
+        if isinstance(ids, ZUIDArray) and sys.byteorder == "little":
+            file.write(ids.buffer());
+            count = len(ids);
+        else:
+            iterator : Iterator[int] = map(int, ids);
+            while chunk := array('q', islice(iterator, CHUNK_SIZE)):
+                if sys.byteorder != "little":
+                    chunk.byteswap();
+                file.write(chunk);
+                count += len(chunk);
+        file.seek(0);
+        file.write(HEADER.pack(MAGIC, VERSION, 0, count, 0));
+
+
+    def _open(self) -> None:
+        """
+        Maps the sorted file and checks its header.
+        """
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ);
+        magic, version, _, count, _ = HEADER.unpack_from(self._map) if len(self._map) >= HEADER.size else (b"", 0, 0, 0, 0);
+        if magic != MAGIC or version != VERSION or len(self._map) != HEADER.size + count * RECORD.size:
+            self._close_map();
+            raise zUIDException(f"{self.path} is not a zUID index (or is corrupt).");
+        self._count = count;
+        if sys.byteorder == "little":
+            self._ids = memoryview(self._map)[HEADER.size:].cast('q');
+        else:
+            self._ids = array('q', self._map[HEADER.size:]);
+            self._ids.byteswap();
+
+
+    def _close_map(self) -> None:
+        """
+        Releases the mapping of the sorted file.
+        """
+        if isinstance(self._ids, memoryview):
+            self._ids.release();
+        self._ids = array('q');
+        if self._map is not None:
+            self._map.close();
+            self._map = None;
+
+
+    def _in_sorted(self, id: int) -> bool:
+        position : int = bisect_left(self._ids, id);
+        return position < self._count and self._ids[position] == id;
+
+
+    def _sorted_tail(self) -> array:
+        """
+        Returns the tail, sorting it first if an addition came out of order.
+        """
+        if not self._tail_sorted:
+            self._tail = array('q', sorted(self._tail));
+            self._tail_sorted = True;
+        return self._tail;
+
+
+    def add(self, zuid: int | zUID) -> bool:
+        """
+        Adds a zUID to the index, appending it to the tail.
+
+        Parameters
+        ----------
+        zuid : int | zUID
+            The zUID to add.
+
+        Returns
+        -------
+        bool
+            `True` if the zUID was added, `False` if it was already in the index.
+        """
+        return self.add_many((zuid,))[0];
+
+
+    def add_many(self, zuids: Iterable[int | zUID]) -> List[bool]:
+        """
+        Adds zUIDs to the index, flushing the tail once for the whole batch.
+
+        Parameters
+        ----------
+        zuids : Iterable[int | zUID]
+            The zUIDs to add, in order.
+
+        Returns
+        -------
+        List[bool]
+            For each zUID, `True` if it was added, `False` if it was already in the index (or earlier in the batch).
+        """
+        added : List[bool] = [];
+        for zuid in zuids:
+            id : int = int(zuid);
+            if id in self._tail_set or self._in_sorted(id):
+                added.append(False);
+                continue;
+            self._wal.write(RECORD.pack(id));
+            self._tail_set.add(id);
+            if self._tail_sorted and self._tail and id < self._tail[-1]:
+                self._tail_sorted = False;
+            self._tail.append(id);
+            self._history.append(id);
+            added.append(True);
+            if len(self._tail) >= self.tail_limit:
+                self.compact_tail();
+        
+        self._wal.flush();
+        if self.sync:
+            os.fsync(self._wal.fileno());
+        return added;
+
+
+    def compact_tail(self) -> None:
+        """
+        Merges the tail into the sorted file (written next to it, then swapped in) and empties the tail.
+        """
+        if not self._tail:
+            return;
+        self._wal.flush();
+        with open(self.path + ".tmp", "wb") as file:
+            if isinstance(self._ids, memoryview):
+                #   Copies the runs of the mapped file between the tail zUIDs without converting them
+                file.write(HEADER.pack(MAGIC, VERSION, 0, self._count + len(self._tail), 0));
+                previous : int = 0;
+                for id in self._sorted_tail():
+                    position : int = bisect_left(self._ids, id, previous);
+                    file.write(self._ids[previous:position]);
+                    file.write(RECORD.pack(id));
+                    previous = position;
+                file.write(self._ids[previous:]);
+            else:
+                ZettelkastenFileIndex._write_ids(file, heapq.merge(self._ids, self._sorted_tail()));
+            file.flush();
+            os.fsync(file.fileno());
+        self._close_map();
+        os.replace(self.path + ".tmp", self.path);
+        self._open();
+
+        #   A crash before this point only leaves tail records that are already compacted, skipped on replay
+        self._wal.truncate(0);
+        self._wal.flush();
+        self._tail = array('q');
+        self._tail_sorted = True;
+        self._tail_set = set();
+
+
+    @property
+    def history(self) -> HistoryView:
+        """
+        The zUIDs added through this object, in insertion order, as a read-only view.
+        """
+        return HistoryView(self._history);
+
+
+    @property
+    def compact(self) -> bool:
+        """
+        Whether the identifiers are stored as integers (always `True`).
+        """
+        return True;
+
+
+    def _runs(self, bounds: List[Tuple[int, int]]) -> List[Iterable[int]]:
+        """
+        Returns the ascending zUIDs of the sorted file and the tail within each of the integer bounds,
+        skipping the empty ones.
+        """
+        ids     : memoryview | array = self._ids;
+        tail    : array = self._sorted_tail();
+        runs    : List[Iterable[int]] = [];
+        for low, high in bounds:
+            stored  : memoryview | array = ids[bisect_left(ids, low):bisect_left(ids, high)];
+            added   : array = tail[bisect_left(tail, low):bisect_left(tail, high)];
+            if len(stored) and len(added):
+                runs.append(heapq.merge(stored, added));
+            elif len(stored) or len(added):
+                runs.append(stored if len(stored) else added);
+        return runs;
+
+
+    def sorted(self) -> ZUIDArray:
+        """
+        Returns the zUIDs in chronological order (ascending, with the formats interleaved by `sort_key`).
+        """
+        return ZUIDArray(merge_formats(self._runs(FORMAT_BOUNDS)));
+
+
+    def range(self, start: int | zUID, stop: int | zUID) -> ZUIDArray:
+        """
+        Returns the zUIDs `zuid` such that `sort_key(start) <= sort_key(zuid) < sort_key(stop)`, in chronological order
+        (for 12-digit zUIDs, `start <= zuid < stop` in ascending order).
+        """
+        return ZUIDArray(merge_formats(self._runs(key_bounds(start, stop))));
+
+
+    def close(self) -> None:
+        """
+        Closes the files of the index; the tail is kept for the next opening.
+        """
+        self._close_map();
+        self._wal.close();
+
+
+    def __enter__(self) -> "ZettelkastenFileIndex":
+        return self;
+
+
+    def __exit__(self, *args) -> None:
+        self.close();
+
+
+    def __contains__(self, zuid: int | zUID) -> bool:
+        id : int = int(zuid);
+        return id in self._tail_set or self._in_sorted(id);
+
+
+    def __len__(self) -> int:
+        return self._count + len(self._tail);
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        return map(zUID, merge_formats(self._runs(FORMAT_BOUNDS)));
+
+
+    def __repr__(self) -> str:
+        return f"ZettelkastenFileIndex({self.path!r}, sorted={self._count}, tail={len(self._tail)})";
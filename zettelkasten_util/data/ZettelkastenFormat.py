@@ -0,0 +1,208 @@
+"""
+`ZettelkastenFormat` module
+Implements the `ZettelkastenFormat` class, the resolutions of Zettelkasten Unique Identifiers (zUIDs):
+
+-   `MINUTE`: 12 digits, `YYYYMMDDhhmm` (the original format);
+-   `SECOND`: 14 digits, `YYYYMMDDhhmmss`;
+-   `MILLISECOND`: 17 digits, `YYYYMMDDhhmmssfff`.
+
+A finer zUID is the 12-digit zUID of its minute followed by its sub-minute part, so the format of an integer is
+given by its number of digits, and 12-digit zUIDs keep their meaning. Integers of different formats do not
+compare chronologically (every 14-digit integer is larger than every 12-digit one): sort mixed collections
+with `key=sort_key`. In integer order, the zUIDs of each format form one run between its `min_id` and `max_id`,
+which the indexes merge by `sort_key` (see `chronological` and `key_bounds`).
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import heapq;
+from bisect import bisect_left;
+from typing import Any, Dict, Iterable, List, Sequence, Tuple;
+
+
+class ZettelkastenFormat:
+    """
+    `ZettelkastenFormat` class.
+    A resolution of zUIDs: `units` sub-minute steps per minute, written on `digits - 12` extra digits
+    (seconds for `SECOND`, seconds and milliseconds for `MILLISECOND`).
+    """
+    __slots__ = ('name', 'digits', 'units', 'scale', 'min_id', 'max_id');
+
+    def __init__(self, name: str, digits: int, units: int) -> None:
+        """
+        Initializes the format.
+
+        Parameters
+        ----------
+        name : str
+            The name of the format.
+        digits : int
+            The number of digits of its zUIDs.
+        units : int
+            The number of zUIDs per minute.
+        """
+        self.name   : str = name;
+        self.digits : int = digits;
+        self.units  : int = units;
+        self.scale  : int = 10 ** (digits - 12);
+        self.min_id : int = 197001010000 * self.scale;
+        self.max_id : int = 217012312359 * self.scale + units - 1;
+
+
+    def split(self, id: int) -> Tuple[int, int]:
+        """
+        Returns the 12-digit zUID of the minute of a zUID of this format, and its sub-minute part
+        (`0` for `MINUTE`, the second for `SECOND`, `ssfff` for `MILLISECOND`).
+        """
+        return divmod(id, self.scale);
+
+
+    def join(self, minute: int, part: int) -> int:
+        """
+        Returns the zUID of this format from the 12-digit zUID of its minute and its sub-minute part.
+        """
+        return minute * self.scale + part;
+
+
+    def part(self, second: int, microsecond: int) -> int:
+        """
+        Returns the sub-minute part of a moment (e.g. of a `datetime`), truncated to the resolution of this format.
+        """
+        if self.units == 1:
+            return 0;
+        if self.units == 60:
+            return second;
+        return second * 1000 + microsecond // 1000;
+
+
+    def components(self, part: int) -> Tuple[int, ...]:
+        """
+        Returns the components of a sub-minute part: `()`, `(second,)` or `(second, millisecond)`.
+        """
+        if self.units == 1:
+            return ();
+        if self.units == 60:
+            return (part,);
+        return divmod(part, 1000);
+
+
+    @staticmethod
+    def of(id: int) -> "ZettelkastenFormat | None":
+        """
+        Returns the format of an integer from its number of digits, or `None` if it has none of 12, 14 or 17 digits.
+        """
+        if id < 10 ** 12:
+            return MINUTE if id >= 10 ** 11 else None;
+        if id < 10 ** 14:
+            return SECOND if id >= 10 ** 13 else None;
+        return MILLISECOND if 10 ** 16 <= id < 10 ** 17 else None;
+
+
+    @staticmethod
+    def parse(id: Any) -> "Tuple[ZettelkastenFormat, int, int] | None":
+        """
+        Returns the format, the 12-digit minute and the sub-minute part of an integer, a string of digits
+        or an object with an integer `id` (a `zUID`), or `None` if it has none of 12, 14 or 17 digits.
+        Strings are not padded: `"20250214"` has no format.
+        """
+        if id.__class__ is not int:
+            if isinstance(id, str):
+                if not (id.isdigit() and id.isascii()):
+                    return None;
+                id = int(id);
+            elif not isinstance(id, int):
+                id = getattr(id, "id", None);
+                if not isinstance(id, int):
+                    return None;
+        format : ZettelkastenFormat | None = ZettelkastenFormat.of(id);
+        if format is None:
+            return None;
+        return (format, *divmod(id, format.scale));
+
+
+    @staticmethod
+    def parse_fine(id: Any) -> "Tuple[ZettelkastenFormat, int, int] | None":
+        """
+        Like `parse`, but only for zUIDs of a finer format than `MINUTE` (`None` for 12-digit ones).
+        """
+        #   Cheap rejections of 12-digit integers, zUIDs and strings first, as this is called on their fast paths
+        if id.__class__ is str:
+            if len(id) <= 12:
+                return None;
+        else:
+            value : Any = id if id.__class__ is int else getattr(id, "id", None);
+            if value.__class__ is int and value < 10 ** 12:
+                return None;
+        parsed : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse(id);
+        return parsed if parsed is not None and parsed[0] is not MINUTE else None;
+
+
+    def __repr__(self) -> str:
+        return f"ZettelkastenFormat({self.name!r}, {self.digits} digits)";
+
+
+#   The supported formats
+MINUTE          : ZettelkastenFormat = ZettelkastenFormat("minute", 12, 1);
+SECOND          : ZettelkastenFormat = ZettelkastenFormat("second", 14, 60);
+MILLISECOND     : ZettelkastenFormat = ZettelkastenFormat("millisecond", 17, 60_000);
+
+#   Formats by name
+FORMATS         : Dict[str, ZettelkastenFormat] = {format.name: format for format in (MINUTE, SECOND, MILLISECOND)};
+
+#   Digits of the finest format, to which `sort_key` scales every zUID
+FINEST_DIGITS   : int = MILLISECOND.digits;
+
+#   Integer bounds `[min_id, max_id + 1)` of the zUIDs of each format, from the coarsest one
+FORMAT_BOUNDS   : List[Tuple[int, int]] = [(format.min_id, format.max_id + 1) for format in FORMATS.values()];
+
+
+def sort_key(id: Any) -> int:
+    """
+    Exportable function for use in other modules.
+    Returns the zUID (integer, string of digits or `zUID`) scaled to the finest format, so that zUIDs
+    of different formats sort chronologically with `sorted(ids, key=sort_key)` (a minute before its seconds).
+    """
+    id = int(id);
+    format : ZettelkastenFormat | None = ZettelkastenFormat.of(id);
+    return id * 10 ** (FINEST_DIGITS - format.digits) if format is not None else id;
+
+
+def key_bounds(start: Any, stop: Any) -> List[Tuple[int, int]]:
+    """
+    Exportable function for use in other modules.
+    Returns, for each format with such zUIDs, the integer bounds `[low, high)` of its zUIDs whose `sort_key` is
+    at least the one of `start` and less than the one of `stop`, from the coarsest format.
+    """
+    first, last = sort_key(start), sort_key(stop);
+    bounds : List[Tuple[int, int]] = [];
+    for format in FORMATS.values():
+        scale       : int = 10 ** (FINEST_DIGITS - format.digits);
+        low, high   = max(-(-first // scale), format.min_id), min(-(-last // scale), format.max_id + 1);
+        if low < high:
+            bounds.append((low, high));
+    return bounds;
+
+
+def merge_formats(runs: List[Iterable[int]]) -> Iterable[int]:
+    """
+    Exportable function for use in other modules.
+    Merges runs of ascending zUIDs of one format each (from the coarsest format) into chronological order;
+    a single run is returned as it is. At equal `sort_key`, a minute comes before its seconds.
+    """
+    if len(runs) > 1:
+        return heapq.merge(*runs, key=sort_key);
+    return runs[0] if runs else ();
+
+
+def chronological(ids: Sequence[int]) -> Iterable[int]:
+    """
+    Exportable function for use in other modules.
+    Returns zUIDs sorted as integers in chronological order; 12-digit zUIDs only are returned as they are.
+    """
+    if not len(ids) or ids[-1] < SECOND.min_id:
+        return ids;
+    runs : List[Sequence[int]] = [ids[bisect_left(ids, low):bisect_left(ids, high)] for low, high in FORMAT_BOUNDS];
+    return merge_formats([run for run in runs if len(run)]);
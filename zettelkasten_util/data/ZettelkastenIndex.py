@@ -0,0 +1,261 @@
+"""
+`ZettelkastenIndex` module
+Implements the `ZettelkastenIndex` class, the collection of issued Zettelkasten Unique Identifiers (zUIDs).
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from array import array;
+from bisect import bisect_left;
+from itertools import chain;
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple;
+
+from .ZettelkastenUniqueIdentifier import zUID;
+from .ZettelkastenArray import ZUIDArray;
+from .ZettelkastenFormat import chronological, key_bounds, merge_formats;
+
+
+#   Number of out-of-order insertions kept unsorted before they are merged into the sorted run
+TAIL_LIMIT : int = 1024;
+
+
+class HistoryView(Sequence):
+    """
+    Read-only view of the insertion-ordered zUIDs of an index (`history`).
+    Length, indexing and iteration go to the underlying list or `ZUIDArray` without copying it;
+    slices are copies, like slices of a list.
+    """
+    __slots__ = ('_items',);
+
+    def __init__(self, items: List[zUID] | ZUIDArray) -> None:
+        self._items : List[zUID] | ZUIDArray = items;
+
+
+    def __len__(self) -> int:
+        return len(self._items);
+
+
+    def __getitem__(self, index: int | slice) -> "zUID | List[zUID] | ZUIDArray":
+        return self._items[index];
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        return iter(self._items);
+
+
+    def __reversed__(self) -> Iterator[zUID]:
+        return reversed(self._items);
+
+
+    def __contains__(self, zuid: int | zUID) -> bool:
+        return zuid in self._items;
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (HistoryView, list, tuple, ZUIDArray)):
+            return list(self) == list(other);
+        return NotImplemented;
+
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self._items)})";
+
+
+class ZettelkastenIndex:
+    """
+    Collection of unique zUIDs.
+    Iterates in insertion order like a list and keeps the identifiers sorted for ordered iteration and range queries:
+    a sorted run, extended in place by monotonic insertions (the common case), plus a small unsorted tail of the
+    out-of-order insertions, merged into the run when it reaches `TAIL_LIMIT` identifiers or when `sorted` is called.
+    `sorted` and `range` are chronological when the index mixes formats (see `ZettelkastenFormat.chronological`).
+
+    Membership goes through a hash index of the `zUID` objects; in compact mode the identifiers are only stored as
+    integers (a `ZUIDArray` and an `array('q')`, no Python object per zUID), and membership is a binary search of
+    the sorted run plus a scan of the tail.
+    """
+    __slots__ = ('_compact', '_history', '_by_id', '_sorted', '_tail');
+
+    def __init__(self, identifiers: Iterable[zUID] = (), compact: bool = False) -> None:
+        """
+        Initializes the index, adding the given zUIDs in order.
+
+        Parameters
+        ----------
+        identifiers : Iterable[zUID]
+            The zUIDs to add; duplicates are ignored.
+        compact : bool
+            If `True`, stores the identifiers as integers in a `ZUIDArray`.
+        """
+        self._compact       : bool = compact;
+        self._history       : List[zUID] | ZUIDArray = ZUIDArray() if compact else list();
+        self._by_id         : Dict[int, zUID] | None = None if compact else dict();
+
+        #   Sorted run of the identifiers, and the identifiers inserted out of order since the last merge
+        self._sorted        : List[int] | array = array('q') if compact else list();
+        self._tail          : List[int] | array = array('q') if compact else list();
+        for zuid in identifiers:
+            self.add(zuid);
+
+
+    def add(self, zuid: zUID) -> bool:
+        """
+        Adds a zUID to the index.
+
+        Parameters
+        ----------
+        zuid : zUID
+            The zUID to add.
+
+        Returns
+        -------
+        bool
+            `True` if the zUID was added, `False` if it was already in the index.
+        """
+        id : int = zuid.id;
+        if self._compact:
+            if self._contains(id):
+                return False;
+        elif id in self._by_id:
+            return False;
+        else:
+            self._by_id[id] = zuid;
+        self._history.append(zuid);
+
+        #   Monotonic insertions extend the sorted run; the others wait in the tail
+        ids : List[int] | array = self._sorted;
+        if not ids or ids[-1] < id:
+            ids.append(id);
+        else:
+            self._tail.append(id);
+            if len(self._tail) >= TAIL_LIMIT:
+                self._merge();
+        return True;
+
+
+    def add_many(self, zuids: Iterable[zUID]) -> List[bool]:
+        """
+        Adds zUIDs to the index, in order.
+
+        Returns
+        -------
+        List[bool]
+            For each zUID, `True` if it was added, `False` if it was already in the index (or earlier in the batch).
+        """
+        return [self.add(zuid) for zuid in zuids];
+
+
+    @property
+    def compact(self) -> bool:
+        """
+        Whether the identifiers are stored as integers.
+        """
+        return self._compact;
+
+
+    @property
+    def history(self) -> HistoryView:
+        """
+        The zUIDs in insertion order, as a read-only view (changing it cannot desynchronize the index).
+        """
+        return HistoryView(self._history);
+
+
+    def sorted(self) -> List[zUID] | ZUIDArray:
+        """
+        Returns the zUIDs in chronological order (ascending, with the formats interleaved by `sort_key`).
+        """
+        self._merge();
+        return self._lookup(chronological(self._sorted));
+
+
+    def range(self, start: int | zUID, stop: int | zUID) -> List[zUID] | ZUIDArray:
+        """
+        Returns the zUIDs `zuid` such that `sort_key(start) <= sort_key(zuid) < sort_key(stop)`, in chronological order
+        (for 12-digit zUIDs, `start <= zuid < stop` in ascending order).
+        The tail is filtered without being merged, so the cost does not depend on the size of the index.
+
+        Parameters
+        ----------
+        start : int | zUID
+            The inclusive lower bound.
+        stop : int | zUID
+            The exclusive upper bound.
+
+        Returns
+        -------
+        List[zUID] | ZUIDArray
+            The zUIDs in the range.
+        """
+        ids     : List[int] | array = self._sorted;
+        bounds  : List[Tuple[int, int]] = key_bounds(start, stop);
+        runs    : List[List[int] | array] = [];
+
+        #   One run of the sorted identifiers per format
+        for low, high in bounds:
+            first : int = bisect_left(ids, low);
+            run   : List[int] | array = ids[first:bisect_left(ids, high, first)];
+            if run:
+                runs.append(run);
+        tail    : List[int] = [id for id in self._tail if any(low <= id < high for low, high in bounds)];
+        if not tail:
+            return self._lookup(merge_formats(runs));
+        return self._lookup(chronological(sorted(chain(*runs, tail))));
+
+
+    def _contains(self, id: int) -> bool:
+        """
+        Returns `True` if the integer identifier is in the sorted run or in the tail.
+        """
+        ids         : List[int] | array = self._sorted;
+        position    : int = bisect_left(ids, id);
+        return (position < len(ids) and ids[position] == id) or id in self._tail;
+
+
+    def _merge(self) -> None:
+        """
+        Merges the tail into the sorted run (`sorted` finds the two runs and merges them in linear time).
+        """
+        if self._tail:
+            merged : List[int] = sorted(chain(self._sorted, self._tail));
+            self._sorted = array('q', merged) if self._compact else merged;
+            self._tail = array('q') if self._compact else list();
+
+
+    def _lookup(self, ids: Iterable[int]) -> List[zUID] | ZUIDArray:
+        """
+        Returns the zUIDs of the given integer identifiers, as stored by this index.
+        """
+        if self._compact:
+            return ZUIDArray(ids);
+        by_id : Dict[int, zUID] = self._by_id;
+        return [by_id[id] for id in ids];
+
+
+    def __contains__(self, zuid: int | zUID) -> bool:
+        id : int = getattr(zuid, "id", zuid);
+        if self._compact:
+            return id.__class__ is int and self._contains(id);
+        return id in self._by_id;
+
+
+    def __len__(self) -> int:
+        return len(self._history);
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        return iter(self._history);
+
+
+    def __getitem__(self, index: int | slice) -> zUID | List[zUID]:
+        return self._history[index];
+
+
+    def __str__(self) -> str:
+        return str(list(self._history));
+
+
+    def __repr__(self) -> str:
+        return repr(list(self._history));
@@ -0,0 +1,178 @@
+"""
+`ZettelkastenSQLiteIndex` module
+Implements the `ZettelkastenSQLiteIndex` class, a collection of issued Zettelkasten Unique Identifiers (zUIDs)
+stored in a SQLite database (WAL mode), shared by the generators of several processes.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import os;
+import sqlite3;
+from contextlib import contextmanager;
+from typing import Iterable, Iterator, List, Tuple;
+
+from .ZettelkastenUniqueIdentifier import zUID;
+from .ZettelkastenArray import ZUIDArray;
+from .ZettelkastenFormat import FORMAT_BOUNDS, key_bounds, merge_formats;
+
+
+#   `seq` keeps the creation order (`history`), the unique `id` the identifiers
+SCHEMA : str = """
+CREATE TABLE IF NOT EXISTS zuids (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id  INTEGER NOT NULL UNIQUE
+);
+""";
+
+
+class ZettelkastenSQLiteIndex:
+    """
+    Collection of unique zUIDs in a SQLite table, with the interface of `ZettelkastenIndex` used by `ZettelkastenGenerator`.
+
+    Every insertion is a single `INSERT OR IGNORE`, so `add` atomically tells whether the zUID was free even when
+    other processes write to the same database; `add_many` inserts a batch in one transaction.
+    Iteration and `history` follow the creation order of all the writers of the database; `sorted` and `range`
+    query the integer bounds of each format and merge them by `sort_key`, so they are chronological.
+    """
+    __slots__ = ('path', '_connection');
+
+    def __init__(self, path: str | os.PathLike, timeout: float = 30.0) -> None:
+        """
+        Opens (or creates) the database at `path` in WAL mode.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            The path of the database file.
+        timeout : float
+            The number of seconds to wait for the lock of another writer.
+        """
+        self.path           : str = os.fspath(path);
+        self._connection    : sqlite3.Connection = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False);
+        self._connection.execute("PRAGMA journal_mode=WAL");
+        self._connection.execute("PRAGMA synchronous=NORMAL");
+        self._connection.executescript(SCHEMA);
+
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the enclosed statements in one transaction holding the write lock of the database
+        (`BEGIN IMMEDIATE`), committed on success and rolled back on error.
+        """
+        self._connection.execute("BEGIN IMMEDIATE");
+        try:
+            yield self._connection;
+        except BaseException:
+            self._connection.execute("ROLLBACK");
+            raise;
+        self._connection.execute("COMMIT");
+
+
+    def add(self, zuid: int | zUID) -> bool:
+        """
+        Adds a zUID to the index.
+
+        Parameters
+        ----------
+        zuid : int | zUID
+            The zUID to add.
+
+        Returns
+        -------
+        bool
+            `True` if the zUID was added, `False` if it was already in the index.
+        """
+        return self._connection.execute("INSERT OR IGNORE INTO zuids (id) VALUES (?)", (int(zuid),)).rowcount == 1;
+
+
+    def add_many(self, zuids: Iterable[int | zUID]) -> List[bool]:
+        """
+        Adds zUIDs to the index in one transaction.
+
+        Parameters
+        ----------
+        zuids : Iterable[int | zUID]
+            The zUIDs to add, in order.
+
+        Returns
+        -------
+        List[bool]
+            For each zUID, `True` if it was added, `False` if it was already in the index (or earlier in the batch).
+        """
+        with self.transaction() as connection:
+            return [connection.execute("INSERT OR IGNORE INTO zuids (id) VALUES (?)", (int(zuid),)).rowcount == 1 for zuid in zuids];
+
+
+    @property
+    def history(self) -> ZUIDArray:
+        """
+        The zUIDs in creation order.
+        """
+        return ZUIDArray(id for (id,) in self._connection.execute("SELECT id FROM zuids ORDER BY seq"));
+
+
+    @property
+    def compact(self) -> bool:
+        """
+        Whether the identifiers are stored as integers (always `True`).
+        """
+        return True;
+
+
+    def _select(self, bounds: List[Tuple[int, int]]) -> ZUIDArray:
+        """
+        Returns the zUIDs within the integer bounds of each format, merged in chronological order.
+        """
+        runs : List[ZUIDArray] = [ZUIDArray(id for (id,) in self._connection.execute("SELECT id FROM zuids WHERE id >= ? AND id < ? ORDER BY id", bound))
+                                  for bound in bounds];
+        return ZUIDArray(merge_formats([run for run in runs if len(run)]));
+
+
+    def sorted(self) -> ZUIDArray:
+        """
+        Returns the zUIDs in chronological order (ascending, with the formats interleaved by `sort_key`).
+        """
+        return self._select(FORMAT_BOUNDS);
+
+
+    def range(self, start: int | zUID, stop: int | zUID) -> ZUIDArray:
+        """
+        Returns the zUIDs `zuid` such that `sort_key(start) <= sort_key(zuid) < sort_key(stop)`, in chronological order
+        (for 12-digit zUIDs, `start <= zuid < stop` in ascending order).
+        """
+        return self._select(key_bounds(start, stop));
+
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        self._connection.close();
+
+
+    def __enter__(self) -> "ZettelkastenSQLiteIndex":
+        return self;
+
+
+    def __exit__(self, *args) -> None:
+        self.close();
+
+
+    def __contains__(self, zuid: int | zUID) -> bool:
+        return self._connection.execute("SELECT 1 FROM zuids WHERE id = ?", (int(zuid),)).fetchone() is not None;
+
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM zuids").fetchone()[0];
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        return iter(self.history);
+
+
+    def __repr__(self) -> str:
+        return f"ZettelkastenSQLiteIndex({self.path!r}, {len(self)} zUIDs)";
@@ -17,10 +17,18 @@ class zUIDException(Exception):
         
 
 
+#   Flyweight cache used by `zUID.intern`; it keeps its zUIDs alive until `zUID.clear_interned` is called
+_interned : dict = dict();
+
+
 class zUID:
     """
     The `zUID` class for creating a Zettelkasten Unique Identifiers (zUIDs).
+    Instances are immutable and slotted; they compare and hash like their integer identifier,
+    so `zUID(202502141151) == 202502141151`.
     """
+    __slots__ = ('id',);
+    
     def __init__(self, id: int) -> None:
         """
         Initializes the `zUID` object with the given zUID.
@@ -35,7 +43,50 @@ class zUID:
         zUIDException
             If the zUID is not well-formed.
         """
-        self.id = id
+        object.__setattr__(self, 'id', id);
+    
+    
+    @staticmethod
+    def intern(id: int) -> "zUID":
+        """
+        Returns the shared `zUID` object for the given identifier, creating it if needed.
+        Equal identifiers obtained through `intern` are the same object.
+        
+        Parameters
+        ----------
+        id : int
+            The zUID to intern.
+        
+        Returns
+        -------
+        zUID
+            The shared zUID object.
+        """
+        zuid : zUID | None = _interned.get(id);
+        if zuid is None:
+            zuid = zUID(id);
+            _interned[id] = zuid;
+        return zuid;
+    
+    
+    @staticmethod
+    def clear_interned() -> None:
+        """
+        Empties the flyweight cache used by `intern`.
+        """
+        _interned.clear();
+    
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"zUID objects are immutable (cannot set '{name}').");
+    
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"zUID objects are immutable (cannot delete '{name}').");
+    
+    
+    def __reduce__(self):
+        return (zUID, (self.id,));
         
 
     def __str__(self) -> str:
@@ -47,27 +98,51 @@ class zUID:
     
     
     def __eq__(self, other) -> bool:
-        return self.id == other.id;
+        if other.__class__ is zUID:
+            return self.id == other.id;
+        if isinstance(other, int):
+            return self.id == other;
+        return NotImplemented;
     
     
     def __ne__(self, other) -> bool:
-        return self.id != other.id;
+        if other.__class__ is zUID:
+            return self.id != other.id;
+        if isinstance(other, int):
+            return self.id != other;
+        return NotImplemented;
     
     
     def __lt__(self, other) -> bool:
-        return self.id < other.id;
+        if other.__class__ is zUID:
+            return self.id < other.id;
+        if isinstance(other, int):
+            return self.id < other;
+        return NotImplemented;
     
     
     def __le__(self, other) -> bool:
-        return self.id <= other.id;
+        if other.__class__ is zUID:
+            return self.id <= other.id;
+        if isinstance(other, int):
+            return self.id <= other;
+        return NotImplemented;
     
     
     def __gt__(self, other) -> bool:
-        return self.id > other.id;
+        if other.__class__ is zUID:
+            return self.id > other.id;
+        if isinstance(other, int):
+            return self.id > other;
+        return NotImplemented;
     
     
     def __ge__(self, other) -> bool:
-        return self.id >= other.id;
+        if other.__class__ is zUID:
+            return self.id >= other.id;
+        if isinstance(other, int):
+            return self.id >= other;
+        return NotImplemented;
     
     
     def __hash__(self) -> int:
@@ -76,4 +151,4 @@ class zUID:
     
     def __int__(self) -> int:
         return int(self.id);
-    
\ No newline at end of file
+    
@@ -0,0 +1,4 @@
+"""
+`zettelkasten_util.data` package
+The `zUID` class and the collections of issued zUIDs (in memory, memory-mapped file, SQLite).
+"""
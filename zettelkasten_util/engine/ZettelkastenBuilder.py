@@ -9,45 +9,98 @@ Implements the `ZettelkastenBuilder` class for creating a Zettelkasten Unique Id
 """
 
 import datetime;
-from typing import List, Tuple, Any, TypeVar;
-from engine.ZettelkastenValidator import ZettelkastenValidator as validator;
-from data.ZettelkastenUniqueIdentifier import zUID;
+from typing import Callable, Dict, Tuple, Any, TYPE_CHECKING;
+from .ZettelkastenValidator import ZettelkastenValidator as validator, ERROR_MALFORMED, MAX_ID;
+from .ZettelkastenDecomposer import ZettelkastenDecomposer;
+from .ZettelkastenCalendar import ZettelkastenCalendar as calendar;
+from ..data.ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from ..data.ZettelkastenFormat import ZettelkastenFormat, MINUTE;
 
+if TYPE_CHECKING:
+    import numpy;
 
-#   Exception class for Zettelkasten Unique Identifiers (ZUIDs)
-zUIDException = TypeVar("zUIDException");
 
 class ZettelkastenBuilder:
     """
     The `ZettelkastenBuilder` class for creating a Zettelkasten Unique Identifiers (ZUIDs).
+    
+    Every input is first normalized to its integer (see `normalize`), which is then decomposed
+    and validated once by `from_int`. Integers, strings and zUIDs of 14 and 17 digits are built
+    as seconds and milliseconds (see `ZettelkastenFormat`); datetime objects in the given `format`.
     """
     
     @staticmethod
-    def build(id: int | str | datetime.datetime) -> zUID:
+    def build(id: int | str | datetime.datetime | zUID, strict: bool = False, format: ZettelkastenFormat | None = None) -> zUID:
         """
-        Creates a Zettelkasten Unique Identifier (ZUID) from an integer, string or datetime object.
+        Creates a Zettelkasten Unique Identifier (ZUID) from an integer, string, datetime object or ZUID.
         
         Parameters
         ----------
-        id : int | str | datetime
-            The integer, string or datetime object to create the ZUID from.
+        id : int | str | datetime | zUID
+            The integer, string, datetime object or ZUID to create the ZUID from.
+        strict : bool
+            If `True`, rejects days that do not exist in their month (see `ZettelkastenValidator`).
+        format : ZettelkastenFormat | None
+            The format datetime objects are truncated to and short strings are padded to (default `MINUTE`);
+            integers and zUIDs keep their own format.
             
         Returns
         -------
         zUID
             The created ZUID.
+        
+        Raises
+        ------
+        zUIDException
+            If the given argument is not a valid ZUID.
         """
-        if isinstance(id, int):
-            return ZettelkastenBuilder.from_int(id);
-        elif isinstance(id, str):
-            return ZettelkastenBuilder.from_string(id);
-        elif isinstance(id, datetime.datetime):
-            return ZettelkastenBuilder.from_datetime(id);
-        else:
-            raise zUIDException("The given argument is not a valid Zettelkasten Unique Identifier (ZUID).");
+        if format is not None:
+            return ZettelkastenBuilder.from_int(ZettelkastenBuilder.normalize_format(id, format), strict);
+        return ZettelkastenBuilder.from_int(ZettelkastenBuilder.normalize(id), strict);
+    
+    @staticmethod
+    def normalize(id: int | str | datetime.datetime | zUID) -> int:
+        """
+        Returns the integer a ZUID is built from, without validating it: integers as they are,
+        strings right-padded like in `from_string`, datetime objects truncated to the minute and ZUIDs their `id`.
+        
+        Parameters
+        ----------
+        id : int | str | datetime | zUID
+            The value to normalize.
+        
+        Returns
+        -------
+        int
+            The normalized integer.
+        
+        Raises
+        ------
+        zUIDException
+            If the given argument is none of the supported types.
+        """
+        #   Exact types are dispatched with one table lookup, subclasses by their first supported base
+        normalizer : Callable[[Any], int] | None = NORMALIZERS.get(type(id));
+        if normalizer is None:
+            normalizer = next((NORMALIZERS[base] for base in type(id).__mro__ if base in NORMALIZERS), None);
+            if normalizer is None:
+                raise zUIDException("The given argument is not a valid Zettelkasten Unique Identifier (ZUID).");
+        return normalizer(id);
+    
+    @staticmethod
+    def normalize_format(id: int | str | datetime.datetime | zUID, format: ZettelkastenFormat) -> int:
+        """
+        Returns the integer a ZUID is built from in the given format, like `normalize` but with datetime objects
+        truncated to the resolution of `format` and strings right-padded to its number of digits.
+        """
+        if isinstance(id, datetime.datetime):
+            return format.join(calendar.compose(id.year, id.month, id.day, id.hour, id.minute), format.part(id.second, id.microsecond));
+        if isinstance(id, str):
+            return ZettelkastenBuilder.pad_string(id, format.digits);
+        return ZettelkastenBuilder.normalize(id);
     
     @staticmethod
-    def from_int(id: int) -> zUID:
+    def from_int(id: int, strict: bool = False) -> zUID:
         """
         Creates a Zettelkasten Unique Identifier (ZUID) from an integer.
         
@@ -55,20 +108,28 @@ class ZettelkastenBuilder:
         ----------
         id : int
             The integer to create the ZUID from.
+        strict : bool
+            If `True`, rejects days that do not exist in their month.
         
         Returns
         -------
         zUID
             The created ZUID.
         """
-        #   Check for validity of ZUID
-        if validator.validate(id) == True:
+        #   Check for validity of ZUID, decomposing it only once
+        year, month, day, hour, minute = ZettelkastenDecomposer.decompose_int(id);
+        if validator.component_error_code(year, month, day, hour, minute, strict) == 0:
             return zUID(id);
+        #   Integers of a finer format only reach this branch, which keeps the 12-digit path unchanged
+        elif id > MAX_ID and ZettelkastenFormat.of(id) not in (None, MINUTE):
+            if validator.validate_format(id, None, strict):
+                return zUID(id);
+            raise zUIDException("\n".join(validator.find_error(id, strict)));
         else:
-            raise zUIDException("\n".join(validator.find_error(id)));
+            raise zUIDException("\n".join(validator.component_errors(year, month, day, hour, minute, strict)));
         
     @staticmethod
-    def from_string(id: str) -> zUID:
+    def from_string(id: str, strict: bool = False) -> zUID:
         """
         Creates a Zettelkasten Unique Identifier (ZUID) from a string.
         
@@ -76,22 +137,44 @@ class ZettelkastenBuilder:
         ----------
         id : str
             The string to create the ZUID from.
+        strict : bool
+            If `True`, rejects days that do not exist in their month.
         
         Returns
         -------
         zUID
             The created ZUID.
         """
-        #   If the integer is shorter than 12 characters, append zeros to the right
+        return ZettelkastenBuilder.from_int(ZettelkastenBuilder.pad_string(id), strict);
+    
+    @staticmethod
+    def pad_string(id: str, digits: int = 12) -> int:
+        """
+        Returns the integer `from_string` builds a ZUID from: the parsed string,
+        right-padded with zeros when it is shorter than 12 digits (e.g. "20250214" gives 202502140000).
+        
+        Parameters
+        ----------
+        id : str
+            The string to parse.
+        digits : int
+            The number of digits to pad to (14 or 17 for the finer formats of `ZettelkastenFormat`).
+        
+        Returns
+        -------
+        int
+            The padded integer.
+        """
+        #   If the integer is shorter than `digits` characters, append zeros to the right
         id_int : int = int(id);
         
-        if len(str(id_int)) < 12:
-            id_int = id_int * 10 ** (12 - len(str(id_int)));
+        if len(str(id_int)) < digits:
+            id_int = id_int * 10 ** (digits - len(str(id_int)));
         
-        return ZettelkastenBuilder.from_int(id_int);
+        return id_int;
     
     @staticmethod
-    def from_datetime(id: datetime) -> zUID:
+    def from_datetime(id: datetime, strict: bool = False, format: ZettelkastenFormat = MINUTE) -> zUID:
         """
         Creates a Zettelkasten Unique Identifier (ZUID) from a datetime object.
         
@@ -99,14 +182,120 @@ class ZettelkastenBuilder:
         ----------
         id : datetime
             The datetime object to create the ZUID from.
+        strict : bool
+            If `True`, rejects days that do not exist in their month.
+        format : ZettelkastenFormat
+            The resolution the datetime object is truncated to.
         
         Returns
         -------
         zUID
             The created ZUID.
         """
-        return ZettelkastenBuilder.from_int(int(id.strftime("%Y%m%d%H%M")));
+        if format is not MINUTE:
+            return ZettelkastenBuilder.from_int(ZettelkastenBuilder.normalize_format(id, format), strict);
+        return ZettelkastenBuilder.from_int(calendar.compose(id.year, id.month, id.day, id.hour, id.minute), strict);
+    
+    @staticmethod
+    def build_many(ids: Any, strict: bool = False) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Creates Zettelkasten Unique Identifiers (ZUIDs) from an array of integers, strings or `datetime64` values at once.
+        Strings are right-padded with zeros like in `from_string` and `datetime64` values are truncated to the minute.
+        Requires NumPy.
+        
+        Parameters
+        ----------
+        ids : array_like of int | str | datetime64
+            The values to create the ZUIDs from.
+        strict : bool
+            If `True`, rejects days that do not exist in their month.
+        
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The `int64` ZUID values and their `uint8` error codes (see `ZettelkastenValidator.find_error_code`);
+            rows with a non-zero code are not well-formed ZUIDs.
+        """
+        import numpy;
+        
+        ids = numpy.asarray(ids);
+        malformed : numpy.ndarray = numpy.zeros(ids.shape, dtype=bool);
+        
+        if ids.dtype.kind in "iub":
+            values : numpy.ndarray = ids.astype(numpy.int64);
+        elif ids.dtype.kind == "M":
+            values = ZettelkastenBuilder._datetime64_to_int(ids);
+        elif ids.dtype.kind in "US":
+            try:
+                values = ids.astype(numpy.int64);
+            except (ValueError, OverflowError):
+                values, malformed = ZettelkastenBuilder._parse_strings(ids);
+            values = ZettelkastenBuilder._right_pad(values);
+        else:
+            #   Mixed (object) arrays go through the scalar builder
+            values = numpy.zeros(ids.shape, dtype=numpy.int64);
+            for index, id in numpy.ndenumerate(ids):
+                try:
+                    values[index] = ZettelkastenBuilder.build(id, strict).id;
+                except Exception:
+                    malformed[index] = True;
+        
+        codes : numpy.ndarray = validator.find_error_many(values, strict);
+        codes[malformed] = ERROR_MALFORMED;
+        return values, codes;
+    
+    @staticmethod
+    def _right_pad(values: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Vectorized counterpart of the right-padding done by `from_string`.
+        """
+        import numpy;
+        
+        powers : numpy.ndarray = 10 ** numpy.arange(19, dtype=numpy.int64);
+        length : numpy.ndarray = numpy.maximum(numpy.searchsorted(powers, numpy.abs(values), side="right"), 1) + (values < 0);
+        return numpy.where(length < 12, values * powers[numpy.maximum(12 - length, 0)], values);
+    
+    @staticmethod
+    def _parse_strings(ids: "numpy.ndarray") -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Parses a string array element by element, flagging the rows that are not integers.
+        """
+        import numpy;
+        
+        values      : numpy.ndarray = numpy.zeros(ids.shape, dtype=numpy.int64);
+        malformed   : numpy.ndarray = numpy.zeros(ids.shape, dtype=bool);
+        for index, id in numpy.ndenumerate(ids):
+            try:
+                values[index] = int(id);
+            except (ValueError, OverflowError):
+                malformed[index] = True;
+        return values, malformed;
+    
+    @staticmethod
+    def _datetime64_to_int(ids: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Vectorized counterpart of `from_datetime` (`%Y%m%d%H%M`) for `datetime64` arrays.
+        """
+        import numpy;
+        
+        minutes : numpy.ndarray = ids.astype("datetime64[m]");
+        days    : numpy.ndarray = minutes.astype("datetime64[D]");
+        months  : numpy.ndarray = minutes.astype("datetime64[M]");
+        
+        year    : numpy.ndarray = minutes.astype("datetime64[Y]").astype(numpy.int64) + 1970;
+        month   : numpy.ndarray = months.astype(numpy.int64) % 12 + 1;
+        day     : numpy.ndarray = (days - months.astype("datetime64[D]")).astype(numpy.int64) + 1;
+        hour, minute = numpy.divmod((minutes - days).astype(numpy.int64), 60);
+        return (((year * 100 + month) * 100 + day) * 100 + hour) * 100 + minute;
+
 
+#   Normalization of each supported input type, used by `ZettelkastenBuilder.normalize`
+NORMALIZERS : Dict[type, Callable[[Any], int]] = {
+    int                 : int,
+    str                 : ZettelkastenBuilder.pad_string,
+    datetime.datetime   : lambda id: calendar.compose(id.year, id.month, id.day, id.hour, id.minute),
+    zUID                : lambda id: id.id,
+};
 
 def build_from_datetime(id: datetime) -> zUID:
     """
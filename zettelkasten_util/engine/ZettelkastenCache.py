@@ -0,0 +1,192 @@
+"""
+`ZettelkastenCache` module
+Implements the `ZettelkastenCache` class, an opt-in bounded LRU cache in front of
+`ZettelkastenBuilder.build` and `ZettelkastenValidator.validate`.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from collections import OrderedDict;
+from datetime import datetime;
+from threading import Lock;
+from typing import Any, Callable, Dict, Hashable, NamedTuple;
+
+from ..data.ZettelkastenUniqueIdentifier import zUID;
+from .ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from .ZettelkastenValidator import ZettelkastenValidator as validator;
+from .ZettelkastenCalendar import ZettelkastenCalendar as calendar;
+
+
+#   Marks a missing entry (`None` is a valid cached value)
+_MISSING : object = object();
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters of a `LRUCache`.
+    """
+    hits        : int;
+    misses      : int;
+    evictions   : int;
+    size        : int;
+    maxsize     : int;
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups answered from the cache (0.0 when there was none).
+        """
+        lookups : int = self.hits + self.misses;
+        return self.hits / lookups if lookups else 0.0;
+
+
+class LRUCache:
+    """
+    Thread-safe mapping of at most `maxsize` entries, evicting the least recently used one.
+    """
+    __slots__ = ('maxsize', '_entries', '_lock', '_hits', '_misses', '_evictions');
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initializes an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries; must be positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("The size of a LRUCache must be positive.");
+        self.maxsize    : int = maxsize;
+        self._entries   : OrderedDict = OrderedDict();
+        self._lock      : Lock = Lock();
+        self._hits      : int = 0;
+        self._misses    : int = 0;
+        self._evictions : int = 0;
+
+
+    def get(self, key: Hashable, compute: Callable[..., Any], *args: Any) -> Any:
+        """
+        Returns the cached value of `key`, or computes, stores and returns it.
+        The computation runs outside of the lock; exceptions are not cached.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look up.
+        compute : Callable[..., Any]
+            Computes the value on a miss, called with `args`.
+
+        Returns
+        -------
+        Any
+            The value of `key`.
+        """
+        with self._lock:
+            value : Any = self._entries.get(key, _MISSING);
+            if value is not _MISSING:
+                self._entries.move_to_end(key);
+                self._hits += 1;
+                return value;
+            self._misses += 1;
+
+        value = compute(*args);
+
+        with self._lock:
+            self._entries[key] = value;
+            self._entries.move_to_end(key);
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False);
+                self._evictions += 1;
+        return value;
+
+
+    def stats(self) -> CacheStats:
+        """
+        Returns the hit, miss and eviction counters and the current size.
+        """
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self.maxsize);
+
+
+    def clear(self) -> None:
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock:
+            self._entries.clear();
+            self._hits = self._misses = self._evictions = 0;
+
+
+class ZettelkastenCache:
+    """
+    Memoizes `ZettelkastenBuilder.build` and `ZettelkastenValidator.validate` in two bounded LRU caches.
+
+    Builds are keyed on the integer the builder validates (`ZettelkastenBuilder.normalize`):
+    strings are right-padded and datetimes are reduced to their minute, so `"20250214"`, `202502140000` and
+    `datetime(2025, 2, 14)` share one entry. Validations are keyed on the input itself
+    (datetimes and zUIDs on their integer), since `validate("20250214")` is `False` while
+    `validate(202502140000)` is `True`. Failed builds are not cached.
+    """
+    __slots__ = ('strict', 'builds', 'validations');
+
+    def __init__(self, maxsize: int = 4096, strict: bool = False) -> None:
+        """
+        Initializes the caches.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries of each cache.
+        strict : bool
+            The validation mode (see `ZettelkastenValidator`) used by both caches.
+        """
+        self.strict         : bool = strict;
+        self.builds         : LRUCache = LRUCache(maxsize);
+        self.validations    : LRUCache = LRUCache(maxsize);
+
+
+    def build(self, id: int | str | datetime | zUID) -> zUID:
+        """
+        Cached `ZettelkastenBuilder.build`.
+
+        Raises
+        ------
+        zUIDException
+            If the given argument is not a valid ZUID (not cached).
+        """
+        key : int = builder.normalize(id);
+        return self.builds.get(key, builder.from_int, key, self.strict);
+
+
+    def validate(self, id: int | str | datetime | zUID) -> bool:
+        """
+        Cached `ZettelkastenValidator.validate`.
+        """
+        if isinstance(id, (int, str)):
+            key : int | str = id;
+        elif isinstance(id, datetime):
+            key = calendar.compose(id.year, id.month, id.day, id.hour, id.minute);
+        elif isinstance(id, zUID):
+            key = id.id;
+        else:
+            return validator.validate(id, self.strict);
+        return self.validations.get(key, validator.validate, id, self.strict);
+
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """
+        Returns the counters of the `build` and `validate` caches.
+        """
+        return {"build": self.builds.stats(), "validate": self.validations.stats()};
+
+
+    def clear(self) -> None:
+        """
+        Empties both caches and resets their counters.
+        """
+        self.builds.clear();
+        self.validations.clear();
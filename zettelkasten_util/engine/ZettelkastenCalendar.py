@@ -0,0 +1,241 @@
+"""
+`ZettelkastenCalendar` module
+Implements the `ZettelkastenCalendar` class, integer calendar arithmetic for Zettelkasten Unique Identifiers (ZUIDs).
+Converts (year, month, day, hour, minute) components to and from the number of minutes since 1970-01-01 00:00
+without creating `datetime` objects.
+`to_ordinal` and `from_ordinal` are the bijection between the 12-digit ZUIDs and their minute ordinals, backed by
+precomputed tables of the first day of every month and year of the supported span.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from array import array;
+from typing import Tuple;
+
+
+#   Minutes in a day
+MINUTES_PER_DAY : int = 1440;
+
+#   `year * 100 + month` of the first and last months of the supported span (1970-01 .. 2170-12)
+FIRST_MONTH : int = 197001;
+LAST_MONTH  : int = 217012;
+
+class ZettelkastenCalendar:
+    """
+    Static methods for proleptic Gregorian calendar arithmetic on ZUID components.
+    The conversions only use arithmetic operators, so they also work element-wise on NumPy integer arrays.
+    """
+    @staticmethod
+    def to_minutes(year: int, month: int, day: int, hour: int, minute: int) -> int:
+        """
+        Returns the number of minutes between 1970-01-01 00:00 and the given moment.
+
+        Parameters
+        ----------
+        year, month, day, hour, minute : int
+            The components of the moment.
+
+        Returns
+        -------
+        int
+            The number of minutes since 1970-01-01 00:00 (negative before it).
+        """
+        return ZettelkastenCalendar.to_days(year, month, day) * MINUTES_PER_DAY + hour * 60 + minute;
+
+    @staticmethod
+    def to_minutes_checked(year: int, month: int, day: int, hour: int, minute: int) -> int:
+        """
+        Same as `to_minutes`, for scalar components that must name an existing moment.
+
+        Raises
+        ------
+        ValueError
+            If the date does not exist (e.g. 2025-02-31) or the time is not between 00:00 and 23:59.
+        """
+        minutes : int = ZettelkastenCalendar.to_minutes(year, month, day, hour, minute);
+        if not (0 <= hour <= 23 and 0 <= minute <= 59) or ZettelkastenCalendar.from_minutes(minutes)[:3] != (year, month, day):
+            raise ValueError(f"{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d} is not a moment of the calendar.");
+        return minutes;
+
+    @staticmethod
+    def from_minutes(minutes: int) -> Tuple[int, int, int, int, int]:
+        """
+        Returns the components of the moment `minutes` minutes after 1970-01-01 00:00.
+
+        Parameters
+        ----------
+        minutes : int
+            The number of minutes since 1970-01-01 00:00.
+
+        Returns
+        -------
+        Tuple[int, int, int, int, int]
+            A tuple containing the year, month, day, hour, and minute components of the moment.
+        """
+        days, minute_of_day = divmod(minutes, MINUTES_PER_DAY);
+        hour, minute = divmod(minute_of_day, 60);
+        return (*ZettelkastenCalendar.from_days(days), hour, minute);
+
+    @staticmethod
+    def to_days(year: int, month: int, day: int) -> int:
+        """
+        Returns the number of days between 1970-01-01 and the given date
+        (H. Hinnant's `days_from_civil`, on 400-year eras starting on March 1st).
+        """
+        era, year_of_era = divmod(year - (month <= 2), 400);
+        day_of_year : int = (153 * ((month + 9) % 12) + 2) // 5 + day - 1;
+        day_of_era  : int = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year;
+        return era * 146097 + day_of_era - 719468;
+
+    @staticmethod
+    def from_days(days: int) -> Tuple[int, int, int]:
+        """
+        Returns the (year, month, day) date `days` days after 1970-01-01 (inverse of `to_days`).
+        """
+        era, day_of_era = divmod(days + 719468, 146097);
+        year_of_era : int = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365;
+        day_of_year : int = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100);
+        shifted     : int = (5 * day_of_year + 2) // 153;
+        day         : int = day_of_year - (153 * shifted + 2) // 5 + 1;
+        month       : int = (shifted + 2) % 12 + 1;
+        return era * 400 + year_of_era + (month <= 2), month, day;
+
+    @staticmethod
+    def days_in_month(year: int, month: int) -> int:
+        """
+        Returns the number of days of the given month (proleptic Gregorian calendar).
+        """
+        if 1970 <= year <= 2170 and 1 <= month <= 12:
+            return MONTH_LENGTHS[year * 100 + month - FIRST_MONTH];
+        next_year, next_month = divmod(year * 12 + month, 12);
+        return ZettelkastenCalendar.to_days(next_year, next_month + 1, 1) - ZettelkastenCalendar.to_days(year, month, 1);
+
+    @staticmethod
+    def compose(year: int, month: int, day: int, hour: int, minute: int) -> int:
+        """
+        Returns the 12-digit integer ZUID of the given components (inverse of `ZettelkastenDecomposer.decompose_int`).
+        """
+        return (((year * 100 + month) * 100 + day) * 100 + hour) * 100 + minute;
+
+    @staticmethod
+    def to_ordinal(id: int) -> int:
+        """
+        Returns the minute ordinal of a 12-digit integer ZUID: the number of minutes between 1970-01-01 00:00 and it,
+        so that 197001010000 is 0 and consecutive ZUIDs have consecutive ordinals.
+        Uses the table of the first days of the months instead of calendar arithmetic.
+
+        Parameters
+        ----------
+        id : int
+            The 12-digit integer ZUID.
+
+        Returns
+        -------
+        int
+            The minute ordinal, between 0 and `MAX_MINUTES`.
+
+        Raises
+        ------
+        ValueError
+            If the ZUID is not a moment of the calendar (e.g. 202502310000) or is out of 1970-01-01 .. 2170-12-31.
+        """
+        months, rest    = divmod(id, 1000000);
+        day, time       = divmod(rest, 10000);
+        hour, minute    = divmod(time, 100);
+        index   : int = months - FIRST_MONTH;
+        if not (0 <= index < len(MONTH_LENGTHS) and 1 <= day <= MONTH_LENGTHS[index] and hour <= 23 and minute <= 59):
+            raise ValueError(f"{id} is not a moment of the calendar.");
+        return (MONTH_STARTS[index] + day - 1) * MINUTES_PER_DAY + hour * 60 + minute;
+
+    @staticmethod
+    def from_ordinal(ordinal: int) -> int:
+        """
+        Returns the 12-digit integer ZUID of a minute ordinal (inverse of `to_ordinal`).
+        The year and the month are found with one lookup and at most one correction each in the tables
+        of the first days of the years and of the months.
+
+        Parameters
+        ----------
+        ordinal : int
+            The number of minutes since 1970-01-01 00:00, between 0 and `MAX_MINUTES`.
+
+        Returns
+        -------
+        int
+            The 12-digit integer ZUID.
+
+        Raises
+        ------
+        ValueError
+            If the ordinal falls outside of 1970-01-01 00:00 .. 2170-12-31 23:59.
+        """
+        if not 0 <= ordinal <= MAX_MINUTES:
+            raise ValueError(f"{ordinal} is not the ordinal of a minute between 1970-01-01 00:00 and 2170-12-31 23:59.");
+        days, time  = divmod(ordinal, MINUTES_PER_DAY);
+
+        #   `days // 365` overshoots the year by at most one (there are fewer than 365 leap days in the span)
+        year        : int = days // 365;
+        if days < YEAR_STARTS[year]:
+            year -= 1;
+        day_of_year : int = days - YEAR_STARTS[year];
+
+        #   Likewise, `day_of_year // 32` is the month or the one before it
+        starts      : Tuple[int, ...] = YEAR_MONTH_STARTS[YEAR_STARTS[year + 1] - YEAR_STARTS[year] - 365];
+        month       : int = day_of_year // 32;
+        if day_of_year >= starts[month + 1]:
+            month += 1;
+        hour, minute = divmod(time, 60);
+        return ((((1970 + year) * 100 + month + 1) * 100 + day_of_year - starts[month] + 1) * 100 + hour) * 100 + minute;
+
+
+def _month_lengths() -> bytes:
+    """
+    Builds the days-in-month table of the supported span, indexed by `year * 100 + month - FIRST_MONTH`.
+    Positions that are not months (`month` 0 or 13..99) hold 0.
+    """
+    table : bytearray = bytearray(LAST_MONTH - FIRST_MONTH + 1);
+    for year in range(1970, 2171):
+        for month in range(1, 13):
+            next_year, next_month = divmod(year * 12 + month, 12);
+            table[year * 100 + month - FIRST_MONTH] = (ZettelkastenCalendar.to_days(next_year, next_month + 1, 1)
+                                                       - ZettelkastenCalendar.to_days(year, month, 1));
+    return bytes(table);
+
+#   Days-in-month lookup table (see `_month_lengths`)
+MONTH_LENGTHS : bytes = _month_lengths();
+
+#   Days since 1970-01-01 of the first day of each month, indexed like `MONTH_LENGTHS` (0 for positions that are not months)
+MONTH_STARTS : array = array('l', (ZettelkastenCalendar.to_days(*divmod(FIRST_MONTH + index, 100), 1) if length else 0
+                                   for index, length in enumerate(MONTH_LENGTHS)));
+
+#   Days since 1970-01-01 of the first day of each year of 1970 .. 2171 (2171 closes the last year)
+YEAR_STARTS : array = array('l', (ZettelkastenCalendar.to_days(year, 1, 1) for year in range(1970, 2172)));
+
+#   Days between the first of January and the first day of each month (and of the next year), in common and leap years
+YEAR_MONTH_STARTS : Tuple[Tuple[int, ...], Tuple[int, ...]] = (
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365),
+    (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366),
+);
+
+#   Minutes since 1970-01-01 00:00 of the first and last well-formed ZUIDs (1970-01-01 00:00 .. 2170-12-31 23:59)
+MIN_MINUTES : int = ZettelkastenCalendar.to_minutes(1970, 1, 1, 0, 0);
+MAX_MINUTES : int = ZettelkastenCalendar.to_minutes(2170, 12, 31, 23, 59);
+
+
+def to_ordinal(id: int) -> int:
+    """
+    Exportable function for use in other modules.
+    Returns the minute ordinal (minutes since 1970-01-01 00:00) of a 12-digit integer ZUID.
+    """
+    return ZettelkastenCalendar.to_ordinal(id);
+
+
+def from_ordinal(ordinal: int) -> int:
+    """
+    Exportable function for use in other modules.
+    Returns the 12-digit integer ZUID of a minute ordinal.
+    """
+    return ZettelkastenCalendar.from_ordinal(ordinal);
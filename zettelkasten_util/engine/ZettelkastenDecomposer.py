@@ -9,11 +9,18 @@ Implements the `ZettelkastenDecomposer` class for decomposing a Zettelkasten Uni
 @date           2025-02-13
 """
 
-from typing import Tuple, TypeVar;
+from typing import Callable, Dict, Tuple, Any, TYPE_CHECKING;
 from datetime import datetime;
 
-#   Zettelkasten Unique Identifier
-zUID = TypeVar("zUID");
+#   Zettelkasten Unique Identifier and its resolutions
+from ..data.ZettelkastenUniqueIdentifier import zUID;
+from ..data.ZettelkastenFormat import ZettelkastenFormat, MINUTE;
+
+if TYPE_CHECKING:
+    import numpy;
+
+#   Field layout of the structured arrays returned by `decompose_many` (NumPy dtype specification)
+COMPONENTS_DTYPE = [("year", "<i8"), ("month", "<i1"), ("day", "<i1"), ("hour", "<i1"), ("minute", "<i1")];
 
 class ZettelkastenDecomposer:
     @staticmethod
@@ -31,22 +38,84 @@ class ZettelkastenDecomposer:
         Tuple[int, int, int, int, int]
             A tuple containing the year, month, day, hour, and minute components of the ZUID.
         """
+        #   Exact types are dispatched with one table lookup
+        decomposer : Callable[[Any], Tuple[int, int, int, int, int]] | None = DECOMPOSERS.get(type(id));
+        if decomposer is not None:
+            return decomposer(id);
+        
+        #   Subclasses, and objects carrying an integer `id`
         if isinstance(id, int):
             return ZettelkastenDecomposer.decompose_int(id);
         elif isinstance(id, str):
             return ZettelkastenDecomposer.decompose_string(id);
         elif isinstance(id, datetime):
             return ZettelkastenDecomposer.decompose_datetime(id);
-        else:
-            try:
-                return ZettelkastenDecomposer.decompose_int(id.id);
-            except:
-                return None;
+        elif isinstance(getattr(id, "id", None), int):
+            return ZettelkastenDecomposer.decompose_int(id.id);
+        return None;
         
     @staticmethod
     def decompose_int(id: int) -> Tuple[int, int, int, int, int]:
         """
         Decomposes a Zettelkasten Unique Identifier (ZUID) into its components.
+        Uses integer arithmetic only (`divmod` by 100), so no temporary strings are created.
+        
+        Parameters
+        ----------
+        id : int
+            The ZUID to decompose.
+            
+        Returns
+        -------
+        Tuple[int, int, int, int, int]
+            A tuple containing the year, month, day, hour, and minute components of the ZUID.
+        """
+        rest, minute    = divmod(id, 100);
+        rest, hour      = divmod(rest, 100);
+        rest, day       = divmod(rest, 100);
+        year, month     = divmod(rest, 100);
+        return year, month, day, hour, minute;
+    
+    @staticmethod
+    def decompose_format(id: int | str | datetime | zUID, format: ZettelkastenFormat | None = None) -> Tuple[int, ...]:
+        """
+        Decomposes a Zettelkasten Unique Identifier (ZUID) of any format (see `ZettelkastenFormat`) into its components,
+        down to its resolution: `(year, month, day, hour, minute)`, then `second` for `SECOND` and `second, millisecond`
+        for `MILLISECOND`. The format of integers, strings and zUIDs is given by their number of digits.
+        
+        Parameters
+        ----------
+        id : int | str | datetime | "zUID"
+            The ZUID to decompose; strings are not padded.
+        format : ZettelkastenFormat | None
+            The format of datetime objects (default `MINUTE`); for other inputs, the format they must have.
+            
+        Returns
+        -------
+        Tuple[int, ...]
+            The 5, 6 or 7 components of the ZUID.
+        
+        Raises
+        ------
+        ValueError
+            If the ZUID has none of the formats, or not the given one.
+        """
+        if isinstance(id, datetime):
+            format = format or MINUTE;
+            return ZettelkastenDecomposer.decompose_datetime(id) + format.components(format.part(id.second, id.microsecond));
+        
+        parsed : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse(id);
+        if parsed is None or (format is not None and parsed[0] is not format):
+            raise ValueError(f"{id!r} is not a zUID of {'any format' if format is None else f'the {format.name} format'}.");
+        format, minute, part = parsed;
+        return ZettelkastenDecomposer.decompose_int(minute) + format.components(part);
+    
+    @staticmethod
+    def decompose_int_string(id: int) -> Tuple[int, int, int, int, int]:
+        """
+        Decomposes a Zettelkasten Unique Identifier (ZUID) into its components by slicing its decimal string.
+        This is the original (1.0) implementation of `decompose_int`, kept for reference and benchmarking;
+        both agree on every 12-digit integer.
         
         Parameters
         ----------
@@ -94,6 +163,49 @@ class ZettelkastenDecomposer:
         """
         return id.year, id.month, id.day, id.hour, id.minute;
     
+    @staticmethod
+    def decompose_many(ids: Any, columns: bool = False) -> "numpy.ndarray | Tuple[numpy.ndarray, ...]":
+        """
+        Decomposes an array of integer Zettelkasten Unique Identifiers (ZUIDs) into their components at once.
+        Requires NumPy.
+        
+        Parameters
+        ----------
+        ids : array_like of int
+            The ZUIDs to decompose.
+        columns : bool
+            If `True`, returns five component arrays instead of a structured array.
+            
+        Returns
+        -------
+        numpy.ndarray | Tuple[numpy.ndarray, ...]
+            A structured array with `year`, `month`, `day`, `hour` and `minute` fields,
+            or the tuple `(year, month, day, hour, minute)` of `int64` arrays if `columns` is set.
+        """
+        import numpy;
+        
+        ids = numpy.asarray(ids, dtype=numpy.int64);
+        rest, minute    = numpy.divmod(ids, 100);
+        rest, hour      = numpy.divmod(rest, 100);
+        rest, day       = numpy.divmod(rest, 100);
+        year, month     = numpy.divmod(rest, 100);
+        
+        if columns:
+            return year, month, day, hour, minute;
+        
+        out : numpy.ndarray = numpy.empty(ids.shape, dtype=COMPONENTS_DTYPE);
+        out["year"], out["month"], out["day"], out["hour"], out["minute"] = year, month, day, hour, minute;
+        return out;
+
+
+#   Decomposition method of each exact input type, used by `ZettelkastenDecomposer.decompose`
+DECOMPOSERS : Dict[type, Callable[[Any], Tuple[int, int, int, int, int]]] = {
+    int         : ZettelkastenDecomposer.decompose_int,
+    str         : ZettelkastenDecomposer.decompose_string,
+    datetime    : ZettelkastenDecomposer.decompose_datetime,
+    zUID        : lambda id: ZettelkastenDecomposer.decompose_int(id.id),
+};
+
 def decompose(id: int | str | datetime | zUID) -> Tuple[int, int, int, int, int]:
     """
     Decomposes a Zettelkasten Unique Identifier (ZUID) into its components.
@@ -8,23 +8,63 @@ Static methods for validating Zettelkasten Unique Identifiers (ZUIDs).
 @date           2025-02-13
 """
 
-from typing import Tuple, List, TypeVar;
+from typing import Tuple, List, Dict, TypeVar, Any, TYPE_CHECKING;
 from datetime import datetime;
 
 
 #   `decompose(id: int | str | datetime)` export method from the `ZettelkastenDecomposer` module
-from engine.ZettelkastenDecomposer import decompose;
+from .ZettelkastenDecomposer import decompose, ZettelkastenDecomposer;
+
+#   Days-in-month lookup table of the `ZettelkastenCalendar` module, used by strict validation
+from .ZettelkastenCalendar import MONTH_LENGTHS, FIRST_MONTH;
+
+#   Resolutions of ZUIDs: 12-digit minutes, 14-digit seconds and 17-digit milliseconds
+from ..data.ZettelkastenFormat import ZettelkastenFormat, SECOND;
+
+if TYPE_CHECKING:
+    import numpy;
 
 
 #   Zettelkasten Unique Identifier
 zUID = TypeVar("zUID");
 
+#   Smallest and largest integers that can be well-formed 12-digit ZUIDs (1970-01-01 00:00 .. 2170-12-31 23:59)
+MIN_ID : int = 197001010000;
+MAX_ID : int = 217012312359;
+
+#   Error codes (bit flags) returned by `find_error_code` and `find_error_many`; `0` means well-formed
+ERROR_YEAR      : int = 1;
+ERROR_MONTH     : int = 2;
+ERROR_DAY       : int = 4;
+ERROR_HOUR      : int = 8;
+ERROR_MINUTE    : int = 16;
+ERROR_MALFORMED : int = 32;
+ERROR_SECOND    : int = 64;
+
+#   Messages reported by `find_error` for each component error code
+ERROR_MESSAGES  : Dict[int, str] = {
+    ERROR_YEAR      : "Year {} is not between 1970 and 2170.",
+    ERROR_MONTH     : "Month {} is not between 1 and 12.",
+    ERROR_DAY       : "Day {} is not between 1 and 31.",
+    ERROR_HOUR      : "Hour {} is not between 0 and 23.",
+    ERROR_MINUTE    : "Minute {} is not between 0 and 59.",
+};
+
+#   Message reported by `find_error` for the second of a ZUID of a finer format (see `ZettelkastenFormat`)
+ERROR_SECOND_MESSAGE : str = "Second {} is not between 0 and 59.";
+
+#   Message reported by `find_error` in strict mode for a day past the end of its month
+ERROR_DAY_IN_MONTH_MESSAGE : str = "Day {} is not between 1 and {}.";
+
 class ZettelkastenValidator:
     """
     Static methods for validating Zettelkasten Unique Identifiers (ZUIDs).
+    
+    By default (lax mode) any day between 1 and 31 is accepted; in strict mode the day must exist
+    in its month (e.g. 2025-02-29 and 2025-04-31 are rejected), checked against a precomputed table.
     """
     @staticmethod
-    def validate(id: int | str | datetime | zUID) -> bool:
+    def validate(id: int | str | datetime | zUID, strict: bool = False) -> bool:
         """
         Validates a Zettelkasten Unique Identifier (ZUID) by checking if it is well-formed.
         
@@ -32,45 +72,218 @@ class ZettelkastenValidator:
         ----------
         id : int | str | datetime | "zUID"
             The ZUID to validate.
+        strict : bool
+            If `True`, also checks that the day exists in its month.
             
         Returns
         -------
         bool
             `True` if the ZUID is well-formed, `False` otherwise.
         """
+        if isinstance(id, int):
+            #   Integers outside of the 12-digit range are rejected without decomposing them,
+            #   unless they have the 14 or 17 digits of a finer format
+            if not MIN_ID <= id <= MAX_ID:
+                return id >= SECOND.min_id and ZettelkastenValidator.validate_format(id, None, strict);
+            
+            #   In range, the table lookup checks year, month and day at once (non-months have 0 days)
+            if strict:
+                rest, minute    = divmod(id, 100);
+                rest, hour      = divmod(rest, 100);
+                months, day     = divmod(rest, 100);
+                return 1 <= day <= MONTH_LENGTHS[months - FIRST_MONTH] and hour <= 23 and minute <= 59;
+        elif isinstance(id, str) and len(id) > 12:
+            return ZettelkastenValidator.validate_format(id, None, strict);
+        
         try:
             year, month, day, hour, minute = decompose(id);
             
-            if ZettelkastenValidator.validate_year(year) and ZettelkastenValidator.validate_month(month) and ZettelkastenValidator.validate_day(day) and ZettelkastenValidator.validate_hour(hour) and ZettelkastenValidator.validate_minute(minute):
-                return True;
+            if strict:
+                valid : bool = (1970 <= year <= 2170 and 1 <= month <= 12 and 1 <= day <= MONTH_LENGTHS[year * 100 + month - FIRST_MONTH]
+                                and 0 <= hour <= 23 and 0 <= minute <= 59);
             else:
-                return False;
+                valid = (ZettelkastenValidator.validate_year(year) and ZettelkastenValidator.validate_month(month) and ZettelkastenValidator.validate_day(day)
+                         and ZettelkastenValidator.validate_hour(hour) and ZettelkastenValidator.validate_minute(minute));
         except:
+            valid = False;
+        
+        #   A `zUID` of a finer format fails as a 12-digit one (integers are handled above)
+        return valid or (not isinstance(id, int) and ZettelkastenValidator.validate_format(id, None, strict));
+    
+    @staticmethod
+    def validate_format(id: int | str | zUID, format: ZettelkastenFormat | None = None, strict: bool = False) -> bool:
+        """
+        Validates a Zettelkasten Unique Identifier (ZUID) of any format (see `ZettelkastenFormat`):
+        its minute must be a well-formed 12-digit ZUID and its second between 0 and 59.
+        
+        Parameters
+        ----------
+        id : int | str | "zUID"
+            The ZUID to validate; strings are not padded.
+        format : ZettelkastenFormat | None
+            If given, the ZUID must also have this format.
+        strict : bool
+            If `True`, also checks that the day exists in its month.
+            
+        Returns
+        -------
+        bool
+            `True` if the ZUID is well-formed, `False` otherwise.
+        """
+        parsed : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse(id);
+        if parsed is None or (format is not None and parsed[0] is not format):
             return False;
+        format, minute, part = parsed;
+        return part < format.units and ZettelkastenValidator.validate(minute, strict);
         
     @staticmethod
-    def find_error(id: int | str | datetime | zUID) -> List[str]:
+    def find_error(id: int | str | datetime | zUID, strict: bool = False) -> List[str]:
         try:
+            fine : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse_fine(id);
+            if fine is not None:
+                format, id, part = fine;
             year, month, day, hour, minute = decompose(id);
-            err = [];
-            
-            if not ZettelkastenValidator.validate_year(year):
-                err.append(f"Year {year} is not between 1970 and 2170.");
-            if not ZettelkastenValidator.validate_month(month):
-                err.append(f"Month {month} is not between 1 and 12.");
-            if not ZettelkastenValidator.validate_day(day):
-                err.append(f"Day {day} is not between 1 and 31.");
-            if not ZettelkastenValidator.validate_hour(hour):
-                err.append(f"Hour {hour} is not between 0 and 23.");
-            if not ZettelkastenValidator.validate_minute(minute):
-                err.append(f"Minute {minute} is not between 0 and 59.");
-            
-            if len(err) == 0:
-                return ["The given argument is a valid Zettelkasten Unique Identifier (ZUID)."];    
-            return err;
+            messages : List[str] = ZettelkastenValidator.component_errors(year, month, day, hour, minute, strict);
+            if fine is not None and part >= format.units:
+                messages.append(ERROR_SECOND_MESSAGE.format(format.components(part)[0]));
+            return messages or ["The given argument is a valid Zettelkasten Unique Identifier (ZUID)."];
         except Exception as e:
             return ["The given argument is not a well-formed Zettelkasten Unique Identifier (ZUID).",
                     e.__class__.__name__ + ": " + str(e)];
+    
+    @staticmethod
+    def find_error_code(id: int | str | datetime | zUID, strict: bool = False) -> int:
+        """
+        Returns the error code of a Zettelkasten Unique Identifier (ZUID) candidate.
+        The code is a combination of the `ERROR_*` flags matching the messages reported by `find_error`.
+        
+        Parameters
+        ----------
+        id : int | str | datetime | "zUID"
+            The ZUID to check.
+        strict : bool
+            If `True`, also checks that the day exists in its month.
+            
+        Returns
+        -------
+        int
+            `0` if the ZUID is well-formed, the `ERROR_*` flags of the invalid components otherwise.
+        """
+        try:
+            fine : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse_fine(id);
+            if fine is not None:
+                format, minute, part = fine;
+                return (ZettelkastenValidator.component_error_code(*decompose(minute), strict)
+                        | (ERROR_SECOND if part >= format.units else 0));
+            return ZettelkastenValidator.component_error_code(*decompose(id), strict);
+        except Exception:
+            return ERROR_MALFORMED;
+    
+    @staticmethod
+    def component_error_code(year: int, month: int, day: int, hour: int, minute: int, strict: bool = False) -> int:
+        """
+        Returns the `ERROR_*` flags of the invalid components.
+        In strict mode, a day past the end of a valid month is reported as `ERROR_DAY`.
+        """
+        code : int = 0;
+        if not ZettelkastenValidator.validate_year(year):
+            code |= ERROR_YEAR;
+        if not ZettelkastenValidator.validate_month(month):
+            code |= ERROR_MONTH;
+        if not ZettelkastenValidator.validate_day(day, year if strict else None, month):
+            code |= ERROR_DAY;
+        if not ZettelkastenValidator.validate_hour(hour):
+            code |= ERROR_HOUR;
+        if not ZettelkastenValidator.validate_minute(minute):
+            code |= ERROR_MINUTE;
+        return code;
+    
+    @staticmethod
+    def component_errors(year: int, month: int, day: int, hour: int, minute: int, strict: bool = False) -> List[str]:
+        """
+        Returns the messages reported by `find_error` for the invalid components, or an empty list
+        if they are all valid. Used by `ZettelkastenBuilder`, which has already decomposed its input.
+        """
+        code : int = ZettelkastenValidator.component_error_code(year, month, day, hour, minute, strict);
+        if code == 0:
+            return [];
+        messages : List[str] = [];
+        for (flag, message), value in zip(ERROR_MESSAGES.items(), (year, month, day, hour, minute)):
+            if not code & flag:
+                continue;
+            #   A day between 1 and 31 is only an error in strict mode, past the end of its month
+            if flag == ERROR_DAY and 1 <= day <= 31:
+                messages.append(ERROR_DAY_IN_MONTH_MESSAGE.format(day, MONTH_LENGTHS[year * 100 + month - FIRST_MONTH]));
+            else:
+                messages.append(message.format(value));
+        return messages;
+    
+    @staticmethod
+    def validate_many(ids: Any, strict: bool = False) -> "numpy.ndarray":
+        """
+        Validates an array of integer Zettelkasten Unique Identifier (ZUID) candidates at once.
+        Requires NumPy.
+        
+        Parameters
+        ----------
+        ids : array_like of int
+            The ZUID candidates to validate.
+        strict : bool
+            If `True`, also checks that the day exists in its month.
+            
+        Returns
+        -------
+        numpy.ndarray
+            A boolean mask, `True` where the ZUID is well-formed.
+        """
+        import numpy;
+        
+        ids = numpy.asarray(ids, dtype=numpy.int64);
+        rest, minute    = numpy.divmod(ids, 100);
+        rest, hour      = numpy.divmod(rest, 100);
+        months, day     = numpy.divmod(rest, 100);
+        in_range : numpy.ndarray = (ids >= MIN_ID) & (ids <= MAX_ID) & (day >= 1) & (hour <= 23) & (minute <= 59);
+        
+        if strict:
+            lengths : numpy.ndarray = numpy.frombuffer(MONTH_LENGTHS, dtype=numpy.uint8);
+            return in_range & (day <= lengths[numpy.clip(months - FIRST_MONTH, 0, len(lengths) - 1)]);
+        month : numpy.ndarray = months % 100;
+        return in_range & (month >= 1) & (month <= 12) & (day <= 31);
+    
+    @staticmethod
+    def find_error_many(ids: Any, strict: bool = False) -> "numpy.ndarray":
+        """
+        Returns the error code (see `find_error_code`) of each integer ZUID candidate of an array.
+        Requires NumPy.
+        
+        Parameters
+        ----------
+        ids : array_like of int
+            The ZUID candidates to check.
+        strict : bool
+            If `True`, also checks that the day exists in its month.
+            
+        Returns
+        -------
+        numpy.ndarray
+            A `uint8` array of `ERROR_*` flags, `0` where the ZUID is well-formed.
+        """
+        import numpy;
+        
+        year, month, day, hour, minute = ZettelkastenDecomposer.decompose_many(ids, columns=True);
+        code : numpy.ndarray = numpy.zeros(year.shape, dtype=numpy.uint8);
+        code[(year < 1970) | (year > 2170)]     |= ERROR_YEAR;
+        code[(month < 1) | (month > 12)]        |= ERROR_MONTH;
+        if strict:
+            table   : numpy.ndarray = numpy.frombuffer(MONTH_LENGTHS, dtype=numpy.uint8);
+            known   : numpy.ndarray = (year >= 1970) & (year <= 2170) & (month >= 1) & (month <= 12);
+            lengths : numpy.ndarray = numpy.where(known, table[numpy.where(known, year * 100 + month - FIRST_MONTH, 0)], 31);
+            code[(day < 1) | (day > lengths)]   |= ERROR_DAY;
+        else:
+            code[(day < 1) | (day > 31)]        |= ERROR_DAY;
+        code[hour > 23]                         |= ERROR_HOUR;
+        code[minute > 59]                       |= ERROR_MINUTE;
+        return code;
         
         
     @staticmethod
@@ -82,8 +295,11 @@ class ZettelkastenValidator:
         return 1 <= month <= 12;
     
     @staticmethod
-    def validate_day(day: int) -> bool:
-        return 1 <= day <= 31;
+    def validate_day(day: int, year: int | None = None, month: int | None = None) -> bool:
+        #   Strict check only when the month is known and valid
+        if year is None or month is None or not (1970 <= year <= 2170 and 1 <= month <= 12):
+            return 1 <= day <= 31;
+        return 1 <= day <= MONTH_LENGTHS[year * 100 + month - FIRST_MONTH];
     
     @staticmethod
     def validate_hour(hour: int) -> bool:
@@ -91,4 +307,24 @@ class ZettelkastenValidator:
     
     @staticmethod
     def validate_minute(minute: int) -> bool:
-        return 0 <= minute <= 59;
\ No newline at end of file
+        return 0 <= minute <= 59;
+
+
+def validate(id: int | str | datetime | zUID, strict: bool = False) -> bool:
+    """
+    Exportable function for use in other modules.
+    Validates a Zettelkasten Unique Identifier (ZUID) by checking if it is well-formed.
+    
+    Parameters
+    ----------
+    id : int | str | datetime | zUID
+        The ZUID to validate.
+    strict : bool
+        If `True`, also checks that the day exists in its month.
+        
+    Returns
+    -------
+    bool
+        `True` if the ZUID is well-formed, `False` otherwise.
+    """
+    return ZettelkastenValidator.validate(id, strict);
@@ -0,0 +1,4 @@
+"""
+`zettelkasten_util.engine` package
+Static methods building, validating and decomposing zUIDs, the integer calendar and the cache.
+"""
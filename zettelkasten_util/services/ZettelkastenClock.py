@@ -0,0 +1,133 @@
+"""
+`ZettelkastenClock` module
+Implements the `ZettelkastenClock` class as a service.
+The clock turns the current time into the zUID of the current moment for `ZettelkastenGenerator.now()` and
+`allocate()`, in the local time of the system (the default, like `datetime.now()`), in UTC or in an explicit time zone:
+
+-   a monotonic guard never returns a zUID lower than the last one returned, so the repeated hour of a DST fall-back
+    or a backward NTP step does not produce repeated or out-of-order zUIDs (the clock holds its last zUID until the
+    time catches up with it; UTC has no fall-back at all);
+-   the calendar fields are only computed when the time crosses a minute boundary: within a minute, a read is a
+    comparison against the cached bounds of the minute (plus a multiplication for the finer formats);
+-   the time source is injectable (`source`, seconds since the epoch like `time.time`) for deterministic tests.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import math;
+import time;
+from datetime import datetime, timezone, tzinfo;
+from threading import Lock;
+from typing import Callable, Tuple;
+
+from ..data.ZettelkastenFormat import ZettelkastenFormat, MINUTE;
+
+
+#   Time zone of the UTC clocks, whose fields are read with `time.gmtime`
+UTC : tzinfo = timezone.utc;
+
+
+class ZettelkastenClock:
+    """
+    `ZettelkastenClock` class.
+    A monotonic source of the zUIDs of the current moment, caching the zUID of the current minute.
+    """
+    __slots__ = ('zone', 'format', 'monotonic', 'source', '_minute', '_last', '_lock');
+
+    def __init__(self, zone: tzinfo | None = None, format: ZettelkastenFormat = MINUTE, monotonic: bool = True,
+                 source: Callable[[], float] = time.time) -> None:
+        """
+        Initializes the clock.
+
+        Parameters
+        ----------
+        zone : tzinfo | None
+            The time zone of the zUIDs: `None` for the local time of the system (the default, subject to DST),
+            `UTC`, or an explicit zone (e.g. `zoneinfo.ZoneInfo("Europe/Lisbon")`).
+        format : ZettelkastenFormat
+            The resolution of the zUIDs.
+        monotonic : bool
+            If `True`, `now` never returns a zUID lower than the last one it returned.
+        source : Callable[[], float]
+            The time source, in seconds since the epoch (`time.time` by default; injectable for tests).
+        """
+        self.zone       : tzinfo | None = zone;
+        self.format     : ZettelkastenFormat = format;
+        self.monotonic  : bool = monotonic;
+        self.source     : Callable[[], float] = source;
+
+        #   Bounds `[start, stop)` (seconds since the epoch) and 12-digit zUID of the cached minute
+        self._minute    : Tuple[float, float, int] = (math.inf, -math.inf, 0);
+
+        #   Last zUID returned, and the lock guarding it
+        self._last      : int = 0;
+        self._lock      : Lock = Lock();
+
+
+    def now(self) -> int:
+        """
+        Returns the zUID (an integer of the clock's format) of the current moment, or the last one returned if it is
+        greater and the clock is monotonic.
+        """
+        t : float = self.source();
+        start, stop, minute = self._minute;
+        if not start <= t < stop:
+            start, stop, minute = self._minute = self._read(t);
+        id : int = minute if self.format is MINUTE else self.format.join(minute, int((t - start) * self.format.units / 60));
+        if not self.monotonic:
+            return id;
+        with self._lock:
+            if id < self._last:
+                return self._last;
+            self._last = id;
+            return id;
+
+
+    def _read(self, t: float) -> Tuple[float, float, int]:
+        """
+        Returns the bounds (seconds since the epoch) and the 12-digit zUID of the minute holding the time `t`.
+        """
+        second : int = math.floor(t);
+        if self.zone is None:
+            fields : time.struct_time = time.localtime(second);
+        elif self.zone is UTC:
+            fields = time.gmtime(second);
+        else:
+            fields = datetime.fromtimestamp(second, self.zone).timetuple();
+        year, month, day, hour, minute, seconds = fields[:6];
+
+        #   The minute starts `seconds` seconds before `second`, whatever the offset of the zone
+        start : int = second - min(seconds, 59);
+        return start, start + 60, (((year * 100 + month) * 100 + day) * 100 + hour) * 100 + minute;
+
+
+    def moment(self) -> datetime:
+        """
+        Returns the current moment as a `datetime` of the clock's zone (naive for the local time), without the guard.
+        """
+        return datetime.fromtimestamp(self.source(), self.zone);
+
+
+    def reset(self) -> None:
+        """
+        Forgets the cached minute and the last zUID returned (e.g. after changing `source`).
+        """
+        with self._lock:
+            self._minute = (math.inf, -math.inf, 0);
+            self._last = 0;
+
+
+    def __repr__(self) -> str:
+        zone : str = "local" if self.zone is None else str(self.zone);
+        return f"ZettelkastenClock({zone}, {self.format.name}{', monotonic' if self.monotonic else ''})";
+
+
+def utc_now(format: ZettelkastenFormat = MINUTE) -> int:
+    """
+    Exportable function for use in other modules.
+    Returns the zUID of the current moment in UTC, in the given format (without the monotonic guard).
+    """
+    return ZettelkastenClock(UTC, format, monotonic=False).now();
@@ -0,0 +1,449 @@
+"""
+`ZettelkastenCodec` module
+Implements the `ZettelkastenCodec` class as a service.
+The codec serializes sequences of zUIDs (e.g. `ZettelkastenGenerator.history`, or `identifiers.sorted()`) to compact
+binary streams instead of JSON arrays of 12-digit integers. Every zUID becomes the number of minutes (seconds,
+milliseconds for the finer formats) since 1970-01-01 00:00, so that consecutive zUIDs differ by small numbers:
+
+-   varint: the differences between consecutive values (zig-zag encoded, as sequences may go back in time) packed as
+    LEB128 varints, one byte for steps below 64 minutes; streaming, and vectorized by chunk with NumPy when it is
+    installed (pure Python otherwise);
+-   fixed: the values as little-endian 32-bit integers (64-bit for the finer formats), encoded and decoded in bulk
+    with NumPy.
+
+Both start with a 4-byte header: `zU`, the kind (`v` or `f`) and the number of digits of the format.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from itertools import chain, islice;
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING;
+
+from ..data.ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from ..data.ZettelkastenArray import ZUIDArray;
+from ..data.ZettelkastenFormat import ZettelkastenFormat, MINUTE, FORMATS;
+from ..engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MINUTES_PER_DAY, MAX_MINUTES, MONTH_LENGTHS, FIRST_MONTH, LAST_MONTH;
+
+if TYPE_CHECKING:
+    import numpy;
+
+
+#   Header: magic, kind and number of digits of the format
+MAGIC       : bytes = b"zU";
+VARINT      : bytes = b"v";
+FIXED       : bytes = b"f";
+HEADER_SIZE : int = 4;
+
+#   Number of zUIDs encoded per chunk by the streaming encoders
+CHUNK_SIZE  : int = 4096;
+
+#   Format of each number of digits
+DIGITS      : Dict[int, ZettelkastenFormat] = {format.digits: format for format in FORMATS.values()};
+
+
+class ZettelkastenCodec:
+    """
+    `ZettelkastenCodec` class.
+
+    static methods
+    --------------
+    encode(ids, format) -> bytes / decode(data) -> ZUIDArray
+        Varint encoding of a sequence of zUIDs.
+    encoder(ids, format, chunk_size) -> Iterator[bytes] / decoder(chunks) -> Iterator[int]
+        Streaming varint encoding and decoding.
+    encode_fixed(ids, format) -> bytes / decode_fixed(data) -> numpy.ndarray
+        Fixed-width encoding with NumPy.
+    encoder_fixed(ids, format, chunk_size) -> Iterator[bytes] / decoder_fixed(chunks) -> Iterator[numpy.ndarray]
+        Streaming fixed-width encoding and decoding.
+
+    The varint methods take `vectorized=False` to force the pure-Python path.
+    """
+    @staticmethod
+    def encode(ids: Iterable[int | zUID], format: ZettelkastenFormat = MINUTE, vectorized: bool = True) -> bytes:
+        """
+        Returns the varint encoding of a sequence of zUIDs of the given format (in one pass with NumPy).
+
+        Raises
+        ------
+        zUIDException
+            If a zUID is not a moment of the calendar in the given format.
+        """
+        if not vectorized or _numpy() is None:
+            return b"".join(ZettelkastenCodec.encoder(ids, format, vectorized=False));
+        return MAGIC + VARINT + bytes((format.digits,)) + ZettelkastenCodec._pack(ZettelkastenCodec._values(ids, format), 0);
+
+
+    @staticmethod
+    def decode(data: bytes, vectorized: bool = True) -> ZUIDArray:
+        """
+        Returns the zUIDs of a varint encoding, in order (in one pass with NumPy).
+
+        Raises
+        ------
+        ValueError
+            If the data is not a varint encoding, is truncated or holds a moment outside of 1970 .. 2170.
+        """
+        numpy : Any = _numpy() if vectorized else None;
+        if numpy is None:
+            out : ZUIDArray = ZUIDArray();
+            out.extend(ZettelkastenCodec.decoder((data,), vectorized=False));
+            return out;
+        rest, format = ZettelkastenCodec._read_header(iter((data,)), VARINT);
+        if rest and rest[-1] & 0x80:
+            raise ValueError("Truncated varint stream.");
+        values : numpy.ndarray = ZettelkastenCodec._unpack(numpy.frombuffer(rest, dtype=numpy.uint8), 0);
+        return ZUIDArray.from_buffer(ZettelkastenCodec._zuids(values, format));
+
+
+    @staticmethod
+    def encoder(ids: Iterable[int | zUID], format: ZettelkastenFormat = MINUTE, chunk_size: int = CHUNK_SIZE,
+                vectorized: bool = True) -> Iterator[bytes]:
+        """
+        Encodes a stream of zUIDs as varints, yielding the header and then the bytes of every `chunk_size` zUIDs.
+
+        Parameters
+        ----------
+        ids : Iterable[int | zUID]
+            The zUIDs, in the order to keep (sorted sets encode best).
+        format : ZettelkastenFormat
+            The format of the zUIDs.
+        chunk_size : int
+            The number of zUIDs per yielded chunk.
+        vectorized : bool
+            If `True`, each chunk is encoded at once with NumPy (when it is installed).
+
+        Raises
+        ------
+        zUIDException
+            If a zUID is not a moment of the calendar in the given format.
+        """
+        yield MAGIC + VARINT + bytes((format.digits,));
+        numpy       : Any = _numpy() if vectorized else None;
+        iterator    : Iterator[int] = iter(ZUIDArray._ints(ids));
+        previous    : int = 0;
+        while chunk := list(islice(iterator, chunk_size)):
+            if numpy is None:
+                data, previous = ZettelkastenCodec._pack_python(chunk, format, previous);
+            else:
+                values : numpy.ndarray = ZettelkastenCodec._values(chunk, format);
+                data, previous = ZettelkastenCodec._pack(values, previous), int(values[-1]);
+            yield data;
+
+
+    @staticmethod
+    def decoder(chunks: Iterable[bytes], vectorized: bool = True) -> Iterator[int]:
+        """
+        Decodes a varint stream given as chunks of bytes (split anywhere, e.g. reads of a socket), yielding the zUIDs.
+
+        Parameters
+        ----------
+        chunks : Iterable[bytes]
+            The stream, header included.
+        vectorized : bool
+            If `True`, the whole varints of each chunk are decoded at once with NumPy (when it is installed).
+
+        Raises
+        ------
+        ValueError
+            If the stream is not a varint encoding, is truncated or holds a moment outside of 1970 .. 2170.
+        """
+        iterator        : Iterator[bytes] = iter(chunks);
+        chunk, format   = ZettelkastenCodec._read_header(iterator, VARINT);
+        numpy           : Any = _numpy() if vectorized else None;
+        if numpy is None:
+            yield from ZettelkastenCodec._unpack_python(chain((chunk,), iterator), format);
+            return;
+
+        pending     : bytes = b"";
+        previous    : int = 0;
+        while chunk is not None:
+            pending += chunk;
+
+            #   The bytes of the last varint may continue in the next chunk
+            end : int = len(pending);
+            while end and pending[end - 1] & 0x80:
+                end -= 1;
+            if end:
+                values : numpy.ndarray = ZettelkastenCodec._unpack(numpy.frombuffer(pending, dtype=numpy.uint8, count=end), previous);
+                previous, pending = int(values[-1]), pending[end:];
+                yield from ZettelkastenCodec._zuids(values, format).tolist();
+            chunk = next(iterator, None);
+        if pending:
+            raise ValueError("Truncated varint stream.");
+
+
+    @staticmethod
+    def encode_fixed(ids: Any, format: ZettelkastenFormat = MINUTE) -> bytes:
+        """
+        Returns the fixed-width encoding of a sequence of zUIDs (array_like of int, `ZUIDArray` or iterable of zUIDs).
+        Requires NumPy.
+
+        Raises
+        ------
+        zUIDException
+            If a zUID is not a moment of the calendar in the given format.
+        """
+        return (MAGIC + FIXED + bytes((format.digits,))
+                + ZettelkastenCodec._values(ids, format).astype(ZettelkastenCodec._dtype(format)).tobytes());
+
+
+    @staticmethod
+    def decode_fixed(data: bytes) -> "numpy.ndarray":
+        """
+        Returns the zUIDs of a fixed-width encoding as an `int64` array. Requires NumPy.
+        """
+        import numpy;
+
+        chunks : List[numpy.ndarray] = list(ZettelkastenCodec.decoder_fixed((data,)));
+        return numpy.concatenate(chunks) if chunks else numpy.zeros(0, dtype=numpy.int64);
+
+
+    @staticmethod
+    def encoder_fixed(ids: Iterable[int | zUID], format: ZettelkastenFormat = MINUTE, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Encodes a stream of zUIDs with fixed width, yielding the header and then the bytes of every `chunk_size` zUIDs.
+        Requires NumPy.
+        """
+        yield MAGIC + FIXED + bytes((format.digits,));
+        iterator : Iterator[int] = iter(ZUIDArray._ints(ids));
+        while chunk := list(islice(iterator, chunk_size)):
+            yield ZettelkastenCodec._values(chunk, format).astype(ZettelkastenCodec._dtype(format)).tobytes();
+
+
+    @staticmethod
+    def decoder_fixed(chunks: Iterable[bytes]) -> Iterator["numpy.ndarray"]:
+        """
+        Decodes a fixed-width stream given as chunks of bytes (split anywhere), yielding `int64` arrays of zUIDs.
+        Requires NumPy.
+
+        Raises
+        ------
+        ValueError
+            If the stream is not a fixed-width encoding, is truncated or holds a moment outside of 1970 .. 2170.
+        """
+        import numpy;
+
+        iterator        : Iterator[bytes] = iter(chunks);
+        chunk, format   = ZettelkastenCodec._read_header(iterator, FIXED);
+        dtype           : numpy.dtype = ZettelkastenCodec._dtype(format);
+        pending         : bytes = b"";
+        while chunk is not None:
+            pending += chunk;
+            count : int = len(pending) // dtype.itemsize;
+            if count:
+                values : numpy.ndarray = numpy.frombuffer(pending, dtype=dtype, count=count).astype(numpy.int64);
+                pending = pending[count * dtype.itemsize:];
+                yield ZettelkastenCodec._zuids(values, format);
+            chunk = next(iterator, None);
+        if pending:
+            raise ValueError("Truncated fixed-width stream.");
+
+
+    @staticmethod
+    def _values(ids: Any, format: ZettelkastenFormat) -> "numpy.ndarray":
+        """
+        Returns the values (units of the format since 1970-01-01 00:00) of zUIDs, as an `int64` array.
+        """
+        import numpy;
+        from ..engine.ZettelkastenValidator import ZettelkastenValidator;
+        from ..engine.ZettelkastenDecomposer import ZettelkastenDecomposer;
+
+        if isinstance(ids, ZUIDArray):
+            ids = ids.to_numpy();
+        elif isinstance(ids, list) and all(id.__class__ is int for id in ids):
+            ids = numpy.array(ids, dtype=numpy.int64);
+        elif not isinstance(ids, numpy.ndarray):
+            ids = numpy.fromiter(ZUIDArray._ints(ids), dtype=numpy.int64);
+        ids = numpy.asarray(ids, dtype=numpy.int64);
+        minute, part = numpy.divmod(ids, format.scale);
+        valid : numpy.ndarray = ZettelkastenValidator.validate_many(minute, strict=True) & (part < format.units);
+        if not valid.all():
+            raise zUIDException(f"{ids[~valid][0]} is not a Zettelkasten Unique Identifier (ZUID) of the {format.name} format.");
+        return calendar.to_minutes(*ZettelkastenDecomposer.decompose_many(minute, columns=True)) * format.units + part;
+
+
+    @staticmethod
+    def _zuids(values: "numpy.ndarray", format: ZettelkastenFormat) -> "numpy.ndarray":
+        """
+        Returns the zUIDs of values (units of the format since 1970-01-01 00:00), as an `int64` array (inverse of `_values`).
+        """
+        minutes, part = divmod(values, format.units);
+        if len(minutes) and (minutes.min() < 0 or minutes.max() > MAX_MINUTES):
+            raise ValueError("Decoded moment out of the range 1970 .. 2170.");
+        return calendar.compose(*calendar.from_minutes(minutes)) * format.scale + part;
+
+
+    @staticmethod
+    def _pack(values: "numpy.ndarray", previous: int) -> bytes:
+        """
+        Returns the varints of the zig-zag encoded differences between consecutive values, the first one from `previous`.
+        """
+        import numpy;
+
+        deltas  : numpy.ndarray = numpy.diff(values, prepend=numpy.int64(previous));
+        zigzag  : numpy.ndarray = ((deltas << 1) ^ (deltas >> 63)).view(numpy.uint64);
+
+        #   Number of 7-bit groups of each varint, and the position of its first byte
+        lengths : numpy.ndarray = numpy.ones(len(zigzag), dtype=numpy.int64);
+        for groups in range(1, 10):
+            lengths += zigzag >= numpy.uint64(1 << 7 * groups);
+        starts  : numpy.ndarray = numpy.cumsum(lengths) - lengths;
+        out     : numpy.ndarray = numpy.empty(int(lengths.sum()), dtype=numpy.uint8);
+        for group in range(int(lengths.max(initial=0))):
+            present : numpy.ndarray = lengths > group;
+            byte    : numpy.ndarray = (zigzag[present] >> numpy.uint64(7 * group)) & numpy.uint64(0x7F);
+            out[starts[present] + group] = byte | numpy.where(lengths[present] > group + 1, 0x80, 0).astype(numpy.uint64);
+        return out.tobytes();
+
+
+    @staticmethod
+    def _unpack(data: "numpy.ndarray", previous: int) -> "numpy.ndarray":
+        """
+        Returns the values of whole varints (`uint8` array ending with a last byte), added up from `previous` (inverse of `_pack`).
+        """
+        import numpy;
+
+        ends    : numpy.ndarray = numpy.flatnonzero(data < 0x80);
+        starts  : numpy.ndarray = numpy.concatenate(([0], ends[:-1] + 1));
+        lengths : numpy.ndarray = ends - starts + 1;
+        zigzag  : numpy.ndarray = numpy.zeros(len(ends), dtype=numpy.uint64);
+        for group in range(int(lengths.max(initial=0))):
+            present : numpy.ndarray = lengths > group;
+            zigzag[present] |= (data[starts[present] + group] & 0x7F).astype(numpy.uint64) << numpy.uint64(7 * group);
+        deltas  : numpy.ndarray = (zigzag >> numpy.uint64(1)).view(numpy.int64) ^ -(zigzag & numpy.uint64(1)).view(numpy.int64);
+        return numpy.cumsum(deltas) + previous;
+
+
+    @staticmethod
+    def _pack_python(ids: List[int], format: ZettelkastenFormat, previous: int) -> Tuple[bytes, int]:
+        """
+        Pure-Python `_values` and `_pack`: returns the varints of zUIDs and the value of the last one.
+        """
+        out     : bytearray = bytearray();
+        units   : int = format.units;
+        scale   : int = format.scale;
+        date    : int = -1;
+        base    : int = 0;
+        for id in ids:
+            minute, part = divmod(id, scale);
+            day, clock = divmod(minute, 10000);
+
+            #   The minutes of a day are computed once per run of zUIDs of that day
+            if day != date:
+                base, date = ZettelkastenCodec._day_minutes(day, id), day;
+            hour, minute = divmod(clock, 100);
+            if hour > 23 or minute > 59 or part >= units:
+                raise zUIDException(f"{id} is not a Zettelkasten Unique Identifier (ZUID) of the {format.name} format.");
+            value : int = (base + hour * 60 + minute) * units + part;
+
+            #   Zig-zag encoding of the difference, then 7 bits per byte with a continuation bit
+            delta : int = value - previous;
+            delta = delta << 1 if delta >= 0 else ~delta << 1 | 1;
+            previous = value;
+            while delta >= 0x80:
+                out.append(delta & 0x7F | 0x80);
+                delta >>= 7;
+            out.append(delta);
+        return bytes(out), previous;
+
+
+    @staticmethod
+    def _unpack_python(chunks: Iterable[bytes], format: ZettelkastenFormat) -> Iterator[int]:
+        """
+        Pure-Python `_unpack` and `_zuids` of a stream without its header.
+        """
+        units       : int = format.units;
+        scale       : int = format.scale;
+        value       : int = 0;
+        shift       : int = 0;
+        previous    : int = 0;
+        date        : int = -1;
+        base        : int = 0;
+        for chunk in chunks:
+            for byte in chunk:
+                value |= (byte & 0x7F) << shift;
+                if byte & 0x80:
+                    shift += 7;
+                    continue;
+                previous += value >> 1 if not value & 1 else ~(value >> 1);
+                value = shift = 0;
+
+                minutes, part = divmod(previous, units);
+                day, minute = divmod(minutes, MINUTES_PER_DAY);
+                if day != date:
+                    if not 0 <= minutes <= MAX_MINUTES:
+                        raise ValueError("Decoded moment out of the range 1970 .. 2170.");
+                    year, month, date_of_month = calendar.from_days(day);
+                    base, date = ((year * 100 + month) * 100 + date_of_month) * 10000, day;
+                yield (base + minute // 60 * 100 + minute % 60) * scale + part;
+        if shift:
+            raise ValueError("Truncated varint stream.");
+
+
+    @staticmethod
+    def _dtype(format: ZettelkastenFormat) -> "numpy.dtype":
+        """
+        Returns the fixed-width type of a format: 32 bits hold every minute until 2170, the finer formats need 64.
+        """
+        import numpy;
+
+        return numpy.dtype("<u4" if format is MINUTE else "<u8");
+
+
+    @staticmethod
+    def _day_minutes(day: int, id: int) -> int:
+        """
+        Returns the minutes between 1970-01-01 00:00 and the start of a `YYYYMMDD` day, which must exist.
+        """
+        months, date = divmod(day, 100);
+        if not (FIRST_MONTH <= months <= LAST_MONTH and 1 <= date <= MONTH_LENGTHS[months - FIRST_MONTH]):
+            raise zUIDException(f"{id} is not a Zettelkasten Unique Identifier (ZUID): {day} is not a day of the calendar.");
+        year, month = divmod(months, 100);
+        return calendar.to_days(year, month, date) * MINUTES_PER_DAY;
+
+
+    @staticmethod
+    def _read_header(iterator: Iterator[bytes], kind: bytes) -> Tuple[bytes, ZettelkastenFormat]:
+        """
+        Reads the header from the first chunks of a stream; returns the rest of the chunk holding its end, and the format.
+        """
+        head : bytes = b"";
+        while len(head) < HEADER_SIZE:
+            chunk : bytes | None = next(iterator, None);
+            if chunk is None:
+                break;
+            head += chunk;
+        if len(head) < HEADER_SIZE or head[:2] != MAGIC or head[2:3] != kind or head[3] not in DIGITS:
+            raise ValueError(f"Not a {'varint' if kind == VARINT else 'fixed-width'} zUID stream.");
+        return head[HEADER_SIZE:], DIGITS[head[3]];
+
+
+def _numpy() -> Any:
+    """
+    Returns the `numpy` module, or `None` if it is not installed.
+    """
+    try:
+        import numpy;
+    except ImportError:
+        return None;
+    return numpy;
+
+
+def load(file: BinaryIO, chunk_size: int = 1 << 16) -> ZUIDArray:
+    """
+    Exportable function for use in other modules.
+    Reads the zUIDs of a varint or fixed-width encoding from a binary file (the fixed width requires NumPy);
+    write one with `file.writelines(ZettelkastenCodec.encoder(ids))`.
+    """
+    head    : bytes = file.read(HEADER_SIZE);
+    stream  : Iterator[bytes] = chain((head,), iter(lambda: file.read(chunk_size), b""));
+    out     : ZUIDArray = ZUIDArray();
+    if head[2:3] == FIXED:
+        for values in ZettelkastenCodec.decoder_fixed(stream):
+            out.extend(values.tolist());
+    else:
+        out.extend(ZettelkastenCodec.decoder(stream));
+    return out;
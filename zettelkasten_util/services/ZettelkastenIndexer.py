@@ -0,0 +1,193 @@
+"""
+`ZettelkastenIndexer` module
+Implements the `ZettelkastenIndexer` class as a service.
+The indexer shards the files of a vault across a `ProcessPoolExecutor`, scans each shard with `ZettelkastenScanner`
+and k-way merges the sorted per-shard results into one index of notes, links and duplicate zUIDs.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import heapq;
+import os;
+from concurrent.futures import ProcessPoolExecutor;
+from itertools import groupby;
+from operator import itemgetter;
+from typing import Dict, Iterator, List, NamedTuple, Tuple;
+
+from ..data.ZettelkastenArray import ZUIDArray;
+from ..data.ZettelkastenIndex import ZettelkastenIndex;
+from .ZettelkastenScanner import ZettelkastenScanner;
+
+
+class ShardIndex(NamedTuple):
+    """
+    The sorted results of one shard: the `(zuid, path)` notes and the `(source, target)` links.
+    """
+    notes   : List[Tuple[int, str]];
+    links   : List[Tuple[int, int]];
+
+
+class VaultIndex(NamedTuple):
+    """
+    The merged index of a vault.
+
+    `ids` holds the sorted, unique zUIDs of the notes and `paths` the file of each of them (the first one
+    in path order when several files share a zUID); `links` holds the sorted, unique `(source, target)` edges
+    and `duplicates` maps each zUID claimed by several files to all of them.
+    """
+    ids         : ZUIDArray;
+    paths       : List[str];
+    links       : List[Tuple[int, int]];
+    duplicates  : Dict[int, List[str]];
+
+    def path(self, id: int) -> str | None:
+        """
+        Returns the file of a note, or `None` if the zUID is not in the index.
+        """
+        position : int = self.ids.search(id);
+        return self.paths[position] if position >= 0 else None;
+
+
+    def to_index(self, compact: bool = False) -> ZettelkastenIndex:
+        """
+        Returns the zUIDs of the notes as a `ZettelkastenIndex`, e.g. for `ZettelkastenGenerator.identifiers`.
+        """
+        return ZettelkastenIndex(self.ids, compact);
+
+
+class ZettelkastenIndexer:
+    """
+    `ZettelkastenIndexer` class.
+
+    The zUID of a note is the one in its file name, or else the first one in the file (e.g. its front-matter `id`);
+    every other zUID mentioned in the file is a link from that note. Files without any zUID are ignored.
+    """
+    __slots__ = ('workers', 'strict', 'suffixes', 'shards_per_worker');
+
+    def __init__(self, workers: int | None = None, strict: bool = False, suffixes: Tuple[str, ...] = (".md",), shards_per_worker: int = 4) -> None:
+        """
+        Initializes the indexer.
+
+        Parameters
+        ----------
+        workers : int | None
+            The number of worker processes (`os.cpu_count()` if `None`); with `1`, the vault is indexed in this process.
+        strict : bool
+            The validation mode (see `ZettelkastenValidator`) of the zUIDs.
+        suffixes : Tuple[str, ...]
+            The suffixes of the files to index.
+        shards_per_worker : int
+            The number of shards per worker; more, smaller shards balance the load better.
+        """
+        self.workers            : int = workers or os.cpu_count() or 1;
+        self.strict             : bool = strict;
+        self.suffixes           : Tuple[str, ...] = suffixes;
+        self.shards_per_worker  : int = shards_per_worker;
+
+
+    def index(self, *roots: str | os.PathLike) -> VaultIndex:
+        """
+        Indexes the given files and directories (walked recursively).
+
+        Parameters
+        ----------
+        roots : str | os.PathLike
+            The files and directories to index.
+
+        Returns
+        -------
+        VaultIndex
+            The merged index.
+        """
+        paths   : List[str] = list(ZettelkastenScanner(suffixes=self.suffixes).files(*roots));
+        shards  : List[List[str]] = ZettelkastenIndexer.shard(paths, self.workers * self.shards_per_worker);
+
+        if self.workers == 1 or len(shards) <= 1:
+            results : List[ShardIndex] = [index_shard(shard, self.strict) for shard in shards];
+        else:
+            with ProcessPoolExecutor(self.workers) as executor:
+                results = list(executor.map(index_shard, shards, [self.strict] * len(shards)));
+        return ZettelkastenIndexer.merge(results);
+
+
+    @staticmethod
+    def shard(paths: List[str], count: int) -> List[List[str]]:
+        """
+        Splits the paths into at most `count` contiguous shards of nearly equal sizes.
+        """
+        count = max(1, min(count, len(paths)));
+        size, extra = divmod(len(paths), count);
+        bounds : List[int] = [index * size + min(index, extra) for index in range(count + 1)];
+        return [paths[low:high] for low, high in zip(bounds, bounds[1:]) if low < high];
+
+
+    @staticmethod
+    def merge(shards: List[ShardIndex]) -> VaultIndex:
+        """
+        K-way merges the sorted results of the shards into one index, collecting the zUIDs claimed by several files.
+        """
+        ids         : ZUIDArray = ZUIDArray();
+        paths       : List[str] = [];
+        duplicates  : Dict[int, List[str]] = {};
+        for id, notes in groupby(heapq.merge(*(shard.notes for shard in shards)), key=itemgetter(0)):
+            files : List[str] = [path for _, path in notes];
+            ids.append(id);
+            paths.append(files[0]);
+            if len(files) > 1:
+                duplicates[id] = files;
+
+        links : List[Tuple[int, int]] = [link for link, _ in groupby(heapq.merge(*(shard.links for shard in shards)))];
+        return VaultIndex(ids, paths, links, duplicates);
+
+
+def index_shard(paths: List[str], strict: bool = False) -> ShardIndex:
+    """
+    Exportable function for use in other modules (and by the worker processes).
+    Scans a shard of files and returns its sorted notes and links.
+
+    Parameters
+    ----------
+    paths : List[str]
+        The files of the shard.
+    strict : bool
+        If `True`, rejects days that do not exist in their month.
+
+    Returns
+    -------
+    ShardIndex
+        The sorted `(zuid, path)` notes and `(source, target)` links of the shard.
+    """
+    notes : List[Tuple[int, str]] = [];
+    links : set = set();
+    for path, matches in groupby(ZettelkastenScanner(strict).scan(*paths), key=itemgetter(0)):
+        ids     : Iterator[int] = (match.zuid.id for match in matches);
+        source  : int = next(ids);
+        notes.append((source, path));
+        links.update((source, target) for target in ids if target != source);
+    notes.sort();
+    return ShardIndex(notes, sorted(links));
+
+
+def index_vault(*roots: str | os.PathLike, workers: int | None = None, strict: bool = False) -> VaultIndex:
+    """
+    Exportable function for use in other modules.
+    Indexes the Markdown files of a vault with a pool of `workers` processes.
+
+    Parameters
+    ----------
+    roots : str | os.PathLike
+        The files and directories to index.
+    workers : int | None
+        The number of worker processes (`os.cpu_count()` if `None`).
+    strict : bool
+        If `True`, rejects days that do not exist in their month.
+
+    Returns
+    -------
+    VaultIndex
+        The merged index.
+    """
+    return ZettelkastenIndexer(workers, strict).index(*roots);
@@ -0,0 +1,262 @@
+"""
+`ZettelkastenInstrumentation` module
+Implements the `ZettelkastenInstrumentation` class as a service.
+The instrumentation counts the calls, the cumulative time and the failures (by `find_error` category) of the
+builder, validator, decomposer and sequencer entry points, and times arbitrary blocks with `timer(name)`.
+
+It is opt-in: `enable()` swaps timing wrappers in for the instrumented static methods (and their entries in the
+dispatch tables), and `disable()` puts the original functions back, so a disabled instrumentation costs nothing.
+Times are inclusive: `builder.build` also counts the time of the `builder.normalize` and `builder.from_int` it calls.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import functools;
+import threading;
+import time;
+from contextlib import contextmanager;
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple;
+
+from ..engine.ZettelkastenBuilder import ZettelkastenBuilder, NORMALIZERS;
+from ..engine.ZettelkastenDecomposer import ZettelkastenDecomposer, DECOMPOSERS;
+from ..engine.ZettelkastenValidator import ZettelkastenValidator, ERROR_YEAR, ERROR_MONTH, ERROR_DAY, ERROR_HOUR, ERROR_MINUTE, ERROR_MALFORMED, ERROR_SECOND;
+from .ZettelkastenSequencer import ZettelkastenSequencer;
+
+
+#   Instrumented static methods, by operation prefix
+OPERATIONS : Dict[str, Tuple[type, Tuple[str, ...]]] = {
+    "builder"       : (ZettelkastenBuilder, ("build", "normalize", "normalize_format", "from_int", "from_string", "pad_string", "from_datetime")),
+    "validator"     : (ZettelkastenValidator, ("validate", "validate_format", "find_error", "find_error_code")),
+    "decomposer"    : (ZettelkastenDecomposer, ("decompose", "decompose_format", "decompose_int", "decompose_string", "decompose_datetime")),
+    "sequencer"     : (ZettelkastenSequencer, ("get_next", "get_previous", "advance")),
+};
+
+#   Dispatch tables holding instrumented methods, whose entries are swapped too
+TABLES : Tuple[Dict[type, Callable[[Any], Any]], ...] = (NORMALIZERS, DECOMPOSERS);
+
+#   Operations whose `False` result is a failure
+FAILING_ON_FALSE : Tuple[str, ...] = ("validator.validate",);
+
+#   Failure category of each `ERROR_*` flag; `other` is a failure whose argument is a well-formed zUID (e.g. `get_next` of the last one)
+CATEGORIES : Dict[int, str] = {
+    ERROR_YEAR      : "year",
+    ERROR_MONTH     : "month",
+    ERROR_DAY       : "day",
+    ERROR_HOUR      : "hour",
+    ERROR_MINUTE    : "minute",
+    ERROR_MALFORMED : "malformed",
+    ERROR_SECOND    : "second",
+};
+
+
+class OperationStats(NamedTuple):
+    """
+    Counters of an operation: calls, failed calls, cumulative time (ns) and failures by category.
+    """
+    calls       : int;
+    failures    : int;
+    total_ns    : int;
+    categories  : Dict[str, int];
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        The mean time of a call, in nanoseconds.
+        """
+        return self.total_ns / self.calls if self.calls else 0.0;
+
+
+#   Counters of each operation (`[calls, failures, total_ns]`), failures by category, and the lock guarding them
+_counters   : Dict[str, List[int]] = {};
+_categories : Dict[str, Dict[str, int]] = {};
+_lock       : threading.Lock = threading.Lock();
+
+#   Original class attributes of the instrumented methods while enabled
+_originals  : Dict[Tuple[type, str], Any] = {};
+
+#   Set while a failure is categorized, so that the calls it makes are not counted
+_local      : threading.local = threading.local();
+
+
+class ZettelkastenInstrumentation:
+    """
+    `ZettelkastenInstrumentation` class.
+
+    static methods
+    --------------
+    enable() -> None
+        Installs the timing wrappers.
+    disable() -> None
+        Restores the original methods (the counters are kept).
+    is_enabled() -> bool
+        Whether the wrappers are installed.
+    snapshot() -> Dict[str, OperationStats]
+        Returns a copy of the counters.
+    reset() -> None
+        Clears the counters.
+    timer(name: str) -> ContextManager
+        Times the enclosed block as the operation `name`.
+    """
+    @staticmethod
+    def enable() -> None:
+        """
+        Installs the timing wrappers on the instrumented methods; does nothing if they already are.
+        """
+        with _lock:
+            if _originals:
+                return;
+            wrappers : Dict[Callable[..., Any], Callable[..., Any]] = {};
+            for prefix, (cls, names) in OPERATIONS.items():
+                for name in names:
+                    original : Callable[..., Any] = getattr(cls, name);
+                    _originals[(cls, name)] = cls.__dict__[name];
+                    wrappers[original] = ZettelkastenInstrumentation._wrap(f"{prefix}.{name}", original);
+                    setattr(cls, name, staticmethod(wrappers[original]));
+            for table in TABLES:
+                for key, function in table.items():
+                    if function in wrappers:
+                        table[key] = wrappers[function];
+
+
+    @staticmethod
+    def disable() -> None:
+        """
+        Restores the original methods; the counters are kept until `reset`.
+        """
+        with _lock:
+            originals : Dict[Callable[..., Any], Callable[..., Any]] = {};
+            for (cls, name), attribute in _originals.items():
+                originals[getattr(cls, name)] = attribute.__func__;
+                setattr(cls, name, attribute);
+            for table in TABLES:
+                for key, function in table.items():
+                    if function in originals:
+                        table[key] = originals[function];
+            _originals.clear();
+
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        Returns `True` if the timing wrappers are installed.
+        """
+        return bool(_originals);
+
+
+    @staticmethod
+    def snapshot() -> Dict[str, OperationStats]:
+        """
+        Returns a copy of the counters of every operation called since the last `reset`.
+
+        Returns
+        -------
+        Dict[str, OperationStats]
+            The counters by operation name (e.g. `builder.from_string`, or the name given to `timer`).
+        """
+        with _lock:
+            return {name: OperationStats(calls, failures, total_ns, dict(_categories.get(name, {})))
+                    for name, (calls, failures, total_ns) in _counters.items()};
+
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Clears the counters.
+        """
+        with _lock:
+            _counters.clear();
+            _categories.clear();
+
+
+    @staticmethod
+    @contextmanager
+    def timer(name: str) -> Iterator[None]:
+        """
+        Counts and times the enclosed block with `time.perf_counter_ns` as the operation `name`
+        (a failure if it raises); does nothing while the instrumentation is disabled.
+        """
+        if not _originals:
+            yield;
+            return;
+        start : int = time.perf_counter_ns();
+        try:
+            yield;
+        except BaseException:
+            ZettelkastenInstrumentation._record(name, time.perf_counter_ns() - start, "other");
+            raise;
+        ZettelkastenInstrumentation._record(name, time.perf_counter_ns() - start);
+
+
+    @staticmethod
+    def _wrap(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Returns `function` wrapped to record its calls as the operation `name`.
+        """
+        failing_on_false : bool = name in FAILING_ON_FALSE;
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if getattr(_local, "paused", False):
+                return function(*args, **kwargs);
+            start : int = time.perf_counter_ns();
+            try:
+                result = function(*args, **kwargs);
+            except Exception:
+                elapsed : int = time.perf_counter_ns() - start;
+                ZettelkastenInstrumentation._record(name, elapsed, *ZettelkastenInstrumentation._categorize(args, kwargs));
+                raise;
+            elapsed = time.perf_counter_ns() - start;
+            if failing_on_false and result is False:
+                ZettelkastenInstrumentation._record(name, elapsed, *ZettelkastenInstrumentation._categorize(args, kwargs));
+            else:
+                ZettelkastenInstrumentation._record(name, elapsed);
+            return result;
+        return wrapper;
+
+
+    @staticmethod
+    def _categorize(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[str]:
+        """
+        Returns the failure categories of the zUID a failed call was given (its first argument), from `find_error_code`.
+        """
+        strict : Any = kwargs.get("strict", args[1] if len(args) > 1 and isinstance(args[1], bool) else False);
+        _local.paused = True;
+        try:
+            code : int = ZettelkastenValidator.find_error_code(args[0] if args else kwargs.get("id"), strict);
+        finally:
+            _local.paused = False;
+        return [category for flag, category in CATEGORIES.items() if code & flag] or ["other"];
+
+
+    @staticmethod
+    def _record(name: str, elapsed: int, *categories: str) -> None:
+        """
+        Adds a call to the counters of `name`, a failure if `categories` are given.
+        """
+        with _lock:
+            counters : List[int] = _counters.setdefault(name, [0, 0, 0]);
+            counters[0] += 1;
+            counters[2] += elapsed;
+            if categories:
+                counters[1] += 1;
+                by_category : Dict[str, int] = _categories.setdefault(name, {});
+                for category in categories:
+                    by_category[category] = by_category.get(category, 0) + 1;
+
+
+@contextmanager
+def instrumented() -> Iterator[ZettelkastenInstrumentation]:
+    """
+    Exportable function for use in other modules.
+    Enables the instrumentation for the enclosed block, disabling it afterwards if it was disabled before.
+    """
+    was_enabled : bool = ZettelkastenInstrumentation.is_enabled();
+    ZettelkastenInstrumentation.enable();
+    try:
+        yield ZettelkastenInstrumentation;
+    finally:
+        if not was_enabled:
+            ZettelkastenInstrumentation.disable();
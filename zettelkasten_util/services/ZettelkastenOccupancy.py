@@ -0,0 +1,256 @@
+"""
+`ZettelkastenOccupancy` module
+Implements the `ZettelkastenOccupancy` class as a service.
+The occupancy answers gap and density queries over issued zUIDs ("first free minute after X", "free slots on a day",
+"zUIDs per day over the last year") from per-day bitmaps of 1440 bits, instead of `get_next` loops.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import datetime;
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING;
+
+from ..data.ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from ..data.ZettelkastenFormat import ZettelkastenFormat, MINUTE;
+from ..engine.ZettelkastenDecomposer import ZettelkastenDecomposer;
+from ..engine.ZettelkastenValidator import MAX_ID;
+from ..engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from ..engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MINUTES_PER_DAY, MAX_MINUTES;
+from .ZettelkastenRange import ZettelkastenRange;
+
+if TYPE_CHECKING:
+    import numpy;
+
+
+#   Bitmap of a day whose 1440 minutes are all taken
+FULL_DAY : int = (1 << MINUTES_PER_DAY) - 1;
+
+
+class ZettelkastenOccupancy:
+    """
+    `ZettelkastenOccupancy` class.
+    Keeps one integer bitmap per day holding zUIDs (bit `m` set when the `m`-th minute of the day is taken), so
+    membership is a bit test, the first free minute of a day is a couple of big-integer operations and the number
+    of zUIDs of a day is a `bit_count`. Days without zUIDs take no memory.
+    The bitmaps have a resolution of one minute: a zUID of a finer format takes its minute, and the queries
+    count and return 12-digit zUIDs.
+    """
+    __slots__ = ('_days', '_count');
+
+    def __init__(self, identifiers: Iterable[int | zUID] = ()) -> None:
+        """
+        Initializes the bitmaps with the given zUIDs (e.g. `ZettelkastenGenerator.identifiers`).
+
+        Parameters
+        ----------
+        identifiers : Iterable[int | zUID]
+            The taken zUIDs.
+        """
+        self._days  : Dict[int, int] = {};
+        self._count : int = 0;
+        for id in identifiers:
+            self.add(id);
+
+
+    @staticmethod
+    def _minute(id: int | str | datetime.datetime | zUID) -> int:
+        """
+        Returns the 12-digit integer of a zUID (strings are right-padded like in `build`), or of its minute
+        for the finer formats (see `ZettelkastenFormat`), without validating its date.
+        """
+        value : int = id if type(id) is int else builder.normalize(id);
+        if value > MAX_ID:
+            parsed : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse(value);
+            if parsed is None or parsed[0] is MINUTE or parsed[2] >= parsed[0].units:
+                raise zUIDException(f"{id} is not a moment of the calendar.");
+            value = parsed[1];
+        return value;
+
+
+    @staticmethod
+    def _locate(id: int | str | datetime.datetime | zUID) -> Tuple[int, int]:
+        """
+        Returns the day (since 1970-01-01) and the minute of the day of a zUID (of its minute for the finer formats).
+
+        Raises
+        ------
+        zUIDException
+            If the zUID is not a moment of the calendar (e.g. 202502310000).
+        """
+        year, month, day, hour, minute = ZettelkastenDecomposer.decompose_int(ZettelkastenOccupancy._minute(id));
+        if not (1 <= month <= 12 and 1 <= day <= calendar.days_in_month(year, month) and 0 <= hour <= 23 and 0 <= minute <= 59):
+            raise zUIDException(f"{id} is not a moment of the calendar.");
+        return calendar.to_days(year, month, day), hour * 60 + minute;
+
+
+    @staticmethod
+    def _compose(day: int, minute: int) -> zUID:
+        year, month, date = calendar.from_days(day);
+        return zUID(((year * 100 + month) * 100 + date) * 10000 + minute // 60 * 100 + minute % 60);
+
+
+    def add(self, id: int | zUID) -> bool:
+        """
+        Marks a zUID as taken.
+
+        Returns
+        -------
+        bool
+            `True` if the zUID was free, `False` if it was already taken.
+
+        Raises
+        ------
+        zUIDException
+            If the zUID is not a moment of the calendar.
+        """
+        day, minute = ZettelkastenOccupancy._locate(int(id));
+        mask : int = self._days.get(day, 0);
+        if mask >> minute & 1:
+            return False;
+        self._days[day] = mask | 1 << minute;
+        self._count += 1;
+        return True;
+
+
+    def is_free(self, id: int | str | datetime.datetime | zUID) -> bool:
+        """
+        Returns `True` if the zUID is not taken (raises `zUIDException` if it is not a moment of the calendar).
+        """
+        day, minute = ZettelkastenOccupancy._locate(id);
+        return not self._days.get(day, 0) >> minute & 1;
+
+
+    def first_free(self, at: int | str | datetime.datetime | zUID) -> zUID | None:
+        """
+        Returns the first free zUID at or after the given moment (what `ZettelkastenGenerator.allocate` would create),
+        skipping full days in one step each.
+
+        Parameters
+        ----------
+        at : int | str | datetime | zUID
+            The moment to search from.
+
+        Returns
+        -------
+        zUID | None
+            The first free zUID, or `None` if every zUID until 2170-12-31 23:59 is taken.
+        """
+        day, minute = ZettelkastenOccupancy._locate(at);
+        last_day : int = MAX_MINUTES // MINUTES_PER_DAY;
+        while day <= last_day:
+            #   Free minutes of the day from `minute` on
+            free : int = ~self._days.get(day, 0) & FULL_DAY & ~((1 << minute) - 1);
+            if free:
+                return ZettelkastenOccupancy._compose(day, (free & -free).bit_length() - 1);
+            day, minute = day + 1, 0;
+        return None;
+
+
+    def free_slots(self, date: int | str | datetime.datetime | zUID) -> List[zUID]:
+        """
+        Returns the free zUIDs of the day of the given moment, in order.
+        """
+        return [zuid for run in self.free_runs(date) for zuid in run];
+
+
+    def free_runs(self, date: int | str | datetime.datetime | zUID) -> List[ZettelkastenRange]:
+        """
+        Returns the runs of consecutive free zUIDs of the day of the given moment, as `ZettelkastenRange`s.
+        """
+        day, _ = ZettelkastenOccupancy._locate(date);
+        free    : int = ~self._days.get(day, 0) & FULL_DAY;
+        runs    : List[ZettelkastenRange] = [];
+        while free:
+            start   : int = (free & -free).bit_length() - 1;
+            taken   : int = ~free & ~((1 << start) - 1);
+            stop    : int = (taken & -taken).bit_length() - 1 if taken & FULL_DAY else MINUTES_PER_DAY;
+            base    : int = day * MINUTES_PER_DAY;
+            runs.append(ZettelkastenRange._from_minutes(range(base + start, base + stop)));
+            free &= ~((1 << stop) - 1);
+        return runs;
+
+
+    def count(self, date: int | str | datetime.datetime | zUID) -> int:
+        """
+        Returns the number of taken zUIDs of the day of the given moment.
+        """
+        return self._days.get(ZettelkastenOccupancy._locate(date)[0], 0).bit_count();
+
+
+    def day_counts(self, start: int | str | datetime.datetime | zUID, stop: int | str | datetime.datetime | zUID) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns the number of taken zUIDs of each day from the day of `start` to the day of `stop` (exclusive).
+        Requires NumPy.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The `datetime64[D]` days and their `int64` counts.
+        """
+        import numpy;
+
+        first, _    = ZettelkastenOccupancy._locate(start);
+        last, _     = ZettelkastenOccupancy._locate(stop);
+        days        : numpy.ndarray = numpy.arange(first, max(first, last), dtype=numpy.int64);
+        return days.astype("datetime64[D]"), self._counts(first, last);
+
+
+    def _counts(self, first: int, last: int) -> "numpy.ndarray":
+        """
+        Returns the number of taken zUIDs of each day from `first` to `last` (exclusive, days since 1970-01-01).
+        """
+        import numpy;
+
+        days    : Dict[int, int] = self._days;
+        length  : int = max(0, last - first);
+
+        #   Visits the days of the span, or the days holding zUIDs if there are fewer of them
+        if length <= len(days):
+            return numpy.fromiter((days.get(day, 0).bit_count() for day in range(first, last)), dtype=numpy.int64, count=length);
+        counts  : numpy.ndarray = numpy.zeros(length, dtype=numpy.int64);
+        for day, mask in days.items():
+            if first <= day < last:
+                counts[day - first] = mask.bit_count();
+        return counts;
+
+
+    def month_counts(self, start: int | str | datetime.datetime | zUID, stop: int | str | datetime.datetime | zUID) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns the number of taken zUIDs of each month from the month of `start` to the month of `stop` (exclusive).
+        Requires NumPy.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The `datetime64[M]` months and their `int64` counts.
+        """
+        import numpy;
+
+        first_year, first_month, *_ = ZettelkastenDecomposer.decompose_int(ZettelkastenOccupancy._minute(start));
+        last_year, last_month, *_   = ZettelkastenDecomposer.decompose_int(ZettelkastenOccupancy._minute(stop));
+        months  : numpy.ndarray = numpy.arange(f"{first_year:04d}-{first_month:02d}", f"{last_year:04d}-{last_month:02d}", dtype="datetime64[M]");
+        if len(months) == 0:
+            return months, numpy.zeros(0, dtype=numpy.int64);
+
+        #   Sums the day counts between the first days of consecutive months
+        bounds  : numpy.ndarray = numpy.append(months, months[-1] + 1).astype("datetime64[D]").astype(numpy.int64);
+        counts  : numpy.ndarray = self._counts(int(bounds[0]), int(bounds[-1]));
+        return months, numpy.add.reduceat(counts, bounds[:-1] - bounds[0]);
+
+
+    def __contains__(self, id: int | str | datetime.datetime | zUID) -> bool:
+        try:
+            return not self.is_free(id);
+        except Exception:
+            return False;
+
+
+    def __len__(self) -> int:
+        return self._count;
+
+
+    def __repr__(self) -> str:
+        return f"ZettelkastenOccupancy({self._count} zUIDs over {len(self._days)} days)";
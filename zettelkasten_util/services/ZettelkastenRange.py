@@ -0,0 +1,172 @@
+"""
+`ZettelkastenRange` module
+Implements the `ZettelkastenRange` class as a service.
+A `ZettelkastenRange` is a lazy, `range`-like sequence of zUIDs a fixed number of minutes apart,
+computed with integer calendar arithmetic instead of repeated `get_next` calls.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+from typing import Iterator;
+import datetime
+
+from ..data.ZettelkastenUniqueIdentifier import zUID;
+from ..engine.ZettelkastenDecomposer import decompose;
+from ..engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MINUTES_PER_DAY, MIN_MINUTES, MAX_MINUTES;
+
+
+class ZettelkastenRange:
+    """
+    `ZettelkastenRange` class.
+    Behaves like `range` over minutes: `len`, indexing, slicing, `in` and `index` are O(1),
+    and iteration yields `zUID` objects lazily.
+    Ranges are clipped to the well-formed zUIDs (1970-01-01 00:00 .. 2170-12-31 23:59).
+    """
+    __slots__ = ('_minutes',);
+
+    def __init__(self, start: int | str | datetime.datetime | zUID, stop: int | str | datetime.datetime | zUID, step: int = 1) -> None:
+        """
+        Initializes the range of zUIDs from `start` (inclusive) to `stop` (exclusive), `step` minutes apart.
+
+        Parameters
+        ----------
+        start : int | str | datetime | "zUID"
+            The first zUID of the range.
+        stop : int | str | datetime | "zUID"
+            The zUID the range stops before.
+        step : int
+            The number of minutes between consecutive zUIDs; negative to walk backwards.
+
+        Raises
+        ------
+        ValueError
+            If `step` is zero, or `start` or `stop` is not a moment of the calendar (e.g. 202502310000).
+        """
+        if step == 0:
+            raise ValueError("The step of a ZettelkastenRange must not be zero.");
+        first   : int = calendar.to_minutes_checked(*decompose(start));
+        last    : int = calendar.to_minutes_checked(*decompose(stop));
+        
+        #   Skip the leading steps that fall outside of the well-formed zUIDs, then stop at the other end
+        if step > 0:
+            first += max(0, -((first - MIN_MINUTES) // step)) * step;
+            last = min(last, MAX_MINUTES + 1);
+        else:
+            first += max(0, -((MAX_MINUTES - first) // -step)) * step;
+            last = max(last, MIN_MINUTES - 1);
+        self._minutes : range = range(first, last, step);
+
+
+    @staticmethod
+    def _from_minutes(minutes: range) -> "ZettelkastenRange":
+        out : ZettelkastenRange = ZettelkastenRange.__new__(ZettelkastenRange);
+        out._minutes = minutes;
+        return out;
+
+
+    @property
+    def step(self) -> int:
+        """
+        The number of minutes between consecutive zUIDs.
+        """
+        return self._minutes.step;
+
+
+    @property
+    def minutes(self) -> range:
+        """
+        The range of minutes since 1970-01-01 00:00 covered by this range.
+        """
+        return self._minutes;
+
+
+    def index(self, id: int | str | datetime.datetime | zUID) -> int:
+        """
+        Returns the position of a zUID in the range.
+
+        Raises
+        ------
+        ValueError
+            If the zUID is not in the range.
+        """
+        return self._minutes.index(calendar.to_minutes_checked(*decompose(id)));
+
+
+    def __len__(self) -> int:
+        return len(self._minutes);
+
+
+    def __getitem__(self, index: int | slice) -> "zUID | ZettelkastenRange":
+        if isinstance(index, slice):
+            return ZettelkastenRange._from_minutes(self._minutes[index]);
+        return zUID(calendar.compose(*calendar.from_minutes(self._minutes[index])));
+
+
+    def __contains__(self, id: int | str | datetime.datetime | zUID) -> bool:
+        try:
+            return calendar.to_minutes_checked(*decompose(id)) in self._minutes;
+        except Exception:
+            return False;
+
+
+    def __iter__(self) -> Iterator[zUID]:
+        #   The date part is recomputed only when the walk crosses into another day
+        current_day : int | None = None;
+        prefix      : int = 0;
+        for minutes in self._minutes:
+            day, minute_of_day = divmod(minutes, MINUTES_PER_DAY);
+            if day != current_day:
+                year, month, date = calendar.from_days(day);
+                prefix, current_day = ((year * 100 + month) * 100 + date) * 10000, day;
+            hour, minute = divmod(minute_of_day, 60);
+            yield zUID(prefix + hour * 100 + minute);
+
+
+    def __reversed__(self) -> Iterator[zUID]:
+        return iter(self[::-1]);
+
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ZettelkastenRange):
+            return self._minutes == other._minutes;
+        return NotImplemented;
+
+
+    def __hash__(self) -> int:
+        return hash(self._minutes);
+
+
+    def __repr__(self) -> str:
+        if not self._minutes:
+            return f"ZettelkastenRange(empty, step={self.step})";
+        return f"ZettelkastenRange(first={self[0]}, last={self[-1]}, step={self.step})";
+
+
+def zuid_range(start: int | str | datetime.datetime | zUID, stop: int | str | datetime.datetime | zUID, step: int = 1) -> ZettelkastenRange:
+    """
+    Exportable function for use in other modules.
+    Returns the lazy range of zUIDs from `start` (inclusive) to `stop` (exclusive), `step` minutes apart.
+
+    Parameters
+    ----------
+    start : int | str | datetime | "zUID"
+        The first zUID of the range.
+    stop : int | str | datetime | "zUID"
+        The zUID the range stops before.
+    step : int
+        The number of minutes between consecutive zUIDs (60 for hours, 1440 for days).
+
+    Returns
+    -------
+    ZettelkastenRange
+        The range of zUIDs.
+
+    Raises
+    ------
+    ValueError
+        If `step` is zero, or `start` or `stop` is not a moment of the calendar.
+    """
+    return ZettelkastenRange(start, stop, step);
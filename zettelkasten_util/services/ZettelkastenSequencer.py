@@ -9,17 +9,28 @@ The sequencer is responsible for generating the next and previous zUIDs of a giv
 @date           2025-02-14
 """
 
-from typing import List, Tuple, TypeVar, Any, Callable;
+from typing import Tuple, Any, TYPE_CHECKING;
 import datetime
 
 #   Zettelkasten Unique Identifier
-zUID = TypeVar("zUID");
+from ..data.ZettelkastenUniqueIdentifier import zUID;
 
 #   `decompose(id: int | str | datetime)` method of the `ZettelkastenDecomposer` class
-from engine.ZettelkastenDecomposer import decompose;
+from ..engine.ZettelkastenDecomposer import decompose;
 
-#   `build_from_datetime(id: datetime)` method of the `ZettelkastenBuilder` class
-from engine.ZettelkastenBuilder import build_from_datetime as build;
+#   `ZettelkastenBuilder` class, reporting the zUIDs that fall outside of the supported span
+from ..engine.ZettelkastenBuilder import ZettelkastenBuilder;
+
+#   Minute ordinals for single steps and k-step jumps, and batch decomposition/validation for `advance_many`
+from ..engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar, MIN_MINUTES, MAX_MINUTES;
+from ..engine.ZettelkastenDecomposer import ZettelkastenDecomposer;
+from ..engine.ZettelkastenValidator import ZettelkastenValidator;
+
+#   Resolutions of zUIDs: the next zUID of a 14-digit (17-digit) zUID is one second (millisecond) later
+from ..data.ZettelkastenFormat import ZettelkastenFormat;
+
+if TYPE_CHECKING:
+    import numpy;
 
 class ZettelkastenSequencer:
     """
@@ -28,9 +39,13 @@ class ZettelkastenSequencer:
     static methods
     --------------
     get_next(id: int | str | datetime | "zUID") -> "zUID"
-        Returns the next zUID of the given zUID.
+        Returns the next zUID of the given zUID (in its format, see `ZettelkastenFormat`).
     get_previous(id: int | str | datetime | "zUID") -> "zUID"
         Returns the previous zUID of the given zUID.
+    advance(id: int | str | datetime | "zUID", k: int) -> "zUID"
+        Returns the zUID `k` minutes (or seconds, or milliseconds) after the given zUID.
+    advance_many(ids: array_like, ks: array_like) -> Tuple[numpy.ndarray, numpy.ndarray]
+        Returns the zUIDs `ks` minutes after the given zUIDs, as integers.
     """
     @staticmethod
     def get_next(id: int | str | datetime.datetime | zUID) -> zUID:
@@ -49,8 +64,9 @@ class ZettelkastenSequencer:
         """
         if not id:
             return None;
-        dt : datetime.datetime = datetime.datetime(*decompose(id));
-        return build(dt + datetime.timedelta(minutes=1));
+        if ZettelkastenFormat.parse_fine(id) is not None:
+            return ZettelkastenSequencer.advance(id, 1);
+        return ZettelkastenSequencer._step(id, 1);
     
     @staticmethod
     def get_previous(id: int | str | datetime.datetime | zUID) -> zUID:
@@ -69,7 +85,96 @@ class ZettelkastenSequencer:
         """
         if not id:
             return None;
-        dt : datetime.datetime = datetime.datetime(*decompose(id));
-        return build(dt - datetime.timedelta(minutes=1));
+        if ZettelkastenFormat.parse_fine(id) is not None:
+            return ZettelkastenSequencer.advance(id, -1);
+        return ZettelkastenSequencer._step(id, -1);
+    
+    
+    @staticmethod
+    def _step(id: int | str | datetime.datetime | zUID, k: int) -> zUID:
+        """
+        Returns the 12-digit zUID `k` minutes after the given one, through its minute ordinal (integer arithmetic only).
+        
+        Raises
+        ------
+        ValueError
+            If the given zUID is not a moment of the calendar.
+        zUIDException
+            If the result falls outside of 1970-01-01 00:00 .. 2170-12-31 23:59.
+        """
+        if id.__class__ is not int:
+            id = calendar.compose(*decompose(id));
+        ordinal : int = calendar.to_ordinal(id) + k;
+        #   Within the same hour, the ordinal and the zUID move together
+        if 0 <= id % 100 + k <= 59:
+            return zUID(id + k);
+        if 0 <= ordinal <= MAX_MINUTES:
+            return zUID(calendar.from_ordinal(ordinal));
+        #   Let the builder report the out-of-span year
+        return ZettelkastenBuilder.from_int(calendar.compose(*calendar.from_minutes(ordinal)));
+    
+    
+    
+    @staticmethod
+    def advance(id: int | str | datetime.datetime | zUID, k: int) -> zUID:
+        """
+        Returns the zUID `k` minutes after the given zUID (before it if `k` is negative),
+        the same as `k` calls to `get_next` (or `-k` calls to `get_previous`) but in one integer computation.
+        For zUIDs of a finer format (see `ZettelkastenFormat`), `k` counts seconds or milliseconds.
+        
+        Parameters
+        ----------
+        id : int | str | datetime | "zUID"
+            The zUID to start from.
+        k : int
+            The number of minutes (seconds, milliseconds) to move by.
+            
+        Returns
+        -------
+        "zUID" | None
+            The zUID `k` minutes after the given zUID.
+        
+        Raises
+        ------
+        ValueError
+            If the given zUID is not a moment of the calendar (e.g. 202502310000).
+        """
+        if not id:
+            return None;
+        fine : Tuple[ZettelkastenFormat, int, int] | None = ZettelkastenFormat.parse_fine(id);
+        if fine is not None:
+            format, minute, part = fine;
+            if part >= format.units:
+                raise ValueError(f"{id} is not a moment of the calendar.");
+            minutes, part = divmod(calendar.to_ordinal(minute) * format.units + part + k, format.units);
+            if 0 <= minutes <= MAX_MINUTES:
+                return zUID(format.join(calendar.from_ordinal(minutes), part));
+            return ZettelkastenBuilder.from_int(format.join(calendar.compose(*calendar.from_minutes(minutes)), part));
+        return ZettelkastenSequencer._step(id, k);
+    
+    
+    @staticmethod
+    def advance_many(ids: Any, ks: Any) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns the zUIDs `ks` minutes after the given integer zUIDs, element-wise (`ks` may be a scalar).
+        Requires NumPy.
+        
+        Parameters
+        ----------
+        ids : array_like of int
+            The zUIDs to start from.
+        ks : array_like of int
+            The numbers of minutes to move by.
+            
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The `int64` zUIDs and a boolean mask, `False` where the given zUID is not a moment of the calendar
+            or the result falls outside of 1970-01-01 00:00 .. 2170-12-31 23:59.
+        """
+        import numpy;
         
-        
\ No newline at end of file
+        ids = numpy.asarray(ids, dtype=numpy.int64);
+        minutes : numpy.ndarray = calendar.to_minutes(*ZettelkastenDecomposer.decompose_many(ids, columns=True)) + numpy.asarray(ks, dtype=numpy.int64);
+        valid   : numpy.ndarray = ZettelkastenValidator.validate_many(ids, strict=True) & (minutes >= MIN_MINUTES) & (minutes <= MAX_MINUTES);
+        return calendar.compose(*calendar.from_minutes(minutes)), valid;
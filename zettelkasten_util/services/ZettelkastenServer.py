@@ -0,0 +1,361 @@
+"""
+`ZettelkastenServer` module
+Implements the `ZettelkastenServer` and `ZettelkastenClient` classes as a service.
+The server shares one `ZettelkastenGenerator` between local tools over a Unix-domain socket, so they never hand out
+conflicting zUIDs; the client is its asyncio counterpart, reusing one connection and pipelining batches.
+
+Protocol: one request per line, `<command> [<argument>]`, answered in order by one line, `ok <result>` or `err <message>`.
+Arguments are read as strings, so they are right-padded like in `ZettelkastenBuilder.from_string`, and cannot contain
+line breaks.
+
+-   `now` / `allocate [<at>]`: the next free zUID (at or after now, or `<at>`);
+-   `create <id>`: the created zUID, or `-` if it is not valid or already created;
+-   `validate <id>`: `1` or `0`;
+-   `decompose <id>`: `<year> <month> <day> <hour> <minute>`;
+-   `next <id>` / `previous <id>`: the next or previous zUID.
+
+Run a server from the directory containing the `zettelkasten_util` package with `python -m zettelkasten_util.services.ZettelkastenServer <socket path>`.
+
+@author         rdcn
+@version        1.2
+@since          1.2
+@date           2026-10-18
+"""
+
+import asyncio;
+import os;
+import stat;
+import sys;
+from typing import Callable, Dict, Iterable, List, Tuple;
+
+from ..data.ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from ..ZettelkastenGenerator import ZettelkastenGenerator;
+
+
+#   Socket used when no path is given
+DEFAULT_PATH : str = "/tmp/zettelkasten.sock";
+
+
+class ZettelkastenServer:
+    """
+    `ZettelkastenServer` class.
+    Serves the requests of every connection in order with a single generator; the generator calls are short,
+    so they run on the event loop and connections are interleaved between requests.
+    """
+    __slots__ = ('generator', 'path', '_server', '_commands');
+
+    def __init__(self, generator: ZettelkastenGenerator | None = None, path: str = DEFAULT_PATH) -> None:
+        """
+        Initializes the server.
+
+        Parameters
+        ----------
+        generator : ZettelkastenGenerator | None
+            The generator to serve; an allocating generator if `None`, so that `now` never fails.
+        path : str
+            The path of the Unix-domain socket.
+        """
+        self.generator  : ZettelkastenGenerator = generator if generator is not None else ZettelkastenGenerator(allocating=True);
+        self.path       : str = path;
+        self._server    : asyncio.AbstractServer | None = None;
+        self._commands  : Dict[str, Callable[[str], str]] = {
+            "now"       : lambda argument: str(self.generator.allocate()),
+            "allocate"  : lambda argument: str(self.generator.allocate(argument or None)),
+            "create"    : lambda argument: str(self.generator.create(argument) or "-"),
+            "validate"  : lambda argument: "1" if self.generator.validate(argument) else "0",
+            "decompose" : lambda argument: " ".join(map(str, self.generator.decompose(argument))),
+            "next"      : lambda argument: ZettelkastenServer._format(self.generator.get_next(argument)),
+            "previous"  : lambda argument: ZettelkastenServer._format(self.generator.get_previous(argument)),
+        };
+
+
+    @staticmethod
+    def _format(zuid: zUID | None) -> str:
+        if zuid is None:
+            raise zUIDException("The given argument is not a valid Zettelkasten Unique Identifier (ZUID).");
+        return str(zuid);
+
+
+    async def start(self) -> None:
+        """
+        Starts listening on the socket, replacing a stale socket file (one no server accepts connections on).
+
+        Raises
+        ------
+        FileExistsError
+            If the path is taken by a file that is not a socket, or by the socket of a running server.
+        """
+        if os.path.lexists(self.path):
+            if not await ZettelkastenServer._is_stale(self.path):
+                raise FileExistsError(f"{self.path} exists and is not a stale socket.");
+            os.unlink(self.path);
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path);
+
+
+    @staticmethod
+    async def _is_stale(path: str) -> bool:
+        """
+        Returns `True` if `path` is a Unix-domain socket refusing connections (left behind by a stopped server).
+        """
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            return False;
+        try:
+            _, writer = await asyncio.open_unix_connection(path);
+        except ConnectionRefusedError:
+            return True;
+        except OSError:
+            return False;
+        writer.close();
+        await writer.wait_closed();
+        return False;
+
+
+    async def serve_forever(self) -> None:
+        """
+        Starts the server if needed and serves until cancelled.
+        """
+        if self._server is None:
+            await self.start();
+        async with self._server:
+            await self._server.serve_forever();
+
+
+    async def close(self) -> None:
+        """
+        Stops listening and removes the socket file, if the server was listening.
+        """
+        if self._server is not None:
+            self._server.close();
+            await self._server.wait_closed();
+            self._server = None;
+            if os.path.lexists(self.path) and stat.S_ISSOCK(os.lstat(self.path).st_mode):
+                os.unlink(self.path);
+
+
+    def handle(self, line: str) -> str:
+        """
+        Returns the response line (without newline) of a request line.
+        """
+        line = line.rstrip("\r\n");
+        if "\n" in line or "\r" in line:
+            return "err a request must fit on one line";
+        command, _, argument = line.strip().partition(" ");
+        handler : Callable[[str], str] | None = self._commands.get(command);
+        if handler is None:
+            return f"err unknown command {command!r}";
+        try:
+            return "ok " + handler(argument.strip());
+        except Exception as e:
+            return ZettelkastenServer._error(e);
+
+
+    @staticmethod
+    def _error(e: Exception) -> str:
+        return f"err {e.__class__.__name__}: {e}".replace("\n", " ").replace("\r", " ");
+
+
+    def _respond(self, line: bytes) -> str:
+        """
+        Returns the response line of a raw request line; never raises, so that every request gets its response.
+        """
+        try:
+            return self.handle(line.decode());
+        except UnicodeDecodeError:
+            return "err a request must be UTF-8";
+        except Exception as e:
+            return ZettelkastenServer._error(e);
+
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line : bytes = await reader.readline();
+                except ValueError:
+                    #   A line longer than the limit of the stream: the rest of it could not be told from the next
+                    #   request, so the connection is answered once more and closed
+                    writer.write(b"err request line too long\n");
+                    await writer.drain();
+                    break;
+                if not line:
+                    break;
+                writer.write(self._respond(line).encode() + b"\n");
+                await writer.drain();
+        except ConnectionError:
+            pass;
+        finally:
+            writer.close();
+
+
+class ZettelkastenClient:
+    """
+    `ZettelkastenClient` class.
+    Asyncio client of a `ZettelkastenServer`, reusing one connection; concurrent requests are serialized on it
+    and `batch` pipelines many requests in one round trip.
+    """
+    __slots__ = ('path', '_reader', '_writer', '_lock');
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        Initializes the client; the connection is opened by the first request (or `connect`).
+        """
+        self.path       : str = path;
+        self._reader    : asyncio.StreamReader | None = None;
+        self._writer    : asyncio.StreamWriter | None = None;
+        self._lock      : asyncio.Lock = asyncio.Lock();
+
+
+    async def connect(self) -> None:
+        """
+        Opens the connection to the server if it is not open.
+        """
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path);
+
+
+    async def close(self) -> None:
+        """
+        Closes the connection.
+        """
+        if self._writer is not None:
+            self._writer.close();
+            await self._writer.wait_closed();
+            self._reader = self._writer = None;
+
+
+    async def __aenter__(self) -> "ZettelkastenClient":
+        await self.connect();
+        return self;
+
+
+    async def __aexit__(self, *args) -> None:
+        await self.close();
+
+
+    async def batch(self, requests: Iterable[Tuple[str, object]]) -> List[str | zUIDException]:
+        """
+        Sends requests at once and returns their results, in order; a failed request does not hide the others.
+
+        Parameters
+        ----------
+        requests : Iterable[Tuple[str, object]]
+            The `(command, argument)` requests; `None` stands for no argument.
+
+        Returns
+        -------
+        List[str | zUIDException]
+            The result of each request (the response without `ok `), or a `zUIDException` holding the error
+            message of a failed request.
+
+        Raises
+        ------
+        ValueError
+            If a command or an argument contains a line break (nothing is sent).
+        ConnectionError
+            If the server closed the connection before answering every request.
+        """
+        lines : List[str] = [f"{command} {'' if argument is None else argument}" for command, argument in requests];
+        if any("\n" in line or "\r" in line for line in lines):
+            raise ValueError("The commands and arguments of requests cannot contain line breaks.");
+        async with self._lock:
+            await self.connect();
+            #   Responses are read while the requests are sent, so that neither side blocks on a full socket
+            self._writer.write("".join(line + "\n" for line in lines).encode());
+            drained : asyncio.Future = asyncio.ensure_future(self._writer.drain());
+            try:
+                responses : List[str] = [];
+                for _ in lines:
+                    response : bytes = await self._reader.readline();
+                    if not response:
+                        raise ConnectionResetError("The server closed the connection.");
+                    responses.append(response.decode().rstrip("\n"));
+            except BaseException:
+                #   The connection is out of step with the requests: the next request opens a new one
+                self._writer.close();
+                self._reader = self._writer = None;
+                raise;
+            finally:
+                drained.cancel();
+                await asyncio.gather(drained, return_exceptions=True);
+
+        return [response[3:] if response.startswith("ok ") else zUIDException(response[4:]) for response in responses];
+
+
+    async def request(self, command: str, argument: object = None) -> str:
+        """
+        Sends one request and returns its result.
+
+        Raises
+        ------
+        zUIDException
+            If the request failed.
+        """
+        result : str | zUIDException = (await self.batch(((command, argument),)))[0];
+        if isinstance(result, zUIDException):
+            raise result;
+        return result;
+
+
+    async def now(self) -> zUID:
+        """
+        Returns the next free zUID at or after now.
+        """
+        return zUID(int(await self.request("now")));
+
+
+    async def allocate(self, at: int | str | None = None) -> zUID:
+        """
+        Returns the next free zUID at or after `at` (default: now).
+        """
+        return zUID(int(await self.request("allocate", at)));
+
+
+    async def create(self, id: int | str) -> zUID | None:
+        """
+        Creates a zUID; `None` if it is not valid or already created.
+        """
+        result : str = await self.request("create", id);
+        return None if result == "-" else zUID(int(result));
+
+
+    async def validate(self, id: int | str) -> bool:
+        """
+        Validates a zUID.
+        """
+        return await self.request("validate", id) == "1";
+
+
+    async def decompose(self, id: int | str) -> Tuple[int, int, int, int, int]:
+        """
+        Returns the (year, month, day, hour, minute) components of a zUID.
+        """
+        return tuple(map(int, (await self.request("decompose", id)).split()));
+
+
+    async def next(self, id: int | str) -> zUID:
+        """
+        Returns the next zUID.
+        """
+        return zUID(int(await self.request("next", id)));
+
+
+    async def previous(self, id: int | str) -> zUID:
+        """
+        Returns the previous zUID.
+        """
+        return zUID(int(await self.request("previous", id)));
+
+
+def serve(path: str = DEFAULT_PATH) -> None:
+    """
+    Exportable function for use in other modules.
+    Runs a server with an allocating generator on the given socket until interrupted.
+    """
+    try:
+        asyncio.run(ZettelkastenServer(path=path).serve_forever());
+    except KeyboardInterrupt:
+        pass;
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH);
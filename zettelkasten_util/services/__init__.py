@@ -0,0 +1,4 @@
+"""
+`zettelkasten_util.services` package
+Services built on the engine: sequencer, ranges, occupancy, vault scanner and indexer, server and instrumentation.
+"""
@@ -0,0 +1,918 @@
+"""
+Unit tests suite for the `zettelkasten_util` package.
+"""
+
+import asyncio;
+import calendar as gregorian;
+import io;
+import os;
+import pickle;
+import random;
+import socket;
+import threading;
+from concurrent.futures import ProcessPoolExecutor;
+import pytest;
+
+from datetime import datetime, timedelta, timezone;
+from typing import List, Tuple;
+from zettelkasten_util.engine.ZettelkastenDecomposer import ZettelkastenDecomposer as decomposer;
+from zettelkasten_util.engine.ZettelkastenValidator import ZettelkastenValidator as validator, ERROR_MALFORMED, ERROR_SECOND, ERROR_YEAR, ERROR_MONTH, ERROR_DAY;
+from zettelkasten_util.engine.ZettelkastenBuilder import ZettelkastenBuilder as builder;
+from zettelkasten_util.data.ZettelkastenIndex import ZettelkastenIndex;
+from zettelkasten_util.data.ZettelkastenUniqueIdentifier import zUID, zUIDException;
+from zettelkasten_util.data.ZettelkastenArray import ZUIDArray;
+from zettelkasten_util.data.ZettelkastenFormat import ZettelkastenFormat, MINUTE, SECOND, MILLISECOND, sort_key;
+from zettelkasten_util.data.ZettelkastenFileIndex import ZettelkastenFileIndex;
+from zettelkasten_util.data.ZettelkastenSQLiteIndex import ZettelkastenSQLiteIndex;
+from zettelkasten_util.engine.ZettelkastenCalendar import ZettelkastenCalendar as calendar;
+from zettelkasten_util.engine.ZettelkastenCache import ZettelkastenCache, LRUCache;
+from zettelkasten_util.services.ZettelkastenSequencer import ZettelkastenSequencer as sequencer;
+from zettelkasten_util.services.ZettelkastenRange import zuid_range;
+from zettelkasten_util.services.ZettelkastenOccupancy import ZettelkastenOccupancy;
+from zettelkasten_util.services.ZettelkastenClock import ZettelkastenClock, UTC;
+from zettelkasten_util.services.ZettelkastenCodec import ZettelkastenCodec as codec, load;
+from zettelkasten_util.services.ZettelkastenServer import ZettelkastenServer, ZettelkastenClient;
+from zettelkasten_util.services.ZettelkastenInstrumentation import ZettelkastenInstrumentation as instrumentation, instrumented;
+from zettelkasten_util.services.ZettelkastenScanner import ZettelkastenScanner, scan_vault;
+from zettelkasten_util.services.ZettelkastenIndexer import ZettelkastenIndexer, VaultIndex, index_vault;
+from zettelkasten_util.ZettelkastenGenerator import ZettelkastenGenerator, CreateResult;
+from zettelkasten_util.benchmarks import suite, startup_benchmark;
+import zettelkasten_util;
+
+#   Defines the fixture for random well-formed and ill-formed 12-digit integers
+@pytest.fixture
+def twelve_digit_ids() -> List[int]:
+    rng : random.Random = random.Random(20250214);
+    return [rng.randint(10 ** 11, 10 ** 12 - 1) for _ in range(20000)] + [
+        197001010000, 217012312359, 202502141151, 202502310000, 100000000000, 999999999999,
+    ];
+
+#   Defines the fixture for well-formed ZUIDs and their components
+@pytest.fixture
+def zuid_data() -> List[Tuple[int, Tuple[int, int, int, int, int]]]:
+    return [
+        (197001010000, (1970, 1, 1, 0, 0)),
+        (199507141431, (1995, 7, 14, 14, 31)),
+        (202502141151, (2025, 2, 14, 11, 51)),
+        (217012312359, (2170, 12, 31, 23, 59)),
+    ];
+
+#   Tests the arithmetic `decompose_int` against its string-slicing counterpart
+def test_decompose_int_matches_string_path(twelve_digit_ids: List[int]):
+    """
+    Tests that `decompose_int` and `decompose_int_string` agree on every 12-digit integer.
+    """
+    for id in twelve_digit_ids:
+        assert decomposer.decompose_int(id) == decomposer.decompose_int_string(id);
+
+#   Tests the `ZettelkastenDecomposer.decompose` method
+def test_decompose(zuid_data: List[Tuple[int, Tuple[int, int, int, int, int]]]):
+    """
+    Tests the `ZettelkastenDecomposer.decompose` method.
+    """
+    for id, expected in zuid_data:
+        assert decomposer.decompose(id) == expected;
+        assert decomposer.decompose(str(id)) == expected;
+
+#   Tests the `ZettelkastenValidator.validate` method against the string-based checks
+def test_validate_matches_string_path(twelve_digit_ids: List[int]):
+    """
+    Tests that the integer range check in `validate` agrees with validating the sliced components.
+    """
+    for id in twelve_digit_ids:
+        year, month, day, hour, minute = decomposer.decompose_int_string(id);
+        expected : bool = (validator.validate_year(year) and validator.validate_month(month) and validator.validate_day(day)
+                           and validator.validate_hour(hour) and validator.validate_minute(minute));
+        assert validator.validate(id) == expected;
+
+#   Tests that integers which are not 12 digits long are rejected
+def test_validate_rejects_wrong_length():
+    """
+    Tests that `validate` rejects integers with fewer or more than 12 digits.
+    """
+    for id in [0, -202502141151, 20250214115, 2025021411510, 19700101000]:
+        assert validator.validate(id) == False;
+
+#   Tests strict validation against the `calendar` module
+def test_validate_strict(twelve_digit_ids: List[int]):
+    """
+    Tests that strict validation accepts exactly the days that exist in their month.
+    """
+    ids : List[int] = twelve_digit_ids + [202402290000, 202502290000, 210002290000, 200002291200, 202504310000, 202512312359];
+    for id in ids:
+        year, month, day, hour, minute = decomposer.decompose_int(id);
+        expected : bool = validator.validate(id) and day <= gregorian.monthrange(year, month)[1];
+        assert validator.validate(id, strict=True) == expected;
+        assert validator.validate(str(id), strict=True) == expected;
+        assert (validator.find_error_code(id, strict=True) == 0) == expected;
+    
+    assert validator.find_error(202502310000, strict=True) == ["Day 31 is not between 1 and 28."];
+    assert validator.find_error(202502310000) == ["The given argument is a valid Zettelkasten Unique Identifier (ZUID)."];
+    assert validator.find_error(202513320000, strict=True) == ["Month 13 is not between 1 and 12.", "Day 32 is not between 1 and 31."];
+    
+    with pytest.raises(Exception):
+        builder.build(202502310000, strict=True);
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(strict=True);
+    assert zgen.create(202502310000) is None and zgen.create(202402290000) is not None;
+
+#   Tests the batch API against the scalar one
+def test_validate_many_matches_scalar(twelve_digit_ids: List[int]):
+    """
+    Tests that `validate_many` and `find_error_many` agree with `validate` and `find_error`.
+    """
+    numpy = pytest.importorskip("numpy");
+    ids : List[int] = twelve_digit_ids + [0, -1, 20250214115, 2025021411510];
+    
+    for strict in (False, True):
+        mask    = validator.validate_many(numpy.array(ids, dtype=numpy.int64), strict=strict);
+        codes   = validator.find_error_many(ids, strict=strict);
+        for id, valid, code in zip(ids, mask.tolist(), codes.tolist()):
+            assert valid == validator.validate(id, strict=strict);
+            assert code == validator.find_error_code(id, strict=strict);
+            if code:
+                assert len(validator.find_error(id, strict=strict)) == bin(code).count("1");
+
+#   Tests the `ZettelkastenDecomposer.decompose_many` method
+def test_decompose_many(zuid_data: List[Tuple[int, Tuple[int, int, int, int, int]]]):
+    """
+    Tests both output layouts of `decompose_many`.
+    """
+    pytest.importorskip("numpy");
+    ids : List[int] = [id for id, _ in zuid_data];
+    
+    table = decomposer.decompose_many(ids);
+    columns = decomposer.decompose_many(ids, columns=True);
+    for row, (_, expected) in enumerate(zuid_data):
+        assert tuple(int(value) for value in table[row]) == expected;
+        assert tuple(int(column[row]) for column in columns) == expected;
+
+#   Tests the `ZettelkastenBuilder.build_many` method on each input type
+def test_build_many():
+    """
+    Tests that `build_many` agrees with `build` for integers, strings and `datetime64` values.
+    """
+    numpy = pytest.importorskip("numpy");
+    strings : List[str] = ["202502141151", "2025", "20250214", "199507141432", "2025023", "abc", "202513010000"];
+    
+    values, codes = builder.build_many(numpy.array(strings));
+    for string, value, code in zip(strings, values.tolist(), codes.tolist()):
+        try:
+            assert builder.build(string).id == value and code == 0;
+        except Exception:
+            assert code != 0;
+    assert codes.tolist()[strings.index("abc")] == ERROR_MALFORMED;
+    
+    values, codes = builder.build_many(numpy.array(["2025-02-14T11:51:42", "1995-07-14T14:33"], dtype="datetime64[s]"));
+    assert values.tolist() == [202502141151, 199507141433] and codes.tolist() == [0, 0];
+    
+    values, codes = builder.build_many([202502141151, 202502141199]);
+    assert codes.tolist()[0] == 0 and codes.tolist()[1] != 0;
+
+#   Tests the `zUID` class
+def test_zuid():
+    """
+    Tests immutability, comparisons against zUIDs and integers, interning and pickling of `zUID`.
+    """
+    zuid : zUID = zUID(202502141151);
+    
+    with pytest.raises(AttributeError):
+        zuid.id = 202502141152;
+    assert not hasattr(zuid, "__dict__");
+    
+    assert zuid == zUID(202502141151) and zuid == 202502141151 and 202502141151 == zuid;
+    assert zuid != 202502141152 and zuid < 202502141152 and zuid <= zUID(202502141151) and 202502141152 > zuid;
+    assert hash(zuid) == hash(202502141151) and 202502141151 in {zuid};
+    assert (zuid == "202502141151") == False;
+    
+    assert zUID.intern(202502141151) is zUID.intern(202502141151);
+    assert pickle.loads(pickle.dumps(zuid)) == zuid;
+
+#   Tests the `ZettelkastenIndex` class
+@pytest.mark.parametrize("compact", [False, True])
+def test_index(compact: bool):
+    """
+    Tests membership, insertion order and ordered queries of `ZettelkastenIndex`, with out-of-order insertions.
+    """
+    ids     : List[int] = [202502141151, 197001010000, 217012312359, 199507141431];
+    index   : ZettelkastenIndex = ZettelkastenIndex((builder.build(id) for id in ids), compact=compact);
+    
+    assert [zuid.id for zuid in index] == ids;
+    assert index.add(builder.build(202502141151)) == False and len(index) == 4;
+    assert 199507141431 in index and builder.build(199507141431) in index and 199507141432 not in index;
+    assert [zuid.id for zuid in index.sorted()] == sorted(ids);
+    assert [zuid.id for zuid in index.range(199507141431, 202502141151)] == [199507141431];
+    assert [zuid.id for zuid in index.range(builder.build(199507141431), 217012312359 + 1)] == sorted(ids)[1:];
+    
+    #   Range queries between out-of-order insertions, across merges of the tail
+    rng     : random.Random = random.Random(0);
+    more    : List[int] = suite.well_formed(3000);
+    for position, id in enumerate(more):
+        index.add(zUID(id));
+        if position % 250 == 0:
+            low, high = sorted(rng.sample(more, 2));
+            assert [zuid.id for zuid in index.range(low, high)] == sorted({id for id in ids + more[:position + 1] if low <= id < high});
+    assert all(id in index for id in more) and 197001010001 not in index and "202502141151" not in index;
+    assert [zuid.id for zuid in index.sorted()] == sorted(set(ids + more)) and [zuid.id for zuid in index][:4] == ids;
+
+#   Tests the `ZUIDArray` class
+def test_zuid_array():
+    """
+    Tests insertion, slicing, binary search, set operations and buffer export of `ZUIDArray`.
+    """
+    array : ZUIDArray = ZUIDArray([199507141431, zUID(202502141151)]);
+    array.append(217012312359);
+    array.insort(200001010000);
+    
+    assert [zuid.id for zuid in array] == [199507141431, 200001010000, 202502141151, 217012312359];
+    assert isinstance(array[0], zUID) and array[-1] == 217012312359;
+    assert array[1:3] == ZUIDArray([200001010000, 202502141151]);
+    assert array.search(202502141151) == 2 and array.search(202502141152) == -1 and 200001010000 in array;
+    
+    other : ZUIDArray = ZUIDArray([202502141151, 197001010000]);
+    assert list(array | other) == [197001010000, 199507141431, 200001010000, 202502141151, 217012312359];
+    assert list(array & other) == [202502141151];
+    assert list(array - other) == [199507141431, 200001010000, 217012312359];
+    
+    view : memoryview = array.buffer();
+    assert view.format == "q" and view.tolist() == [199507141431, 200001010000, 202502141151, 217012312359];
+    view.release();
+    assert ZUIDArray.from_buffer(array.buffer()) == array;
+
+#   Tests the `ZettelkastenGenerator.create` method
+@pytest.mark.parametrize("compact", [False, True])
+def test_generator_create(compact: bool):
+    """
+    Tests that `create` rejects duplicates and records `identifiers` and `history` in creation order.
+    """
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(compact=compact);
+    
+    assert zgen.create(202502141151).id == 202502141151;
+    assert zgen.create("202502141151") is None;
+    assert zgen.create(199507141431).id == 199507141431;
+    assert zgen.current.id == 199507141431;
+    assert [zuid.id for zuid in zgen.identifiers] == [zuid.id for zuid in zgen.history] == [202502141151, 199507141431];
+    assert [zuid.id for zuid in zgen.identifiers.sorted()] == [199507141431, 202502141151];
+    assert 202502141151 in zgen.identifiers and zgen.identifiers[0] == 202502141151;
+
+#   Tests that the `history` of a generator cannot be used to change its index
+@pytest.mark.parametrize("compact", [False, True])
+def test_generator_history_read_only(compact: bool):
+    """
+    Tests that appending to or deleting from `history` leaves `identifiers` unchanged.
+    """
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(compact=compact);
+    zgen.create(202502141151);
+    zgen.create(199507141431);
+    
+    history = zgen.history;
+    for mutate in (lambda: history.append(zUID(202502141152)), lambda: history.__delitem__(0)):
+        try:
+            mutate();
+        except (AttributeError, TypeError):
+            pass;
+    assert [zuid.id for zuid in zgen.identifiers] == [zuid.id for zuid in zgen.history] == [202502141151, 199507141431];
+    assert len(zgen.identifiers) == 2 and 202502141152 not in zgen.identifiers;
+    assert [zuid.id for zuid in zgen.identifiers.sorted()] == [199507141431, 202502141151];
+    
+    #   The view follows the index without being copied
+    zgen.create(202502141152);
+    assert len(history) == 3 and history[-1] == 202502141152 and 199507141431 in history and list(history[1:]) == [199507141431, 202502141152];
+
+#   Tests the `ZettelkastenGenerator.allocate` method
+def test_generator_allocate():
+    """
+    Tests that `allocate` skips taken zUIDs, including across threads, and never returns duplicates.
+    """
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator();
+    zgen.create(202502142359);
+    zgen.create(202502150001);
+    
+    assert zgen.allocate(202502142358).id == 202502142358;
+    assert zgen.allocate(202502142358).id == 202502150000;
+    assert zgen.allocate(datetime(2025, 2, 14, 23, 58)).id == 202502150002;
+    assert zgen.create(202502150002) is None;
+    
+    allocated : List[zUID] = [];
+    def worker() -> None:
+        for _ in range(200):
+            allocated.append(zgen.allocate(202502141200));
+    threads : List[threading.Thread] = [threading.Thread(target=worker) for _ in range(8)];
+    for thread in threads:
+        thread.start();
+    for thread in threads:
+        thread.join();
+    assert len(set(allocated)) == len(allocated) == 1600;
+    assert len(zgen.identifiers) == len(set(zgen.identifiers)) == 1605;
+    
+    zgen = ZettelkastenGenerator(allocating=True);
+    assert zgen.now() is not None and zgen.now() is not None and len(zgen.identifiers) == 2;
+
+#   Tests the `ZettelkastenCalendar` conversions against `datetime`
+def test_calendar_minutes():
+    """
+    Tests that `to_minutes` and `from_minutes` agree with `datetime` arithmetic on every day of 1970-2170.
+    """
+    epoch : datetime = datetime(1970, 1, 1);
+    for days in range(0, calendar.to_days(2171, 1, 1), 1):
+        date : datetime = epoch + (datetime(1970, 1, 2) - epoch) * days;
+        assert calendar.from_days(days) == (date.year, date.month, date.day);
+        assert calendar.to_days(date.year, date.month, date.day) == days;
+    assert calendar.from_minutes(calendar.to_minutes(2024, 2, 29, 23, 59) + 1) == (2024, 3, 1, 0, 0);
+
+#   Tests the `zuid_range` service against repeated `get_next` calls
+@pytest.mark.parametrize("start, stop, step", [
+    (202412311200, 202501010130, 1),
+    (202402280000, 202403020000, 37),
+    (190001010000, 197001010300, 60),
+    (202503011200, 202502270000, -1440),
+])
+def test_zuid_range(start: int, stop: int, step: int):
+    """
+    Tests iteration, length, indexing and membership of `zuid_range`, and that its endpoints must be moments.
+    """
+    walk : List[int] = [];
+    current : zUID = builder.build(max(start, 197001010000));
+    while (step > 0 and current < stop) or (step < 0 and current > stop):
+        walk.append(current.id);
+        for _ in range(abs(step)):
+            current = sequencer.get_next(current) if step > 0 else sequencer.get_previous(current);
+    
+    zuids = zuid_range(start, stop, step);
+    assert [zuid.id for zuid in zuids] == walk and len(zuids) == len(walk);
+    assert [zuids[i].id for i in range(-len(walk), len(walk))] == walk + walk;
+    assert [zuid.id for zuid in zuids[1::2]] == walk[1::2];
+    assert all(id in zuids for id in walk) and zuids.index(walk[-1]) == len(walk) - 1;
+    assert 202502310000 not in zuids;
+    for start, stop in ((202502310000, 202503050000), (202502140000, 202502142460)):
+        with pytest.raises(ValueError):
+            zuid_range(start, stop, step);
+
+#   Tests `ZettelkastenSequencer.advance` and `advance_many` against repeated `get_next` / `get_previous` calls
+@pytest.mark.parametrize("id", [202412312358, 202402282350, 210002282359, 197001010003, 202503010001])
+def test_advance(id: int):
+    """
+    Tests that `advance(id, k)` equals `k` calls to `get_next` (or `-k` calls to `get_previous`).
+    """
+    forward  : List[int] = [id];
+    backward : List[int] = [id];
+    for _ in range(1500):
+        forward.append(sequencer.get_next(forward[-1]).id);
+        if backward[-1] > 197001010000:
+            backward.append(sequencer.get_previous(backward[-1]).id);
+    
+    for k in range(0, 1500, 7):
+        assert sequencer.advance(id, k).id == forward[k];
+        if k < len(backward):
+            assert sequencer.advance(id, -k).id == backward[k];
+    with pytest.raises(ValueError):
+        sequencer.advance(202502310000, 1);
+    
+    numpy = pytest.importorskip("numpy");
+    ks = numpy.arange(-1499, 1500);
+    values, valid = sequencer.advance_many(numpy.full(ks.shape, id), ks);
+    for k, value, ok in zip(ks.tolist(), values.tolist(), valid.tolist()):
+        expected : List[int] = forward if k >= 0 else backward;
+        assert ok == (abs(k) < len(expected));
+        if ok:
+            assert value == expected[abs(k)];
+    assert sequencer.advance_many([202502310000, id], 1)[1].tolist() == [False, True];
+
+#   Tests the `ZettelkastenCache` class
+def test_cache():
+    """
+    Tests that cached builds and validations match the uncached ones, including right-padded strings,
+    and that the LRU counters and eviction are right.
+    """
+    cache : ZettelkastenCache = ZettelkastenCache(maxsize=3);
+    
+    assert cache.build("20250214").id == 202502140000;
+    assert cache.build(202502140000) is cache.build(datetime(2025, 2, 14, 0, 0, 42));
+    assert cache.validate("20250214") == validator.validate("20250214") == False;
+    assert cache.validate(202502140000) == True and cache.validate(zUID(202502140000)) == True;
+    with pytest.raises(Exception):
+        cache.build(202502141199);
+    
+    build, validate = cache.stats()["build"], cache.stats()["validate"];
+    assert (build.hits, build.misses, build.size) == (2, 2, 1);
+    assert (validate.hits, validate.misses, validate.size) == (1, 2, 2);
+    
+    for id in (202502140001, 202502140002, 202502140003):
+        cache.build(id);
+    assert cache.stats()["build"].evictions == 1 and cache.stats()["build"].size == 3;
+    cache.build(202502140001);
+    assert cache.stats()["build"].hit_rate == 3 / 8;
+    
+    assert ZettelkastenCache(strict=True).validate(202502310000) == False;
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(cache_size=16);
+    assert zgen.create("20250214").id == 202502140000 and zgen.create(202502140000) is None;
+    assert zgen.cache.stats()["build"].hits == 1;
+
+#   Tests the `LRUCache` class from several threads
+def test_lru_cache_threads():
+    """
+    Tests that concurrent lookups keep the counters consistent and the size bounded.
+    """
+    cache : LRUCache = LRUCache(64);
+    def worker(seed: int) -> None:
+        rng : random.Random = random.Random(seed);
+        for _ in range(2000):
+            key : int = rng.randrange(128);
+            assert cache.get(key, lambda: key * 2) == key * 2;
+    threads : List[threading.Thread] = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)];
+    for thread in threads:
+        thread.start();
+    for thread in threads:
+        thread.join();
+    stats = cache.stats();
+    assert stats.hits + stats.misses == 16000 and stats.size == 64 and stats.evictions <= stats.misses - 64;
+
+#   Tests that `create` decomposes each input exactly once, whatever its type
+@pytest.mark.parametrize("id", [202502142330, "202502142330", "20250214", datetime(2025, 2, 14, 23, 30), zUID(202502142330), 202502142399, "2025021499"])
+def test_create_decomposes_once(id: int | str | datetime | zUID, monkeypatch: pytest.MonkeyPatch):
+    """
+    Tests that `create` calls the decomposer once per input (through `decompose_int`), and that `build` rejects floats.
+    """
+    calls : List[str] = [];
+    for name in ("decompose", "decompose_int", "decompose_string", "decompose_datetime"):
+        method = getattr(decomposer, name);
+        monkeypatch.setattr(decomposer, name, staticmethod(lambda *args, _name=name, _method=method: calls.append(_name) or _method(*args)));
+    
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator();
+    zgen.create(id);
+    assert calls == ["decompose_int"];
+    with pytest.raises(zUIDException):
+        builder.build(2025.0);
+
+#   Tests the `ZettelkastenScanner` class on a small vault
+@pytest.mark.parametrize("batch_size", [1, 3, 4096])
+def test_scanner(batch_size: int, tmp_path):
+    """
+    Tests the records of `ZettelkastenScanner` (file names and contents, lenient and strict) at several batch sizes.
+    """
+    (tmp_path / "notes").mkdir();
+    note : bytes = b"---\nid: 202502141151\n---\nSee [[202502141152]], 2025021411521 and 202513011200.\n";
+    (tmp_path / "notes" / "202502141151 First note.md").write_bytes(note);
+    (tmp_path / "notes" / "empty.md").write_bytes(b"");
+    (tmp_path / "b.md").write_bytes(b"[[202502311200]] [[202502290000]]");
+    (tmp_path / "skipped.txt").write_bytes(b"202502141151");
+    
+    scanner : ZettelkastenScanner = ZettelkastenScanner(batch_size=batch_size);
+    records : List[Tuple[str, int, int]] = [(os.path.relpath(path, tmp_path), offset, zuid.id) for path, offset, zuid in scanner.scan(tmp_path)];
+    assert records == [
+        ("b.md", 2, 202502311200), ("b.md", 19, 202502290000),
+        (os.path.join("notes", "202502141151 First note.md"), -1, 202502141151),
+        (os.path.join("notes", "202502141151 First note.md"), 8, 202502141151),
+        (os.path.join("notes", "202502141151 First note.md"), note.index(b"202502141152"), 202502141152),
+    ];
+    assert [match.zuid.id for match in ZettelkastenScanner(strict=True, batch_size=batch_size).scan(tmp_path / "b.md")] == [];
+    assert len(list(scan_vault(tmp_path / "skipped.txt"))) == 1;
+
+#   Tests the `ZettelkastenIndexer` class, in process and with a pool of workers
+@pytest.mark.parametrize("workers", [1, 2])
+def test_indexer(workers: int, tmp_path):
+    """
+    Tests that `index_vault` finds the notes, links and duplicates of a vault with one and two workers.
+    """
+    (tmp_path / "a").mkdir();
+    (tmp_path / "a" / "202502141151 Note.md").write_bytes(b"Links: [[202502141152]] [[202502141153]] [[202502141151]]");
+    (tmp_path / "a" / "202502141152 Copy.md").write_bytes(b"[[202502141151]]");
+    (tmp_path / "b.md").write_bytes(b"---\nid: 202502141152\n---\n[[202502141153]] [[202502141153]]");
+    (tmp_path / "c.md").write_bytes(b"No identifier here.");
+    for index in range(10):
+        (tmp_path / f"{202501010000 + index} Filler.md").write_bytes(b"[[202502141151]]");
+    
+    vault : VaultIndex = index_vault(tmp_path, workers=workers);
+    assert list(vault.ids) == [202501010000 + index for index in range(10)] + [202502141151, 202502141152];
+    assert vault.path(202502141151) == str(tmp_path / "a" / "202502141151 Note.md") and vault.path(202502141153) is None;
+    assert vault.duplicates == {202502141152: [str(tmp_path / "a" / "202502141152 Copy.md"), str(tmp_path / "b.md")]};
+    assert (202502141151, 202502141152) in vault.links and (202502141152, 202502141153) in vault.links;
+    assert len(vault.links) == 14 and vault.links == sorted(vault.links);
+    assert len(vault.to_index(compact=True)) == 12;
+    assert [len(shard) for shard in ZettelkastenIndexer.shard(list(range(10)), 4)] == [3, 3, 2, 2];
+
+#   Tests the `ZettelkastenFileIndex` class: tail replay, compaction, torn records and the generator at startup
+def test_file_index(tmp_path):
+    """
+    Tests that `ZettelkastenFileIndex` replays its tail, compacts, skips torn records and feeds the generator.
+    """
+    path : str = str(tmp_path / "zuids.idx");
+    ZettelkastenFileIndex.write(path, [202502141153, 202502141151, 202502141151]);
+    with ZettelkastenFileIndex(path, tail_limit=4) as index:
+        assert len(index) == 2 and 202502141151 in index and 202502141152 not in index;
+        assert index.add(202502141152) and not index.add(202502141153) and index.add(zUID(202502141100));
+        assert list(index) == [202502141100, 202502141151, 202502141152, 202502141153];
+    
+    #   A torn record at the end of the tail is dropped on replay
+    with open(path + ".wal", "ab") as wal:
+        wal.write(b"\x01\x02\x03");
+    with ZettelkastenFileIndex(path, tail_limit=3) as index:
+        assert len(index) == 4 and list(index.range(202502141151, 202502141153)) == [202502141151, 202502141152];
+        assert index.add(202502141154) and os.path.getsize(path + ".wal") == 0;
+        assert list(index.sorted()) == [202502141100, 202502141151, 202502141152, 202502141153, 202502141154];
+        assert list(index.history) == [202502141154];
+    
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(index_path=path);
+    assert zgen.create(202502141154) is None and zgen.create(202502141155).id == 202502141155;
+    assert zgen.allocate(202502141151).id == 202502141156 and list(zgen.history) == [202502141155, 202502141156];
+    zgen.identifiers.close();
+    assert len(ZettelkastenGenerator(index_path=path).identifiers) == 7;
+    
+    with open(str(tmp_path / "other"), "wb") as file:
+        file.write(b"not an index");
+    with pytest.raises(zUIDException):
+        ZettelkastenFileIndex(str(tmp_path / "other"));
+
+#   Tests that out-of-order bulk additions to a `ZettelkastenFileIndex` are sorted by the ordered queries and the compaction
+def test_file_index_unordered_tail(tmp_path):
+    """
+    Tests ordered queries and compaction of a `ZettelkastenFileIndex` whose tail was filled out of order.
+    """
+    path    : str = str(tmp_path / "zuids.idx");
+    ids     : List[int] = [202502141100 + minute for minute in (30, 5, 59, 17, 42, 0)];
+    with ZettelkastenFileIndex(path, tail_limit=100) as index:
+        assert index.add_many(ids + [202502141105]) == [True] * 6 + [False];
+        assert list(index.history) == ids and list(index.range(202502141105, 202502141142)) == [202502141105, 202502141117, 202502141130];
+        assert index.add(202502141101) and list(index) == sorted(ids + [202502141101]);
+        index.add(202502141150);
+        index.compact_tail();
+        assert list(index.sorted()) == sorted(ids + [202502141101, 202502141150]);
+    with ZettelkastenFileIndex(path) as index:
+        assert len(index) == 8 and 202502141117 in index and list(index) == sorted(ids + [202502141101, 202502141150]);
+
+#   Allocates `count` zUIDs from 2025-02-14 23:30 with a generator on the given database (run in worker processes)
+def allocate_from_database(path: str, count: int) -> List[int]:
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(database_path=path);
+    return [zgen.allocate(202502142330).id for _ in range(count)];
+
+#   Tests that every index sorts and ranges zUIDs of mixed formats chronologically
+@pytest.mark.parametrize("kind", ["memory", "compact", "file", "sqlite"])
+def test_index_mixed_formats(tmp_path, kind):
+    """
+    Tests `sorted` and `range` of each index over 12-, 14- and 17-digit zUIDs, inserted out of order.
+    """
+    ids     : List[int] = [20250214115130, 202502141152, 20250214115100500, 202502141151, 20250214115100, 202502141150, 20250214115959];
+    ordered : List[int] = [202502141150, 202502141151, 20250214115100, 20250214115100500, 20250214115130, 202502141152, 20250214115959];
+    if kind == "file":
+        index = ZettelkastenFileIndex(str(tmp_path / "zuids.idx"), tail_limit=4);
+    elif kind == "sqlite":
+        index = ZettelkastenSQLiteIndex(str(tmp_path / "zuids.db"));
+    else:
+        index = ZettelkastenIndex(compact=kind == "compact");
+    index.add_many([zUID(id) for id in ids]);
+    assert sorted(ids, key=sort_key) == ordered and [int(id) for id in index.sorted()] == ordered;
+    assert [int(id) for id in index.range(202502141151, 20250214115200)] == ordered[1:5];
+    assert [int(id) for id in index.range(20250214115100500, 202502141159)] == ordered[3:6];
+    assert [int(id) for id in index.range(202502141152, 202502141152)] == [];
+    if kind == "file":
+        assert [int(id) for id in index] == ordered;
+    if kind in ("file", "sqlite"):
+        index.close();
+
+#   Tests the `ZettelkastenSQLiteIndex` class against the in-memory index, and allocation from several processes
+def test_sqlite_index(tmp_path):
+    """
+    Tests that `ZettelkastenSQLiteIndex` behaves like the in-memory index and allocates without collisions across processes.
+    """
+    path    : str = str(tmp_path / "zuids.db");
+    ids     : List[int | str | datetime] = [202502141151, "20250214", 202502141151, 202502141199, "bad", datetime(2025, 2, 14, 11, 52), 202502141153];
+    memory  : ZettelkastenGenerator = ZettelkastenGenerator();
+    shared  : ZettelkastenGenerator = ZettelkastenGenerator(database_path=path);
+    assert list(shared.create_many(ids).created) == list(memory.create_many(ids).created) == [202502141151, 202502140000, 202502141152, 202502141153];
+    assert shared.create(202502141153) is memory.create(202502141153) is None and shared.current == memory.current == 202502141153;
+    assert shared.allocate(202502141151) == memory.allocate(202502141151) == 202502141154;
+    assert list(shared.history) == list(memory.history) and list(shared.identifiers.sorted()) == list(memory.identifiers.sorted());
+    assert list(shared.identifiers.range(202502141152, 202502141154)) == [202502141152, 202502141153];
+    assert len(shared.identifiers) == 5 and 202502140000 in shared.identifiers and 202502140001 not in shared.identifiers;
+    
+    with ProcessPoolExecutor(2) as executor:
+        results : List[List[int]] = list(executor.map(allocate_from_database, [path] * 4, [25] * 4));
+    allocated : List[int] = [id for result in results for id in result];
+    assert len(set(allocated)) == 100 and min(allocated) == 202502142330;
+    assert list(ZettelkastenSQLiteIndex(path).range(202502142330, 202502150110)) == list(zuid_range(202502142330, 202502150110));
+
+#   Tests the `ZettelkastenOccupancy` class against `get_next` walks
+def test_occupancy():
+    """
+    Tests the free slots, runs, counts and first free zUIDs of `ZettelkastenOccupancy` against `get_next` walks.
+    """
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator();
+    zgen.create_many(list(zuid_range(202502142300, 202502150010)) + [202502150012, 202502141151, 202501310000, 202412312359]);
+    occupancy : ZettelkastenOccupancy = zgen.occupancy();
+    
+    for at in (202502142330, 202502141150, 202502141151, 202502150011, 202502150012):
+        naive : zUID = zUID(at);
+        while naive in zgen.identifiers:
+            naive = sequencer.get_next(naive);
+        assert occupancy.first_free(at) == naive;
+    assert 202502141151 in occupancy and occupancy.is_free("20250214") and len(occupancy) == len(zgen.identifiers) == 74;
+    assert occupancy.count("20250214") == 61 and len(occupancy.free_slots("20250214")) == 1440 - 61;
+    assert [(run[0], run[-1]) for run in occupancy.free_runs("20250215")] == [(202502150010, 202502150011), (202502150013, 202502152359)];
+    assert [(run[0], run[-1]) for run in occupancy.free_runs("20250214")] == [(202502140000, 202502141150), (202502141152, 202502142259)];
+    assert ZettelkastenOccupancy(zuid_range(217012310000, 217101010000)).first_free(217012310000) is None;
+    for id in (202502310000, 202502290000, 202502141160, 202513011200):
+        with pytest.raises(zUIDException):
+            occupancy.add(id);
+        with pytest.raises(zUIDException):
+            occupancy.is_free(id);
+        assert id not in occupancy;
+    assert len(occupancy) == 74 and occupancy.count("20250303") == 0;
+    
+    #   zUIDs of a finer format take their minute
+    seconds : ZettelkastenGenerator = ZettelkastenGenerator(format=SECOND);
+    seconds.create_many([20250214115130, 20250214115145, 20250214235959, "20250215000000"]);
+    assert len(seconds.occupancy()) == 3 and seconds.occupancy().count("20250214") == 2 and 20250214115101 in seconds.occupancy();
+    assert seconds.occupancy().first_free(20250214115159) == 202502141152 and seconds.occupancy().is_free(20250215000100);
+    with pytest.raises(zUIDException):
+        seconds.occupancy().add(20250214115160);
+    
+    pytest.importorskip("numpy");
+    days, counts = occupancy.day_counts("20250213", "20250216");
+    assert [str(day) for day in days] == ["2025-02-13", "2025-02-14", "2025-02-15"] and counts.tolist() == [0, 61, 11];
+    months, counts = occupancy.month_counts("202412", "202503");
+    assert [str(month) for month in months] == ["2024-12", "2025-01", "2025-02"] and counts.tolist() == [1, 1, 72];
+
+#   Tests the `ZettelkastenServer` class through several `ZettelkastenClient`s, with single and pipelined requests
+def test_server(tmp_path):
+    """
+    Tests the requests of the line protocol of `ZettelkastenServer` from two clients, one by one and pipelined with `batch`.
+    """
+    async def scenario() -> None:
+        server : ZettelkastenServer = ZettelkastenServer(path=str(tmp_path / "zettelkasten.sock"));
+        await server.start();
+        async with ZettelkastenClient(server.path) as first, ZettelkastenClient(server.path) as second:
+            assert await first.create(202502141151) == 202502141151 and await second.create(202502141151) is None;
+            assert await first.validate(202502141151) and not await second.validate(202502141199);
+            assert await first.decompose(202502141151) == (2025, 2, 14, 11, 51);
+            assert await first.next(202502142359) == 202502150000 and await second.previous(202503010000) == 202502282359;
+            
+            #   Concurrent allocations from both connections never collide, whether pipelined or not
+            allocated = await asyncio.gather(first.batch([("allocate", 202502141151)] * 500), *(second.allocate(202502141151) for _ in range(20)));
+            ids : List[int] = [int(id) for id in allocated[0]] + [zuid.id for zuid in allocated[1:]];
+            assert len(set(ids)) == 520 and 202502141151 not in ids;
+            assert (await first.now()).id not in ids;
+            with pytest.raises(zUIDException):
+                await second.request("unknown");
+            assert await second.validate(202502141151);
+            
+            #   Line breaks in arguments are rejected, and the connection stays in step
+            with pytest.raises(ValueError):
+                await first.batch([("validate", 202502141151), ("validate", "202502141151\nnow")]);
+            assert await first.validate(202502141151) and await first.next(202502141151) == 202502141152;
+            assert server.handle("validate 202502141151\nnow\n").startswith("err ");
+            
+            #   A failed request of a batch does not hide the results of the others
+            results = await second.batch([("validate", 202502141151), ("unknown", None), ("next", 202502141151)]);
+            assert results[0] == "1" and isinstance(results[1], zUIDException) and results[2] == "202502141152";
+            
+            #   Undecodable lines are answered with an error; an over-long line is answered and closes the connection
+            reader, writer = await asyncio.open_unix_connection(server.path);
+            writer.write(b"validate \xff\nvalidate 202502141151\n");
+            assert (await reader.readline()).startswith(b"err ") and await reader.readline() == b"ok 1\n";
+            writer.write(b"validate " + b"1" * 100_000 + b"\n");
+            assert (await reader.readline()).startswith(b"err ") and await reader.readline() == b"";
+            writer.close();
+            
+            #   The socket of a running server is not replaced
+            with pytest.raises(FileExistsError):
+                await ZettelkastenServer(path=server.path).start();
+        await server.close();
+        assert not os.path.exists(server.path);
+        
+        #   A stale socket is replaced, any other file is kept
+        stale : socket.socket = socket.socket(socket.AF_UNIX);
+        stale.bind(server.path);
+        stale.close();
+        await server.start();
+        await server.close();
+        with open(server.path, "w") as file:
+            file.write("not a socket");
+        with pytest.raises(FileExistsError):
+            await server.start();
+        assert os.path.isfile(server.path);
+    asyncio.run(scenario());
+
+#   Tests the benchmark suite on a tiny scale, and the regression flags of its comparison
+def test_benchmark_suite():
+    """
+    Tests a tiny run of the benchmark suite, and the regressions flagged by `compare`.
+    """
+    results = suite.run([20], repeat=1, pattern="decompose");
+    assert sorted(results["results"]) == ["decompose.int[20]", "decompose.str[20]", "decompose.zuid[20]"];
+    assert all(validator.validate(id, True) for id in suite.well_formed(100));
+    
+    baseline = {"results": {"a[10]": {"ns_per_op": 100.0}, "b[10]": {"ns_per_op": 100.0}, "c[10]": {"ns_per_op": 100.0}}};
+    current  = {"results": {"a[10]": {"ns_per_op": 109.0}, "b[10]": {"ns_per_op": 120.0}, "d[10]": {"ns_per_op": 1.0}}};
+    assert [(name, regression) for name, *_, regression in suite.compare(baseline, current)] == [("a[10]", False), ("b[10]", True)];
+
+#   Tests the `ZettelkastenInstrumentation` counters, and that disabling it restores the original methods
+def test_instrumentation():
+    """
+    Tests the counters and failure categories of `ZettelkastenInstrumentation`, and that disabling it restores the methods.
+    """
+    originals = (builder.build, decomposer.decompose_int, sequencer.get_next);
+    instrumentation.reset();
+    with instrumented():
+        assert builder.build("20250214") == 202502140000 and not validator.validate(202502300000, True);
+        assert not validator.validate(202513011260) and sequencer.get_next(202502142359) == 202502150000;
+        with pytest.raises(zUIDException):
+            builder.build(202502141199);
+        with instrumentation.timer("block"):
+            pass;
+    assert not instrumentation.is_enabled() and (builder.build, decomposer.decompose_int, sequencer.get_next) == originals;
+    
+    stats = instrumentation.snapshot();
+    assert stats["builder.build"][:2] == (2, 1) and stats["builder.build"].categories == {"minute": 1};
+    assert stats["builder.pad_string"].calls == 1 and stats["sequencer.get_next"].calls == 1 and stats["block"].calls == 1;
+    assert stats["validator.validate"].categories == {"day": 1, "month": 1, "minute": 1};
+    assert "validator.find_error_code" not in stats and stats["builder.build"].total_ns > 0;
+    
+    builder.build(202502141151);
+    assert instrumentation.snapshot() == stats;
+    instrumentation.reset();
+    assert instrumentation.snapshot() == {};
+
+#   Tests the 14-digit (second) and 17-digit (millisecond) formats across the engine, the sequencer and the generator
+@pytest.mark.parametrize("format", [MINUTE, SECOND, MILLISECOND])
+def test_formats(format: ZettelkastenFormat):
+    """
+    Tests building, validating, decomposing and sequencing zUIDs of the given format, and a generator in that format.
+    """
+    moment  : datetime = datetime(2025, 2, 14, 23, 59, 59, 999999);
+    zuid    : zUID = builder.build(moment, format=format);
+    assert ZettelkastenFormat.of(zuid.id) is format and len(str(zuid)) == format.digits;
+    assert builder.build(str(zuid)) == builder.build(zuid.id) == zuid and validator.validate(zuid, True) and validator.validate(str(zuid));
+    assert decomposer.decompose_format(zuid) == (2025, 2, 14, 23, 59) + ((), (59,), (59, 999))[(MINUTE, SECOND, MILLISECOND).index(format)];
+    assert decomposer.decompose_format(moment, format) == decomposer.decompose_format(zuid, format);
+    assert sequencer.get_previous(sequencer.get_next(zuid)) == zuid and sequencer.advance(zuid, format.units) == format.join(202502150000, format.split(zuid.id)[1]);
+    assert sequencer.get_next(zuid) == format.join(202502150000, 0);
+    
+    if format is not MINUTE:
+        #   A second of 60 is reported like the other components
+        invalid : int = format.join(202502300000, 60 * format.units // 60);
+        assert not validator.validate(invalid) and validator.find_error_code(invalid, True) == ERROR_SECOND | 4;
+        assert validator.find_error(invalid)[-1] == "Second 60 is not between 0 and 59.";
+        with pytest.raises(zUIDException):
+            builder.build(invalid);
+        assert not validator.validate_format(zuid, MINUTE) and validator.validate_format(zuid, format);
+        
+        zgen : ZettelkastenGenerator = ZettelkastenGenerator(format=format, allocating=True);
+        allocated = [zgen.allocate(moment) for _ in range(3)];
+        assert allocated == [zuid, sequencer.get_next(zuid), sequencer.get_next(sequencer.get_next(zuid))];
+    assert sorted([format.join(202502141151, 0), 202502141150, 202502141152, 20250214115130], key=sort_key)[::3] == [202502141150, 202502141152];
+
+#   Tests the clock modes, its minute cache and its monotonic guard with an injected time source
+def test_clock():
+    """
+    Tests `ZettelkastenClock.now` in every format, its minute cache and its monotonic guard against a clock going back.
+    """
+    t : List[float] = [gregorian.timegm((2025, 2, 14, 11, 51, 30)) + 0.25];
+    source = lambda: t[0];
+    
+    assert ZettelkastenClock(UTC, source=source).now() == 202502141151;
+    assert ZettelkastenClock(timezone(timedelta(hours=-3)), source=source).now() == 202502140851;
+    assert ZettelkastenClock(UTC, SECOND, source=source).now() == 20250214115130;
+    assert ZettelkastenClock(UTC, MILLISECOND, source=source).now() == 20250214115130250;
+    assert ZettelkastenClock(None, source=source).now() == builder.build(datetime.fromtimestamp(t[0]));
+    
+    #   Minute boundaries, and a backward step (NTP) that the guard hides
+    clock : ZettelkastenClock = ZettelkastenClock(UTC, SECOND, source=source);
+    reads : List[int] = [];
+    for step in (0, 29, 0.5, 1, -120, 121):
+        t[0] += step;
+        reads.append(clock.now());
+    assert reads == [20250214115130, 20250214115159, 20250214115159, 20250214115200, 20250214115200, 20250214115201];
+    assert ZettelkastenClock(UTC, SECOND, monotonic=False, source=lambda: t[0] - 3600).now() == 20250214105201;
+    
+    #   DST fall-back: Lisbon goes from 02:00 WEST back to 01:00 WET at 01:00 UTC
+    try:
+        from zoneinfo import ZoneInfo;
+        lisbon : ZettelkastenClock = ZettelkastenClock(ZoneInfo("Europe/Lisbon"), source=source);
+    except Exception:
+        lisbon = None;
+    if lisbon is not None:
+        fall_back : float = gregorian.timegm((2025, 10, 26, 1, 0, 0));
+        reads = [];
+        for offset in (-1800, -60, 0, 600, 3600):
+            t[0] = fall_back + offset;
+            reads.append(lisbon.now());
+        assert reads == [202510260130, 202510260159, 202510260159, 202510260159, 202510260200];
+    
+    #   The generator reads its clock: `now` fails in a taken minute, and allocates past it in allocating mode
+    t[0] = gregorian.timegm((2025, 2, 14, 11, 51, 0));
+    zgen : ZettelkastenGenerator = ZettelkastenGenerator(clock=ZettelkastenClock(UTC, source=source));
+    assert zgen.now() == 202502141151 and zgen.now() is None;
+    zgen = ZettelkastenGenerator(allocating=True, clock=ZettelkastenClock(UTC, source=source));
+    assert [zgen.now() for _ in range(3)] == [202502141151, 202502141152, 202502141153];
+
+#   Tests the chunked `create_many` against a `create` loop, and its report of duplicates and invalid inputs
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_create_many(capsys, chunk_size: int):
+    """
+    Tests that `create_many` creates the same zUIDs as a `create` loop and reports duplicates and invalid inputs by position.
+    """
+    ids : List[int | str | datetime] = ([202502141151, "20250214", 202502141151, 202513141151, "bad", datetime(2025, 2, 14, 11, 52), 202502300000]
+                                        + [zuid.id for zuid in zuid_range(202502150000, 202502150200)] + [202502150030, 20250214115130]);
+    zgen    : ZettelkastenGenerator = ZettelkastenGenerator(strict=True);
+    looped  : ZettelkastenGenerator = ZettelkastenGenerator(strict=True);
+    assert zgen.create(202502141151) == looped.create(202502141151);
+    
+    result : CreateResult = zgen.create_many(iter(ids), chunk_size);
+    assert list(result.created) == [zuid for zuid in map(looped.create, ids) if zuid is not None];
+    assert list(result.duplicates) == [0, 2, 127] and result.invalid == {3: ERROR_MONTH, 4: ERROR_MALFORMED, 6: ERROR_DAY};
+    assert result.count == len(ids) and result.messages(3) == ["Month 13 is not between 1 and 12."] and result.messages(6) == ["Day 30 is not between 1 and 28."];
+    assert list(zgen.history) == list(looped.history) and zgen.current == 20250214115130;
+    assert list(ZettelkastenGenerator(format=SECOND).create_many(["202502141151", 202502141151]).created) == [20250214115100, 202502141151];
+    
+    #   Padded strings and datetime objects are reported like `build` reports them
+    padded : CreateResult = ZettelkastenGenerator().create_many(["20251314", datetime(2171, 1, 1), "2025x"], chunk_size);
+    assert padded.invalid == {0: ERROR_MONTH, 1: ERROR_YEAR, 2: ERROR_MALFORMED} and padded.rejected[0] == 202513140000;
+    for position, id in enumerate(["20251314", datetime(2171, 1, 1)]):
+        with pytest.raises(zUIDException) as error:
+            builder.build(id);
+        assert padded.messages(position) == str(error.value).split("\n");
+    assert capsys.readouterr().out == "";
+
+#   Tests the round trips of the codec (random sequences of every format, streamed in random splits) and its errors
+@pytest.mark.parametrize("seed", range(5))
+def test_codec(seed: int):
+    """
+    Tests that `encode` / `decode` (bulk and streamed, vectorized or not) and the fixed-width codec round-trip zUID sequences.
+    """
+    try:
+        import numpy;
+    except ImportError:
+        numpy = None;
+    rng     : random.Random = random.Random(seed);
+    format  : ZettelkastenFormat = (MINUTE, SECOND, MILLISECOND)[seed % 3];
+    minutes : List[int] = [calendar.compose(*calendar.from_minutes(rng.randint(0, calendar.to_minutes(2170, 12, 31, 23, 59)))) for _ in range(rng.randint(0, 300))];
+    ids     : List[int] = [format.join(minute, rng.randrange(format.units)) for minute in minutes];
+    ids     += ids[:5];
+    history : List[int] = [format.join(zuid.id, 0) for zuid in zuid_range(202502142300, 202502150100)];
+    
+    for sequence in (ids, sorted(ids), history, [zUID(id) for id in history[:10]]):
+        expected : List[int] = [int(id) for id in sequence];
+        for vectorized in (True, False):
+            data : bytes = codec.encode(sequence, format, vectorized);
+            assert list(codec.decode(data, vectorized)) == expected and data == codec.encode(expected, format, not vectorized);
+            stream : bytes = b"".join(codec.encoder(sequence, format, rng.randint(1, 50), vectorized));
+            cuts : List[int] = sorted(rng.sample(range(len(stream) + 1), min(len(stream) + 1, 8)));
+            assert stream == data and list(codec.decoder((stream[a:b] for a, b in zip([0] + cuts, cuts + [len(stream)])), vectorized)) == expected;
+        if numpy is not None:
+            fixed : bytes = codec.encode_fixed(sequence, format);
+            assert codec.decode_fixed(fixed).tolist() == expected and b"".join(codec.encoder_fixed(sequence, format, 7)) == fixed;
+            assert list(load(io.BytesIO(fixed))) == expected;
+        assert list(load(io.BytesIO(data), chunk_size=3)) == expected;
+    
+    #   Consecutive zUIDs take one byte each
+    assert len(codec.encode(history, format)) < 4 + 5 + len(history) * (1 if format is MINUTE else 3);
+    for vectorized in (True, False):
+        with pytest.raises(zUIDException):
+            codec.encode([202502141151, 202502300000], MINUTE, vectorized);
+        with pytest.raises(ValueError):
+            codec.decode(codec.encode([202502141151], MINUTE)[:-1] + b"\x80", vectorized);
+        with pytest.raises(ValueError):
+            codec.decode(b"zUf\x0c", vectorized);
+
+#   Tests the minute ordinals against `datetime` across month, year and leap-day boundaries, and the sequencer built on them
+@pytest.mark.parametrize("start", [197001010000, 202402282350, 202412312330, 210002282350, 217012312300])
+def test_ordinal(start: int):
+    """
+    Tests that `to_ordinal` and `from_ordinal` agree with `datetime`, reject non-moments, and back `get_next` / `get_previous`.
+    """
+    epoch   : datetime = datetime(1970, 1, 1);
+    moment  : datetime = datetime.strptime(str(start), "%Y%m%d%H%M");
+    for _ in range(120):
+        id      : int = int(moment.strftime("%Y%m%d%H%M"));
+        ordinal : int = (moment - epoch) // timedelta(minutes=1);
+        assert calendar.to_ordinal(id) == ordinal and calendar.from_ordinal(ordinal) == id;
+        if id == 217012312359:
+            break;
+        moment += timedelta(minutes=1);
+        assert sequencer.get_next(id) == int(moment.strftime("%Y%m%d%H%M")) and sequencer.get_previous(sequencer.get_next(str(id))) == id;
+    assert zettelkasten_util.to_ordinal(197001010000) == 0 and zettelkasten_util.from_ordinal(calendar.to_ordinal(217012312359)) == 217012312359;
+    for id in (202502290000, 202502141160, 202502142400, 202513011200, 196912312359, 217101010000, 2025021411511, -5):
+        with pytest.raises(ValueError):
+            calendar.to_ordinal(id);
+    for ordinal in (-1, calendar.to_ordinal(217012312359) + 1):
+        with pytest.raises(ValueError):
+            calendar.from_ordinal(ordinal);
+    with pytest.raises(zUIDException):
+        sequencer.get_next(217012312359);
+
+#   Tests the lazy public API of the package, and that importing `validate` loads neither the generator nor the services
+def test_package_lazy_imports():
+    """
+    Tests the public names of the package, and that `from zettelkasten_util import validate` loads no service.
+    """
+    assert zettelkasten_util.zUID is zUID and zettelkasten_util.validator is validator and zettelkasten_util.sequencer is sequencer;
+    assert zettelkasten_util.validate(202502141151) and zettelkasten_util.generator is ZettelkastenGenerator;
+    assert set(zettelkasten_util.__all__) <= set(dir(zettelkasten_util));
+    with pytest.raises(AttributeError):
+        zettelkasten_util.unknown;
+    
+    _, count, modules = startup_benchmark.startup(startup_benchmark.STATEMENTS["validate"], 1);
+    assert "zettelkasten_util.engine.ZettelkastenValidator" in modules and count == len(modules);
+    assert not [module for module in modules if module.startswith(("zettelkasten_util.services", "zettelkasten_util.ZettelkastenGenerator", "sqlite3", "mmap"))];
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__]);